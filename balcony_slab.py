@@ -8,8 +8,10 @@ Bu modül balkon döşemelerinin moment hesabı ve donatı tasarımını içerir
 from typing import Dict, Tuple, List, Optional
 from struct_design import (
     oneway_smax_main, oneway_smax_dist,
-    select_rebar_min_area, RebarChoice
+    select_rebar_min_area
 )
+from slab_results import BalconyMoments, SlabDesign, RebarSet
+from slab_kinds import register_slab_kind, get_slab_kind
 
 
 def balcony_fixed_edge_guess(system, sid: str) -> Tuple[str, List[str]]:
@@ -28,35 +30,21 @@ def balcony_fixed_edge_guess(system, sid: str) -> Tuple[str, List[str]]:
     return fixed, steps
 
 
-def neighbor_support_moment_for_edge(system, neighbor_id: str, edge: str, bw: float) -> float:
+def neighbor_support_moment_for_edge(system, neighbor_id: str, edge: str, bw: float,
+                                     plate_solver: bool = False) -> float:
     """
     Komşu döşemenin belirli bir kenardaki mesnet momentini hesaplar.
+    plate_solver: TWOWAY komşu için sonlu farklar plak çözümü kullanılır
     """
     if neighbor_id not in system.slabs:
         return 0.0
-    k = system.slabs[neighbor_id].kind
-    
-    # Döngüsel import'u önlemek için yerel import
-    if k == "TWOWAY":
-        from twoway_slab import compute_twoway_per_slab
-        r, _ = compute_twoway_per_slab(system, neighbor_id, bw)
-        mxn, _ = r["Mx"]
-        myn, _ = r["My"]
-        if edge in ("L", "R"):
-            return abs(mxn) if mxn else 0.0
-        else:
-            return abs(myn) if myn else 0.0
-    if k == "ONEWAY":
-        from oneway_slab import compute_oneway_per_slab
-        r, _ = compute_oneway_per_slab(system, neighbor_id, bw)
-        return abs(r["Mneg_min"]) if r.get("Mneg_min") is not None else 0.0
-    if k == "BALCONY":
-        r, _ = compute_balcony_per_slab(system, neighbor_id, bw)
-        return abs(r["Mneg"]) if r.get("Mneg") is not None else 0.0
-    return 0.0
-
-
-def compute_balcony_per_slab(system, sid: str, bw: float) -> Tuple[dict, List[str]]:
+    spec = get_slab_kind(system.slabs[neighbor_id].kind)
+    if spec is None or spec.support_moment is None:
+        return 0.0
+    return spec.support_moment(system, neighbor_id, edge, bw, plate_solver=plate_solver)
+
+
+def compute_balcony_per_slab(system, sid: str, bw: float) -> Tuple[BalconyMoments, List[str]]:
     """
     Balkon döşemesi için moment hesabı yapar.
     
@@ -66,7 +54,7 @@ def compute_balcony_per_slab(system, sid: str, bw: float) -> Tuple[dict, List[st
         bw: Kiriş genişliği (m)
     
     Returns:
-        (sonuç_dict, hesap_adımları_listesi)
+        (BalconyMoments, hesap_adımları_listesi)
     """
     steps = []
     s = system.slabs[sid]
@@ -80,10 +68,11 @@ def compute_balcony_per_slab(system, sid: str, bw: float) -> Tuple[dict, List[st
     steps.append(f"Lg={Lg:.3f}, Lnet={Lnet:.3f}")
     Mneg = 0.5 * w * Lnet**2
     steps.append(f"M- = {Mneg:.3f}")
-    return {"dir": direction, "w": w, "L_net": Lnet, "Mneg": Mneg}, steps
+    return BalconyMoments(direction=direction, w=w, L_net=Lnet, Mneg=Mneg), steps
 
 
-def get_balcony_design_moment(system, sid: str, Mbal: float, bw: float) -> Tuple[float, List[str]]:
+def get_balcony_design_moment(system, sid: str, Mbal: float, bw: float,
+                              plate_solver: bool = False) -> Tuple[float, List[str]]:
     """
     Balkon döşemesi için tasarım momentini hesaplar.
     Komşu döşemelerin mesnet momentleri de dikkate alınır.
@@ -124,7 +113,7 @@ def get_balcony_design_moment(system, sid: str, Mbal: float, bw: float) -> Tuple
 
     m_nb = 0.0
     for nb in neigh:
-        mn = neighbor_support_moment_for_edge(system, nb, fixed_edge, bw)
+        mn = neighbor_support_moment_for_edge(system, nb, fixed_edge, bw, plate_solver)
         steps.append(f"Neighbor {nb} M={mn:.3f}")
         m_nb = max(m_nb, mn)
     
@@ -133,8 +122,9 @@ def get_balcony_design_moment(system, sid: str, Mbal: float, bw: float) -> Tuple
     return Mdesign, steps
 
 
-def compute_balcony_report(system, sid: str, res: dict, conc: str, steel: str,
-                           h: float, cover: float, bw: float) -> Tuple[dict, List[str]]:
+def compute_balcony_report(system, sid: str, res: BalconyMoments, conc: str, steel: str,
+                           h: float, cover: float, bw: float,
+                           plate_solver: bool = False) -> Tuple[SlabDesign, List[str]]:
     """
     Balkon döşemesi için donatı hesabı ve raporlama yapar.
     
@@ -147,13 +137,14 @@ def compute_balcony_report(system, sid: str, res: dict, conc: str, steel: str,
         h: Döşeme kalınlığı (mm)
         cover: Pas payı (mm)
         bw: Kiriş genişliği (m)
+        plate_solver: Komşu TWOWAY mesnet momentleri sonlu farklar plak çözümünden
     
     Returns:
-        (tasarım_sonucu_dict, rapor_satırları_listesi)
+        (SlabDesign, rapor_satırları_listesi)
     """
     lines = []
     
-    Mdes, std = get_balcony_design_moment(system, sid, res["Mneg"], bw)
+    Mdes, std = get_balcony_design_moment(system, sid, res.Mneg, bw, plate_solver)
     lines.extend(std)
     
     lines.append(f"--- Ana Donatı Hesabı ---")
@@ -177,12 +168,36 @@ def compute_balcony_report(system, sid: str, res: dict, conc: str, steel: str,
     
     fixed, _ = balcony_fixed_edge_guess(system, sid)
     
-    design_res = {
-        "kind": "BALCONY", "cover_mm": cover, "fixed_edge": fixed,
-        "choices": {"main": ch_main, "dist": ch_dist}
-    }
+    design_res = SlabDesign(
+        kind="BALCONY", cover_mm=cover, fixed_edge=fixed,
+        choices=RebarSet(main=ch_main, dist=ch_dist)
+    )
     lines.append(f"SONUÇ: Ana: {ch_main.label()}, Dağıtma: {ch_dist.label() if ch_dist else '-'}")
     lines.append("")
     
     return design_res, lines
 
+
+
+# =========================================================
+# Döşeme tipi kaydı (slab_kinds)
+# =========================================================
+def _balcony_solve(system, sid: str, params) -> Tuple[BalconyMoments, List[str]]:
+    return compute_balcony_per_slab(system, sid, params.bw)
+
+
+def _balcony_report(system, sid: str, res: BalconyMoments, balanced, pilye_areas: Dict[str, float],
+                    params) -> Tuple[SlabDesign, List[str]]:
+    return compute_balcony_report(system, sid, res, params.conc, params.steel,
+                                  params.h, params.cover, params.bw, params.plate_solver)
+
+
+def _balcony_support_moment(system, sid: str, edge: str, bw: float, plate_solver: bool = False) -> float:
+    r, _ = compute_balcony_per_slab(system, sid, bw)
+    return abs(r.Mneg) if r.Mneg is not None else 0.0
+
+
+register_slab_kind(
+    "BALCONY", solve=_balcony_solve, report=_balcony_report,
+    support_moment=_balcony_support_moment,
+)
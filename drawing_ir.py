@@ -0,0 +1,284 @@
+"""
+Çizim Ara Temsili (Geometry IR)
+===============================
+Döşeme çizimleri bir kez bu ara temsile kaydedilir, sonra istenen hedefe
+(DXF yazıcıları, SVG, Tk canvas) ucuzca yeniden oynatılır.
+
+- SlabGeometry, DXF yazıcılarıyla aynı arayüzü (add_layer, add_line,
+  add_polyline, add_polylines, add_text) sunar; çizim fonksiyonları
+  değişmeden ona yazar. Yeniden oynatmada her katmanın poliçizgileri tek
+  add_polylines çağrısıyla (düz tampon + bitiş indeksleri) aktarılır.
+- Her katman tipli diziler tutar: poliçizgiler düz koordinat tamponu
+  (x0, y0, x1, y1, ...) ve bitiş indeksleri, çizgiler 4'lü koordinat
+  tamponu, yazılar kayıt olarak.
+- Koordinatlar GUI yönündedir (mm, Y aşağı); Y ters çevirme DXF
+  yazıcısında yapılır, SVG ve Tk aynı yönü kullandığı için dönüşümsüzdür.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+# AutoCAD renk indeksi -> RGB (beyaz zemin için 7 siyah çizilir)
+ACI_RGB = {
+    1: "#FF0000", 2: "#FFFF00", 3: "#00FF00", 4: "#00FFFF",
+    5: "#0000FF", 6: "#FF00FF", 7: "#000000", 30: "#FF7F00",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TextRecord:
+    """Tek yazı (DXF TEXT karşılığı)."""
+    x: float
+    y: float
+    text: str
+    height: float
+    rotation: float = 0.0
+    center: bool = False
+    align: object = None  # DXF yazıcısına iletilen hizalama (align_code)
+
+
+@dataclass(slots=True)
+class LayerGeometry:
+    """Bir katmanın ilkelleri."""
+    coords: array = field(default_factory=lambda: array("d"))  # Poliçizgi noktaları (düz)
+    ends: array = field(default_factory=lambda: array("q"))    # Her poliçizginin bitiş nokta indeksi
+    closed: bytearray = field(default_factory=bytearray)
+    lines: array = field(default_factory=lambda: array("d"))   # (x1, y1, x2, y2) dörtlüleri
+    texts: List[TextRecord] = field(default_factory=list)
+
+    def polylines(self) -> Iterable[Tuple[array, bool]]:
+        """(düz koordinat dilimi, kapalı mı) çiftleri."""
+        start = 0
+        for end, closed in zip(self.ends, self.closed):
+            yield self.coords[2 * start:2 * end], bool(closed)
+            start = end
+
+
+class SlabGeometry:
+    """Bir döşemenin (veya kat kirişlerinin) kaydedilmiş çizimi."""
+
+    __slots__ = ("layers",)
+
+    def __init__(self):
+        self.layers: Dict[str, LayerGeometry] = {}
+
+    def _layer(self, name: str) -> LayerGeometry:
+        layer = self.layers.get(name)
+        if layer is None:
+            layer = self.layers[name] = LayerGeometry()
+        return layer
+
+    # --- Yazıcı arayüzü (çizim fonksiyonları buraya yazar) ---
+    def add_layer(self, name: str, color: int = 7, lineweight: int = -3):
+        self._layer(name)
+
+    def add_line(self, x1, y1, x2, y2, layer="0"):
+        self._layer(layer).lines.extend((x1, y1, x2, y2))
+
+    def add_polyline(self, pts, layer="0", closed=False):
+        lay = self._layer(layer)
+        for x, y in pts:
+            lay.coords.append(x)
+            lay.coords.append(y)
+        lay.ends.append(len(lay.coords) // 2)
+        lay.closed.append(1 if closed else 0)
+
+    def add_polylines(self, coords, ends, closed, layer="0", offset=(0.0, 0.0)):
+        """
+        Poliçizgi topluluğu ekler (düz koordinatlar, bitiş indeksleri, kapalı
+        bayrakları); array('d') tamponlar bayt olarak topluca eklenir.
+        """
+        lay = self._layer(layer)
+        base = len(lay.coords) // 2
+        if offset[0] or offset[1]:
+            dx, dy = offset
+            lay.coords.extend(v + (dy if i % 2 else dx) for i, v in enumerate(coords))
+        elif isinstance(coords, array) and coords.typecode == "d":
+            lay.coords.frombytes(memoryview(coords).cast("B"))
+        else:
+            lay.coords.extend(coords)
+        lay.ends.extend(base + end for end in ends)
+        lay.closed.extend(1 if c else 0 for c in closed)
+
+    def add_text(self, x, y, text, height=200.0, layer="TEXT", rotation=0.0, center=False, align_code=None):
+        self._layer(layer).texts.append(TextRecord(x, y, text, height, rotation, center, align_code))
+
+    # --- Hedefler ---
+    def replay(self, w):
+        """Kaydı DXF yazıcısına (veya aynı arayüzdeki herhangi bir hedefe) aktarır."""
+        for name, lay in self.layers.items():
+            if lay.ends:
+                w.add_polylines(lay.coords, lay.ends, lay.closed, layer=name)
+            c = lay.lines
+            for i in range(0, len(c), 4):
+                w.add_line(c[i], c[i + 1], c[i + 2], c[i + 3], layer=name)
+            for t in lay.texts:
+                w.add_text(t.x, t.y, t.text, height=t.height, layer=name, rotation=t.rotation,
+                           center=t.center, align_code=t.align)
+
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """(xmin, ymin, xmax, ymax); yazı konumları dahil, boşsa None."""
+        xs: List[float] = []
+        ys: List[float] = []
+        for lay in self.layers.values():
+            for buf in (lay.coords, lay.lines):
+                if buf:
+                    xs += (min(buf[0::2]), max(buf[0::2]))
+                    ys += (min(buf[1::2]), max(buf[1::2]))
+            for t in lay.texts:
+                xs.append(t.x)
+                ys.append(t.y)
+        if not xs:
+            return None
+        return min(xs), min(ys), max(xs), max(ys)
+
+
+def _canonical_shape(flat) -> Tuple[tuple, int, List[Tuple[float, float]]]:
+    """
+    Poliçizginin ötelemeden ve 90° dönmelerden bağımsız biçimi.
+
+    Noktalar ilk noktaya göre alınır ve dört dönüşten (x, y) -> (-y, x)
+    yuvarlanmış hali sözlük sırasında en küçük olan seçilir.
+
+    Returns:
+        (anahtar, k, kanonik noktalar): orijinal = ilk nokta + R(-k·90°)(kanonik)
+    """
+    x0, y0 = flat[0], flat[1]
+    rel = [(flat[i] - x0, flat[i + 1] - y0) for i in range(0, len(flat), 2)]
+    best = None
+    for k in range(4):
+        key = tuple((round(x, 3), round(y, 3)) for x, y in rel)
+        if best is None or key < best[0]:
+            best = (key, k, rel)
+        rel = [(-y, x) for x, y in rel]
+    return best
+
+
+def replay_blocks(geometries: Sequence[SlabGeometry], w, min_count: int = 2,
+                  prefix: str = "SHAPE"):
+    """
+    Kayıtları, tekrar eden poliçizgileri blok olarak tanımlayıp INSERT ile
+    yerleştirerek yazıcıya aktarır (çizgi ve yazılar replay ile aynı).
+
+    Ötelenmiş veya 90°'nin katları kadar döndürülmüş aynı şekiller tek blok
+    paylaşır. Blok içeriği katman 0'dadır; INSERT'in katmanını (rengini) alır.
+
+    Args:
+        w: add_block(name, pts, closed) ve add_insert(name, x, y, rotation, layer)
+           destekleyen yazıcı
+        min_count: Blok yapılacak en az tekrar sayısı
+    """
+    shapes = []  # (anahtar, k, kanonik noktalar), poliçizgi sırasıyla
+    counts: Dict[tuple, int] = {}
+    for g in geometries:
+        for lay in g.layers.values():
+            for flat, closed in lay.polylines():
+                key, k, canon = _canonical_shape(flat)
+                key = (closed, key)
+                shapes.append((key, k, canon))
+                counts[key] = counts.get(key, 0) + 1
+
+    names: Dict[tuple, str] = {}
+    shape_iter = iter(shapes)
+    for g in geometries:
+        for name, lay in g.layers.items():
+            for flat, closed in lay.polylines():
+                key, k, canon = next(shape_iter)
+                if counts[key] < min_count:
+                    w.add_polyline(list(zip(flat[0::2], flat[1::2])), layer=name, closed=closed)
+                    continue
+                block = names.get(key)
+                if block is None:
+                    block = names[key] = f"{prefix}_{len(names) + 1}"
+                    w.add_block(block, canon, closed)
+                # Y ekseni DXF'te ters döndüğü için GUI'deki -k·90° dönme DXF'te +k·90° olur
+                w.add_insert(block, flat[0], flat[1], rotation=90.0 * k, layer=name)
+            c = lay.lines
+            for i in range(0, len(c), 4):
+                w.add_line(c[i], c[i + 1], c[i + 2], c[i + 3], layer=name)
+            for t in lay.texts:
+                w.add_text(t.x, t.y, t.text, height=t.height, layer=name, rotation=t.rotation,
+                           center=t.center, align_code=t.align)
+
+
+def write_svg(geometries: Sequence[SlabGeometry], path: str,
+              layer_colors: Optional[Dict[str, int]] = None, margin: float = 500.0):
+    """
+    Kayıtlı çizimleri SVG dosyasına yazar (birim: mm, katman başına <g>).
+
+    Args:
+        geometries: Çizim kayıtları (sırayla)
+        path: Çıktı dosyası
+        layer_colors: Katman adı -> ACI renk (yoksa siyah)
+        margin: Çizim çevresindeki boşluk (mm)
+    """
+    layer_colors = layer_colors or {}
+    boxes = [b for b in (g.bounds() for g in geometries) if b is not None]
+    if boxes:
+        x0 = min(b[0] for b in boxes) - margin
+        y0 = min(b[1] for b in boxes) - margin
+        x1 = max(b[2] for b in boxes) + margin
+        y1 = max(b[3] for b in boxes) + margin
+    else:
+        x0, y0, x1, y1 = 0.0, 0.0, 1.0, 1.0
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{x0:g} {y0:g} {x1 - x0:g} {y1 - y0:g}" '
+                f'width="{(x1 - x0) / 10:g}" height="{(y1 - y0) / 10:g}" fill="none" stroke-width="10">\n')
+        for g in geometries:
+            for name, lay in g.layers.items():
+                color = ACI_RGB.get(layer_colors.get(name, 7), "#000000")
+                f.write(f'<g class="{escape(name)}" stroke="{color}">\n')
+                for flat, closed in lay.polylines():
+                    pts = " ".join(f"{flat[i]:g},{flat[i + 1]:g}" for i in range(0, len(flat), 2))
+                    tag = "polygon" if closed else "polyline"
+                    f.write(f'<{tag} points="{pts}"/>\n')
+                c = lay.lines
+                for i in range(0, len(c), 4):
+                    f.write(f'<line x1="{c[i]:g}" y1="{c[i + 1]:g}" x2="{c[i + 2]:g}" y2="{c[i + 3]:g}"/>\n')
+                for t in lay.texts:
+                    anchor = ' text-anchor="middle" dominant-baseline="central"' if t.center else ""
+                    rot = f' transform="rotate({-t.rotation:g} {t.x:g} {t.y:g})"' if t.rotation else ""
+                    f.write(f'<text x="{t.x:g}" y="{t.y:g}" font-size="{t.height:g}" fill="{color}" '
+                            f'stroke="none"{anchor}{rot}>{escape(t.text)}</text>\n')
+                f.write("</g>\n")
+        f.write("</svg>\n")
+
+
+def draw_tk(geom: SlabGeometry, canvas, to_px: Callable[[float, float], Tuple[float, float]],
+            px_per_mm: float, tags: tuple = (), layer_colors: Optional[Dict[str, int]] = None,
+            min_text_px: float = 6.0):
+    """
+    Kaydı Tk canvas'ına çizer.
+
+    Args:
+        to_px: mm -> piksel dönüşümü (Y yönü aynı)
+        px_per_mm: Yazı boyu ölçeği
+        tags: Oluşturulan öğelerin etiketleri
+        min_text_px: Bundan küçük görünecek yazılar atlanır
+    """
+    layer_colors = layer_colors or {}
+    for name, lay in geom.layers.items():
+        color = ACI_RGB.get(layer_colors.get(name, 7), "#000000")
+        for flat, closed in lay.polylines():
+            pts: List[float] = []
+            for i in range(0, len(flat), 2):
+                pts.extend(to_px(flat[i], flat[i + 1]))
+            if closed:
+                pts.extend(pts[:2])
+            if len(pts) >= 4:
+                canvas.create_line(*pts, fill=color, width=1, tags=tags)
+        c = lay.lines
+        for i in range(0, len(c), 4):
+            canvas.create_line(*to_px(c[i], c[i + 1]), *to_px(c[i + 2], c[i + 3]),
+                               fill=color, width=1, tags=tags)
+        for t in lay.texts:
+            size = t.height * px_per_mm
+            if size < min_text_px:
+                continue
+            px, py = to_px(t.x, t.y)
+            canvas.create_text(px, py, text=t.text, fill=color, angle=t.rotation,
+                               anchor="center" if t.center else "sw",
+                               font=("Arial", -max(int(size), 1)), tags=tags)
@@ -0,0 +1,323 @@
+"""
+DXF Çizim Parmak İzi ve Karşılaştırma
+=====================================
+export_to_dxf çıktıları için katman başına, sıradan bağımsız kanonik özet
+(parmak izi) ve iki çizimin katman / döşeme bazında farkı.
+
+- Her ilkel yuvarlanmış koordinatlarla kanonik bir metne çevrilir:
+  poliçizginin yönü ve kapalı poliçizginin başlangıç noktası normalize
+  edilir, INSERT'ler blok içeriğine açılır, yazılarda içerik, konum,
+  yükseklik, dönme ve hizalama yer alır.
+- Katman özeti, ilkel özetlerinin 2^128 modunda toplamıdır (çoklu küme
+  özeti); sıralama gerektirmez, doğrusal zamanda hesaplanır.
+- Kaynak, bellek yazıcısı (export_to_dxf(..., backend="memory")) veya
+  herhangi bir DXF dosyası (ASCII/ikili, ezdxf ya da akış yazıcısı) olabilir.
+- Döşemeler SLAB_EDGE dikdörtgenleri ve isim yazılarından bulunur; farklı
+  ilkeller sınır kutularıyla döşemelere atanır (kirişler ve döşeme dışı
+  ilkeller KAT grubunda toplanır).
+
+Komut satırı:
+    python dxf_diff.py eski.dxf yeni.dxf [--ndigits 3]
+"""
+
+import math
+import hashlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from spatial_index import SpatialIndex
+from dxf_out import SLAB_NAME_OFFSET
+
+FLOOR = "KAT"              # Hiçbir döşemeye düşmeyen ilkellerin grubu
+DEFAULT_NDIGITS = 3        # Koordinat yuvarlama (mm'nin binde biri)
+REGION_CELL_MM = 2000.0    # Döşeme bölgesi indeksinin hücre boyu (mm)
+_MASK = (1 << 128) - 1
+
+Box = Tuple[float, float, float, float]  # (xmin, ymin, xmax, ymax), mm
+
+
+@dataclass(frozen=True, slots=True)
+class Primitive:
+    """Kanonik biçime getirilmiş tek çizim ilkeli."""
+    key: str                    # Kanonik metin (özet ve karşılaştırma anahtarı)
+    box: Box                    # Sınır kutusu (döşemeye atama için)
+    text: Optional[str] = None  # Yazı ilkellerinde içerik
+
+
+Drawing = Dict[str, List[Primitive]]  # katman -> ilkeller
+
+
+def _num(v: float, ndigits: int) -> str:
+    return repr(round(float(v), ndigits) + 0.0)
+
+
+def _points_key(kind: str, pts: Sequence[Tuple[float, float]], closed: bool, ndigits: int) -> str:
+    """Yönden (ve kapalıysa başlangıç noktasından) bağımsız poliçizgi anahtarı."""
+    items = [f"{_num(x, ndigits)},{_num(y, ndigits)}" for x, y in pts]
+    if closed and len(items) > 1 and items[0] == items[-1]:
+        items.pop()  # Kapanış noktası tekrarlanmışsa at
+    if closed and items:
+        candidates = []
+        for seq in (items, items[::-1]):
+            i = seq.index(min(seq))
+            candidates.append(seq[i:] + seq[:i])
+        items = min(candidates)
+    else:
+        items = min(items, items[::-1])
+    return f"{kind}{'c' if closed else 'o'}|" + ";".join(items)
+
+
+def _box(pts: Iterable[Tuple[float, float]]) -> Box:
+    xs, ys = zip(*pts)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _polyline(pts, closed: bool, ndigits: int) -> Optional[Primitive]:
+    pts = [(float(x), float(y)) for x, y in pts]
+    if not pts:
+        return None
+    return Primitive(_points_key("P", pts, closed, ndigits), _box(pts))
+
+
+def _text(x, y, text: str, height, rotation, align: str, ndigits: int) -> Primitive:
+    x, y = float(x), float(y)
+    rot = float(rotation) % 360.0
+    key = (f"T|{_num(x, ndigits)},{_num(y, ndigits)}|{_num(height, ndigits)}|"
+           f"{_num(rot, ndigits)}|{align}|{text}")
+    return Primitive(key, (x, y, x, y), text)
+
+
+def _align_name(center: bool, align) -> str:
+    if align:
+        return getattr(align, "name", str(align)).upper()
+    return "MIDDLE_CENTER" if center else "LEFT"
+
+
+def _rotate(pts, rotation: float):
+    """Noktaları derece cinsinden döndürür; 90°'nin katlarında tam dönüşüm."""
+    k = rotation / 90.0
+    if abs(k - round(k)) < 1e-9:
+        for _ in range(int(round(k)) % 4):
+            pts = [(-y, x) for x, y in pts]
+        return pts
+    c, s = math.cos(math.radians(rotation)), math.sin(math.radians(rotation))
+    return [(c * x - s * y, s * x + c * y) for x, y in pts]
+
+
+def capture_primitives(w, ndigits: int = DEFAULT_NDIGITS) -> Drawing:
+    """
+    Yakalanmış çizimin (bellek yazıcısı veya SlabGeometry) kanonik ilkelleri.
+
+    Args:
+        w: layers (katman -> LayerGeometry) alanlı kayıt; bellek yazıcısının
+           blocks / inserts alanları varsa INSERT'ler açılır
+        ndigits: Koordinat yuvarlama basamağı
+
+    Returns:
+        Katman -> ilkeller
+    """
+    out: Drawing = {}
+    for name, lay in w.layers.items():
+        prims = out.setdefault(name, [])
+        for flat, closed in lay.polylines():
+            p = _polyline(zip(flat[0::2], flat[1::2]), closed, ndigits)
+            if p is not None:
+                prims.append(p)
+        c = lay.lines
+        for i in range(0, len(c), 4):
+            pts = [(c[i], c[i + 1]), (c[i + 2], c[i + 3])]
+            prims.append(Primitive(_points_key("L", pts, False, ndigits), _box(pts)))
+        for t in lay.texts:
+            prims.append(_text(t.x, t.y, t.text, t.height, t.rotation, _align_name(t.center, t.align), ndigits))
+    blocks = getattr(w, "blocks", {})
+    for layer, block, x, y, rotation in getattr(w, "inserts", ()):
+        pts, closed = blocks[block]
+        p = _polyline([(x + px, y + py) for px, py in _rotate(pts, rotation)], closed, ndigits)
+        if p is not None:
+            out.setdefault(layer, []).append(p)
+    return out
+
+
+def read_primitives(path: str, ndigits: int = DEFAULT_NDIGITS) -> Drawing:
+    """
+    DXF dosyasının (ASCII veya ikili) modelspace ilkelleri, kanonik biçimde.
+    INSERT'ler açılır; akış yazıcısının \\U+XXXX kaçışları çözülür.
+    """
+    import ezdxf
+    from ezdxf.lldxf.encoding import decode_dxf_unicode
+
+    out: Drawing = {}
+    for e in ezdxf.readfile(path).modelspace():
+        layer = e.dxf.layer
+        for v in (e.virtual_entities() if e.dxftype() == "INSERT" else [e]):
+            t = v.dxftype()
+            p = None
+            if t == "LWPOLYLINE":
+                p = _polyline(v.get_points("xy"), bool(v.closed), ndigits)
+            elif t == "POLYLINE":
+                p = _polyline([(q.dxf.location.x, q.dxf.location.y) for q in v.vertices],
+                              bool(v.is_closed), ndigits)
+            elif t == "LINE":
+                pts = [tuple(v.dxf.start.vec2), tuple(v.dxf.end.vec2)]
+                p = Primitive(_points_key("L", pts, False, ndigits), _box(pts))
+            elif t == "TEXT":
+                align, p1, p2 = v.get_placement()
+                pos = p2 if p2 is not None else p1
+                p = _text(pos.x, pos.y, decode_dxf_unicode(v.dxf.text), v.dxf.height, v.dxf.rotation,
+                          align.name, ndigits)
+            if p is not None:
+                out.setdefault(layer, []).append(p)
+    return out
+
+
+def _digest(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest(), "little")
+
+
+def layer_fingerprints(drawing: Drawing) -> Dict[str, str]:
+    """
+    Katman başına sıradan bağımsız özet (boş katmanlar atlanır).
+
+    Returns:
+        Katman -> "ilkel sayısı:128 bit özet" (onaltılık)
+    """
+    out = {}
+    for name in sorted(drawing):
+        prims = drawing[name]
+        if not prims:
+            continue
+        total = 0
+        for p in prims:
+            total = (total + _digest(p.key)) & _MASK
+        out[name] = f"{len(prims)}:{total:032x}"
+    return out
+
+
+def geometry_fingerprint(source, ndigits: int = DEFAULT_NDIGITS) -> Dict[str, str]:
+    """
+    export_to_dxf çıktısının katman parmak izleri.
+
+    Args:
+        source: DXF dosya yolu veya yakalanmış çizim (bellek yazıcısı)
+    """
+    if isinstance(source, str):
+        return layer_fingerprints(read_primitives(source, ndigits))
+    return layer_fingerprints(capture_primitives(source, ndigits))
+
+
+class SlabRegions:
+    """Çizimdeki döşeme dikdörtgenleri (SLAB_EDGE) ve isimleri."""
+
+    def __init__(self, drawing: Drawing, ndigits: int = DEFAULT_NDIGITS):
+        names = {}
+        for p in drawing.get("TEXT", ()):
+            names[(_num(p.box[0], ndigits), _num(p.box[1], ndigits))] = p.text
+        dx, dy = SLAB_NAME_OFFSET
+        self.index = SpatialIndex(REGION_CELL_MM)
+        for p in sorted(drawing.get("SLAB_EDGE", ()), key=lambda p: p.box):
+            x0, y0, x1, y1 = p.box
+            name = names.get((_num(x0 + dx, ndigits), _num(y0 + dy, ndigits)))
+            if name is None or name in self.index:
+                name = f"({x0:g},{y0:g})"
+            self.index.insert(name, (x0, y0, x1 - x0, y1 - y0))
+
+    def owner(self, layer: str, box: Box) -> str:
+        """İlkelin döşemesi: kutu merkezini içeren, yoksa kutuya değen ilk döşeme."""
+        if layer == "BEAM":
+            return FLOOR
+        x0, y0, x1, y1 = box
+        sid = self.index.item_at((x0 + x1) / 2.0, (y0 + y1) / 2.0)
+        if sid is None:
+            hits = self.index.query_rect(x0, y0, x1, y1)
+            sid = hits[0] if hits else FLOOR
+        return sid
+
+
+@dataclass(frozen=True, slots=True)
+class LayerDiff:
+    """Bir katmandaki fark: çıkan ve eklenen ilkellerin döşemelere dağılımı."""
+    layer: str
+    removed: Dict[str, int]  # döşeme -> yalnızca ilk çizimde olan ilkel sayısı
+    added: Dict[str, int]    # döşeme -> yalnızca ikinci çizimde olan ilkel sayısı
+
+
+def diff_drawings(old: Drawing, new: Drawing, ndigits: int = DEFAULT_NDIGITS) -> List[LayerDiff]:
+    """
+    İki çizimin katman / döşeme bazında farkı. Parmak izi aynı olan
+    katmanlar ilkel ilkel karşılaştırılmaz.
+
+    Returns:
+        Farklı katmanlar (ada göre sıralı)
+    """
+    fp_old, fp_new = layer_fingerprints(old), layer_fingerprints(new)
+    regions_old, regions_new = SlabRegions(old, ndigits), SlabRegions(new, ndigits)
+    diffs = []
+    for layer in sorted(set(fp_old) | set(fp_new)):
+        if fp_old.get(layer) == fp_new.get(layer):
+            continue
+        a = Counter(p.key for p in old.get(layer, ()))
+        b = Counter(p.key for p in new.get(layer, ()))
+        only_a, only_b = a - b, b - a
+        removed: Counter = Counter()
+        added: Counter = Counter()
+        for p in old.get(layer, ()):
+            if only_a[p.key] > 0:
+                only_a[p.key] -= 1
+                removed[regions_old.owner(layer, p.box)] += 1
+        for p in new.get(layer, ()):
+            if only_b[p.key] > 0:
+                only_b[p.key] -= 1
+                added[regions_new.owner(layer, p.box)] += 1
+        diffs.append(LayerDiff(layer, dict(sorted(removed.items())), dict(sorted(added.items()))))
+    return diffs
+
+
+def format_diff(diffs: Sequence[LayerDiff]) -> List[str]:
+    """Farkın katman ve döşeme bazında okunur özeti."""
+    if not diffs:
+        return ["Çizimler aynı."]
+    lines = []
+    by_slab: Dict[str, List[str]] = {}
+    for d in diffs:
+        lines.append(f"Katman {d.layer}: -{sum(d.removed.values())} +{sum(d.added.values())}")
+        for sid in sorted(set(d.removed) | set(d.added)):
+            lines.append(f"  {sid}: -{d.removed.get(sid, 0)} +{d.added.get(sid, 0)}")
+            by_slab.setdefault(sid, []).append(d.layer)
+    lines.append("")
+    lines.append("Döşeme bazında:")
+    for sid in sorted(by_slab):
+        lines.append(f"  {sid}: {', '.join(by_slab[sid])}")
+    return lines
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Komut satırı: iki DXF dosyasını karşılaştırır; aynıysa 0, farklıysa 1 döner."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="İki DXF çizimini katman ve döşeme bazında karşılaştırır.")
+    parser.add_argument("old", help="Referans DXF dosyası")
+    parser.add_argument("new", help="Karşılaştırılacak DXF dosyası")
+    parser.add_argument("--ndigits", type=int, default=DEFAULT_NDIGITS,
+                        help="Koordinat yuvarlama basamağı (varsayılan: %(default)s)")
+    parser.add_argument("--fingerprint", action="store_true",
+                        help="Yalnızca katman parmak izlerini yazdır")
+    args = parser.parse_args(argv)
+
+    old = read_primitives(args.old, args.ndigits)
+    new = read_primitives(args.new, args.ndigits)
+    if args.fingerprint:
+        fp_old, fp_new = layer_fingerprints(old), layer_fingerprints(new)
+        for layer in sorted(set(fp_old) | set(fp_new)):
+            mark = "=" if fp_old.get(layer) == fp_new.get(layer) else "≠"
+            print(f"{mark} {layer:<18} {fp_old.get(layer, '-'):<40} {fp_new.get(layer, '-')}")
+        return 0 if fp_old == fp_new else 1
+
+    diffs = diff_drawings(old, new, args.ndigits)
+    print("\n".join(format_diff(diffs)))
+    return 1 if diffs else 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
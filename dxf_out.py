@@ -1,23 +1,61 @@
 import math
-import ezdxf
-from typing import List, Tuple, Optional
+import struct
+from array import array
+from typing import Dict, List, Tuple, Optional
+import numpy as np
 from slab_model import SlabSystem, Slab
+from slab_results import SlabDesign
+from slab_kinds import get_slab_kind, register_slab_kind
+from drawing_ir import SlabGeometry, replay_blocks, write_svg
 
-class _DXFWriter:
+
+def _flip_xy(coords, offset, max_height) -> np.ndarray:
+    """
+    Düz koordinatları (n, 2) diziye çevirir, ötelemeyi ekler ve Y'yi ters
+    çevirir (GUI -> DXF); tümü vektörel.
+    """
+    xy = np.asarray(coords, dtype=float).reshape(-1, 2) + offset
+    if max_height is not None:
+        xy[:, 1] = max_height - xy[:, 1]
+    return xy
+
+
+class _WriterBase:
+    """
+    Yazıcıların ortak parçası: Y ters çevirme (GUI -> DXF) ve katmanın ilk
+    kullanımda tanımlanması. Alt sınıf max_height ve layers_created'ı kurar,
+    add_layer'ı kendi biçimine göre uygular.
+    """
+
+    max_height = None
+
+    def _fy(self, y):
+        """Y koordinatını ters çevir (GUI -> DXF dönüşümü için)."""
+        if self.max_height is not None:
+            return self.max_height - y
+        return y
+
+    def _flip(self, coords, offset=(0.0, 0.0)) -> np.ndarray:
+        """Düz koordinatları ötelenmiş ve Y'si ters çevrilmiş (n, 2) diziye çevirir."""
+        return _flip_xy(coords, offset, self.max_height)
+
+    def _ensure_layer(self, layer: str):
+        """Katman henüz tanımlanmadıysa varsayılan renkle tanımlar ("0" her zaman vardır)."""
+        if layer not in self.layers_created and layer != "0":
+            self.add_layer(layer)
+
+
+class _DXFWriter(_WriterBase):
     """ezdxf kütüphanesi kullanarak DXF dosyası oluşturan sınıf."""
     
     def __init__(self, max_height=None):
+        # ezdxf ağır bir paket; yalnızca çıktı alınırken yüklenir
+        import ezdxf
         self.doc = ezdxf.new('R2010')  # AutoCAD 2010 formatı
         self.msp = self.doc.modelspace()
         self.layers_created = set()
         self.max_height = max_height
 
-    def _fy(self, y):
-        """Y koordinatını ters çevir (GUI -> DXF dönüşümü için)."""
-        if self.max_height is not None:
-            return self.max_height - y
-        return y
-
     def add_layer(self, name: str, color: int = 7, lineweight: int = -3):
         """
         color: AutoCAD Color Index (ACI). 1=Red, 2=Yellow, 3=Green, 4=Cyan, 5=Blue, 6=Magenta, 7=White/Black
@@ -30,24 +68,42 @@ class _DXFWriter:
             self.layers_created.add(name)
 
     def add_line(self, x1, y1, x2, y2, layer="0"):
-        if layer not in self.layers_created and layer != "0":
-             self.add_layer(layer)
+        self._ensure_layer(layer)
 
         y1 = self._fy(y1)
         y2 = self._fy(y2)
         self.msp.add_line((x1, y1), (x2, y2), dxfattribs={'layer': layer})
 
     def add_polyline(self, pts, layer="0", closed=False):
-        if layer not in self.layers_created and layer != "0":
-             self.add_layer(layer)
+        self._ensure_layer(layer)
 
+        if isinstance(pts, np.ndarray):
+            self.add_polylines(pts, (pts.size // 2,), (closed,), layer=layer)
+            return
         # pts listesi (x, y) tuple'larından oluşur
         new_pts = [(x, self._fy(y)) for x, y in pts]
         self.msp.add_lwpolyline(new_pts, dxfattribs={'layer': layer}, close=closed)
 
+    def add_polylines(self, coords, ends, closed, layer="0", offset=(0.0, 0.0)):
+        """
+        Poliçizgi topluluğu ekler; öteleme ve Y ters çevirme tek seferde
+        dizi üzerinde yapılır.
+
+        Args:
+            coords: Düz koordinatlar (x0, y0, x1, y1, ...), NumPy dizisi veya array('d')
+            ends: Her poliçizginin bitiş nokta indeksi (coords içinde)
+            closed: Her poliçizgi için kapalı mı bayrağı
+            offset: Tüm noktalara eklenecek (dx, dy), GUI yönünde
+        """
+        self._ensure_layer(layer)
+        xy = self._flip(coords, offset).tolist()
+        start = 0
+        for end, cl in zip(ends, closed):
+            self.msp.add_lwpolyline(xy[start:end], dxfattribs={'layer': layer}, close=bool(cl))
+            start = end
+
     def add_text(self, x, y, text, height=200.0, layer="TEXT", rotation=0.0, center=False, align_code=None):
-        if layer not in self.layers_created and layer != "0":
-             self.add_layer(layer)
+        self._ensure_layer(layer)
 
         y = self._fy(y)
         
@@ -59,14 +115,399 @@ class _DXFWriter:
         if align_code:
              txt.set_placement((x, y), align=align_code)
         elif center:
-            txt.set_placement((x, y), align=ezdxf.enums.TextEntityAlignment.MIDDLE_CENTER)
+            from ezdxf.enums import TextEntityAlignment
+            txt.set_placement((x, y), align=TextEntityAlignment.MIDDLE_CENTER)
         else:
             txt.set_placement((x, y))
 
+    def add_block(self, name: str, pts, closed=False):
+        """
+        Poliçizgi bloğu tanımlar. Noktalar ekleme noktasına göredir (GUI
+        yönünde, Y aşağı); içerik katman 0'da çizilir, INSERT'in katmanını alır.
+        """
+        blk = self.doc.blocks.new(name=name)
+        blk.add_lwpolyline([(x, -y) for x, y in pts], close=closed)
+
+    def add_insert(self, name: str, x, y, rotation=0.0, layer="0"):
+        self._ensure_layer(layer)
+        self.msp.add_blockref(name, (x, self._fy(y)),
+                              dxfattribs={'layer': layer, 'rotation': rotation})
+
     def save(self, path: str):
         self.doc.saveas(path)
 
 
+class _BinaryDXFWriter(_DXFWriter):
+    """_DXFWriter'ın ikili (binary) DXF kaydeden hali."""
+
+    def save(self, path: str):
+        self.doc.saveas(path, fmt="bin")
+
+
+# R12 TEXT hizalama grup kodları (72: yatay, 73: dikey); ezdxf TextEntityAlignment adlarıyla
+_TEXT_ALIGN = {
+    "LEFT": (0, 0), "CENTER": (1, 0), "RIGHT": (2, 0), "MIDDLE": (4, 0),
+    "BOTTOM_LEFT": (0, 1), "BOTTOM_CENTER": (1, 1), "BOTTOM_RIGHT": (2, 1),
+    "MIDDLE_LEFT": (0, 2), "MIDDLE_CENTER": (1, 2), "MIDDLE_RIGHT": (2, 2),
+    "TOP_LEFT": (0, 3), "TOP_CENTER": (1, 3), "TOP_RIGHT": (2, 3),
+}
+
+
+def _text_align(center=False, align_code=None) -> Tuple[int, int]:
+    """
+    add_text hizalama argümanlarını R12 (72, 73) grup değerlerine çevirir.
+
+    Args:
+        center: align_code yoksa MIDDLE_CENTER kullanılır
+        align_code: ezdxf TextEntityAlignment üyesi veya adı (örn. "TOP_LEFT")
+
+    Returns:
+        (yatay, dikey) hizalama; (0, 0) sol-taban (varsayılan)
+    """
+    if align_code:
+        return _TEXT_ALIGN[getattr(align_code, "name", str(align_code)).upper()]
+    if center:
+        return _TEXT_ALIGN["MIDDLE_CENTER"]
+    return 0, 0
+
+
+STREAM_ENCODING = "cp1254"      # $DWGCODEPAGE ANSI_1254 (Türkçe)
+STREAM_BUFFER = 1 << 20         # Dosya yazma tamponu (bayt)
+
+
+def _dxf_unicode_escape(err: UnicodeEncodeError):
+    """Kod sayfasında olmayan karakterleri DXF'in \\U+XXXX biçimine çevirir."""
+    chars = err.object[err.start:err.end]
+    return "".join(f"\\U+{ord(c):04X}" for c in chars), err.end
+
+
+class _StreamDXFWriter(_WriterBase):
+    """
+    _DXFWriter ile aynı arayüzde, bellekte belge kurmadan yazan DXF R12 (AC1009)
+    yazıcısı. Her çizgi/poliçizgi/yazı grup kodlarıyla hemen tamponlu bir geçici
+    dosyaya yazılır; save() başlık ve katman tablosunu yazıp varlıkları hedefe
+    kopyalar (katman tablosu varlıklardan önce gelmek zorunda olduğu için).
+
+    R12 katman tablosunda çizgi kalınlığı (lineweight) bulunmaz; kalınlık
+    yalnızca ezdxf yazıcısında korunur.
+    """
+
+    def __init__(self, max_height=None):
+        import codecs
+        codecs.register_error("dxf_unicode", _dxf_unicode_escape)
+        self._body = self._open_spool()
+        self.layers: Dict[str, int] = {}  # ad -> renk (eklenme sırasıyla)
+        self.layers_created = set()
+        self.max_height = max_height
+        self._blocks: List[str] = []       # BLOCKS bölümü (ENTITIES'ten önce yazılır)
+
+    def _open_spool(self):
+        """Varlıkların biriktirildiği geçici dosya."""
+        import tempfile
+        return tempfile.TemporaryFile("w+", encoding=STREAM_ENCODING,
+                                      errors="dxf_unicode", buffering=STREAM_BUFFER)
+
+    def _head_tags(self) -> List[Tuple[int, object]]:
+        """HEADER ve TABLES bölümleri ile BLOCKS başlangıcı, (grup kodu, değer) olarak."""
+        layer_rows = [("0", 7)] + list(self.layers.items())
+        tags = [(0, "SECTION"), (2, "HEADER"), (9, "$ACADVER"), (1, "AC1009"),
+                (9, "$DWGCODEPAGE"), (3, "ANSI_1254"), (0, "ENDSEC"),
+                (0, "SECTION"), (2, "TABLES"),
+                (0, "TABLE"), (2, "LTYPE"), (70, 1),
+                (0, "LTYPE"), (2, "CONTINUOUS"), (70, 0), (3, "Solid line"), (72, 65), (73, 0), (40, 0.0),
+                (0, "ENDTAB"),
+                (0, "TABLE"), (2, "LAYER"), (70, len(layer_rows))]
+        for name, color in layer_rows:
+            tags += [(0, "LAYER"), (2, name), (70, 0), (62, color), (6, "CONTINUOUS")]
+        tags += [(0, "ENDTAB"), (0, "ENDSEC"), (0, "SECTION"), (2, "BLOCKS")]
+        return tags
+
+    def add_layer(self, name: str, color: int = 7, lineweight: int = -3):
+        if name not in self.layers_created and name != "0":
+            self.layers[name] = color
+            self.layers_created.add(name)
+
+    def add_line(self, x1, y1, x2, y2, layer="0"):
+        self._ensure_layer(layer)
+        self._body.write(
+            f"0\nLINE\n8\n{layer}\n10\n{float(x1)!r}\n20\n{float(self._fy(y1))!r}\n30\n0.0\n"
+            f"11\n{float(x2)!r}\n21\n{float(self._fy(y2))!r}\n31\n0.0\n")
+
+    def add_polyline(self, pts, layer="0", closed=False):
+        if isinstance(pts, np.ndarray):
+            self.add_polylines(pts, (pts.size // 2,), (closed,), layer=layer)
+            return
+        self._ensure_layer(layer)
+        vertex = f"0\nVERTEX\n8\n{layer}\n10\n"
+        fy = self._fy
+        self._body.write(
+            f"0\nPOLYLINE\n8\n{layer}\n66\n1\n10\n0.0\n20\n0.0\n30\n0.0\n70\n{1 if closed else 0}\n"
+            + "".join(f"{vertex}{float(x)!r}\n20\n{float(fy(y))!r}\n30\n0.0\n" for x, y in pts)
+            + f"0\nSEQEND\n8\n{layer}\n")
+
+    def add_polylines(self, coords, ends, closed, layer="0", offset=(0.0, 0.0)):
+        """Poliçizgi topluluğu (bkz. _DXFWriter.add_polylines); tek yazma çağrısı."""
+        self._ensure_layer(layer)
+        # Tüm noktalar tek seferde "x\n20\ny" metnine çevrilir (C düzeyinde map)
+        flat = self._flip(coords, offset).ravel().tolist()
+        xy = list(map("\n20\n".join, zip(map(repr, flat[0::2]), map(repr, flat[1::2]))))
+        vertex = f"0\nVERTEX\n8\n{layer}\n10\n"
+        sep = f"\n30\n0.0\n{vertex}"
+        head = f"0\nPOLYLINE\n8\n{layer}\n66\n1\n10\n0.0\n20\n0.0\n30\n0.0\n70\n"
+        seqend = f"0\nSEQEND\n8\n{layer}\n"
+        parts = []
+        start = 0
+        for end, cl in zip(ends, closed):
+            parts.append(f"{head}{1 if cl else 0}\n")
+            if end > start:
+                parts.append(f"{vertex}{sep.join(xy[start:end])}\n30\n0.0\n")
+            parts.append(seqend)
+            start = end
+        self._body.write("".join(parts))
+
+    def add_text(self, x, y, text, height=200.0, layer="TEXT", rotation=0.0, center=False, align_code=None):
+        self._ensure_layer(layer)
+        y = float(self._fy(y))
+        x = float(x)
+        halign, valign = _text_align(center, align_code)
+        parts = [f"0\nTEXT\n8\n{layer}\n10\n{x!r}\n20\n{y!r}\n30\n0.0\n"
+                 f"40\n{float(height)!r}\n1\n{text}\n"]
+        if rotation:
+            parts.append(f"50\n{float(rotation)!r}\n")
+        if halign or valign:
+            parts.append(f"72\n{halign}\n11\n{x!r}\n21\n{y!r}\n31\n0.0\n73\n{valign}\n")
+        self._body.write("".join(parts))
+
+    def add_block(self, name: str, pts, closed=False):
+        """Poliçizgi bloğu (noktalar ekleme noktasına göre, GUI yönünde)."""
+        vertex = "0\nVERTEX\n8\n0\n10\n"
+        self._blocks.append(
+            f"0\nBLOCK\n8\n0\n2\n{name}\n70\n0\n10\n0.0\n20\n0.0\n30\n0.0\n3\n{name}\n"
+            f"0\nPOLYLINE\n8\n0\n66\n1\n10\n0.0\n20\n0.0\n30\n0.0\n70\n{1 if closed else 0}\n"
+            + "".join(f"{vertex}{float(x)!r}\n20\n{float(-y)!r}\n30\n0.0\n" for x, y in pts)
+            + "0\nSEQEND\n8\n0\n0\nENDBLK\n8\n0\n")
+
+    def add_insert(self, name: str, x, y, rotation=0.0, layer="0"):
+        self._ensure_layer(layer)
+        self._body.write(f"0\nINSERT\n8\n{layer}\n2\n{name}\n10\n{float(x)!r}\n"
+                         f"20\n{float(self._fy(y))!r}\n30\n0.0\n"
+                         + (f"50\n{float(rotation)!r}\n" if rotation else ""))
+
+    def save(self, path: str):
+        import shutil
+        with open(path, "w", encoding=STREAM_ENCODING, errors="dxf_unicode",
+                  buffering=STREAM_BUFFER) as f:
+            f.write("".join(f"{code}\n{value}\n" for code, value in self._head_tags()))
+            f.write("".join(self._blocks))
+            f.write("0\nENDSEC\n0\nSECTION\n2\nENTITIES\n")
+            self._body.flush()
+            self._body.seek(0)
+            shutil.copyfileobj(self._body, f, STREAM_BUFFER)
+            f.write("0\nENDSEC\n0\nEOF\n")
+        self._body.close()
+
+
+BINARY_DXF_SENTINEL = b"AutoCAD Binary DXF\r\n\x1a\x00"
+
+
+def _pack_tags(tags) -> bytes:
+    """
+    (grup kodu, değer) çiftlerini R12 ikili DXF biçimine çevirir: grup kodu
+    1 bayt, float 8 bayt double, int 2 bayt int16, metin sıfır sonlu.
+    """
+    out = bytearray()
+    for code, value in tags:
+        out.append(code)
+        if isinstance(value, float):
+            out += struct.pack("<d", value)
+        elif isinstance(value, int):
+            out += struct.pack("<h", value)
+        else:
+            out += value.encode(STREAM_ENCODING, "dxf_unicode") + b"\x00"
+    return bytes(out)
+
+
+_POINT3 = struct.Struct("<BdBdBd")     # 10/20/30 (veya 11/21/31) nokta grubu
+_TEXT_HEAD = struct.Struct("<BdBdBdBd")  # TEXT: ekleme noktası ve yükseklik
+
+
+def _pack_vertices(xy: np.ndarray, prefix: bytes) -> Tuple[bytes, int]:
+    """
+    (n, 2) noktalarını ikili VERTEX kayıtlarına çevirir (tek yapılandırılmış
+    NumPy dizisi, döngüsüz).
+
+    Args:
+        prefix: Her kaydın başı (0/VERTEX ve 8/katman grupları, paketlenmiş)
+
+    Returns:
+        (kayıtlar, kayıt boyu): i. nokta kayitlar[i*boy:(i+1)*boy] aralığında
+    """
+    rec = np.zeros(len(xy), dtype=[("pre", f"S{len(prefix)}"), ("c10", "u1"), ("x", "<f8"),
+                                   ("c20", "u1"), ("y", "<f8"), ("c30", "u1"), ("z", "<f8")])
+    rec["pre"] = prefix
+    rec["c10"], rec["c20"], rec["c30"] = 10, 20, 30
+    rec["x"] = xy[:, 0]
+    rec["y"] = xy[:, 1]
+    return rec.tobytes(), rec.dtype.itemsize
+
+
+_FLAGS = (_pack_tags([(70, 0)]), _pack_tags([(70, 1)]))  # POLYLINE açık / kapalı
+
+
+class _BinaryStreamDXFWriter(_StreamDXFWriter):
+    """
+    _StreamDXFWriter'ın ikili DXF (R12) yazan hali. Aynı tablo ve varlıkları
+    üretir; koordinatlar metne çevrilmeden 8 baytlık double olarak yazılır.
+    """
+
+    def __init__(self, max_height=None):
+        super().__init__(max_height)
+        self._packed: Dict[str, dict] = {}  # katman -> sık kullanılan paketlenmiş gruplar
+
+    def _open_spool(self):
+        import tempfile
+        return tempfile.TemporaryFile("w+b", buffering=STREAM_BUFFER)
+
+    def _layer_packed(self, layer: str) -> dict:
+        """Katmana bağlı sabit grup dizilerini bir kez paketler."""
+        packed = self._packed.get(layer)
+        if packed is None:
+            packed = self._packed[layer] = {
+                "line": _pack_tags([(0, "LINE"), (8, layer)]),
+                "polyline": _pack_tags([(0, "POLYLINE"), (8, layer), (66, 1),
+                                        (10, 0.0), (20, 0.0), (30, 0.0)]),
+                "vertex": _pack_tags([(0, "VERTEX"), (8, layer)]),
+                "seqend": _pack_tags([(0, "SEQEND"), (8, layer)]),
+                "text": _pack_tags([(0, "TEXT"), (8, layer)]),
+            }
+        return packed
+
+    def add_line(self, x1, y1, x2, y2, layer="0"):
+        self._ensure_layer(layer)
+        self._body.write(self._layer_packed(layer)["line"]
+                         + _POINT3.pack(10, float(x1), 20, float(self._fy(y1)), 30, 0.0)
+                         + _POINT3.pack(11, float(x2), 21, float(self._fy(y2)), 31, 0.0))
+
+    def add_polyline(self, pts, layer="0", closed=False):
+        if not isinstance(pts, np.ndarray):
+            pts = np.array(pts, dtype=float).reshape(-1)
+        self.add_polylines(pts, (pts.size // 2,), (closed,), layer=layer)
+
+    def add_polylines(self, coords, ends, closed, layer="0", offset=(0.0, 0.0)):
+        self._ensure_layer(layer)
+        packed = self._layer_packed(layer)
+        verts, size = _pack_vertices(self._flip(coords, offset), packed["vertex"])
+        head, seqend = packed["polyline"], packed["seqend"]
+        parts = []
+        start = 0
+        for end, cl in zip(ends, closed):
+            parts += (head, _FLAGS[1 if cl else 0], verts[start * size:end * size], seqend)
+            start = end
+        self._body.write(b"".join(parts))
+
+    def add_text(self, x, y, text, height=200.0, layer="TEXT", rotation=0.0, center=False, align_code=None):
+        self._ensure_layer(layer)
+        y = float(self._fy(y))
+        x = float(x)
+        halign, valign = _text_align(center, align_code)
+        parts = [self._layer_packed(layer)["text"], _TEXT_HEAD.pack(10, x, 20, y, 30, 0.0, 40, float(height)),
+                 b"\x01", text.encode(STREAM_ENCODING, "dxf_unicode"), b"\x00"]
+        if rotation:
+            parts.append(struct.pack("<Bd", 50, float(rotation)))
+        if halign or valign:
+            parts += [struct.pack("<Bh", 72, halign), _POINT3.pack(11, x, 21, y, 31, 0.0),
+                      struct.pack("<Bh", 73, valign)]
+        self._body.write(b"".join(parts))
+
+    def add_block(self, name: str, pts, closed=False):
+        xy = np.array(pts, dtype=float).reshape(-1, 2) * (1.0, -1.0)
+        verts, _ = _pack_vertices(xy, self._layer_packed("0")["vertex"])
+        self._blocks.append(
+            _pack_tags([(0, "BLOCK"), (8, "0"), (2, name), (70, 0), (10, 0.0), (20, 0.0), (30, 0.0),
+                        (3, name), (0, "POLYLINE"), (8, "0"), (66, 1), (10, 0.0), (20, 0.0), (30, 0.0),
+                        (70, 1 if closed else 0)])
+            + verts + _pack_tags([(0, "SEQEND"), (8, "0"), (0, "ENDBLK"), (8, "0")]))
+
+    def add_insert(self, name: str, x, y, rotation=0.0, layer="0"):
+        self._ensure_layer(layer)
+        tags = [(0, "INSERT"), (8, layer), (2, name), (10, float(x)), (20, float(self._fy(y))), (30, 0.0)]
+        if rotation:
+            tags.append((50, float(rotation)))
+        self._body.write(_pack_tags(tags))
+
+    def save(self, path: str):
+        import shutil
+        with open(path, "wb", buffering=STREAM_BUFFER) as f:
+            f.write(BINARY_DXF_SENTINEL)
+            f.write(_pack_tags(self._head_tags()))
+            f.write(b"".join(self._blocks))
+            f.write(_pack_tags([(0, "ENDSEC"), (0, "SECTION"), (2, "ENTITIES")]))
+            self._body.flush()
+            self._body.seek(0)
+            shutil.copyfileobj(self._body, f, STREAM_BUFFER)
+            f.write(_pack_tags([(0, "ENDSEC"), (0, "EOF")]))
+        self._body.close()
+
+
+class _MemoryDXFWriter(_WriterBase, SlabGeometry):
+    """
+    Diske yazmayan yakalama yazıcısı: gönderilen ilkelleri katman başına,
+    DXF koordinatlarında (Y ters çevrilmiş) kaydeder. Doğrulama betikleri
+    export_to_dxf(..., backend="memory") ile dönen yazıcıyı dosyayı yeniden
+    okumadan inceler (layers, layer_colors, blocks, inserts).
+    """
+
+    def __init__(self, max_height=None):
+        super().__init__()
+        self.max_height = max_height
+        self.layers_created = set()
+        self.layer_colors: Dict[str, int] = {}
+        self.blocks: Dict[str, Tuple[List[Tuple[float, float]], bool]] = {}
+        self.inserts: List[Tuple[str, str, float, float, float]] = []  # (katman, blok, x, y, dönme)
+
+    def add_layer(self, name: str, color: int = 7, lineweight: int = -3):
+        if name not in self.layers_created and name != "0":
+            self.layer_colors[name] = color
+            self.layers_created.add(name)
+        super().add_layer(name)
+
+    def add_line(self, x1, y1, x2, y2, layer="0"):
+        self._ensure_layer(layer)
+        super().add_line(float(x1), float(self._fy(y1)), float(x2), float(self._fy(y2)), layer=layer)
+
+    def add_polyline(self, pts, layer="0", closed=False):
+        if isinstance(pts, np.ndarray):
+            self.add_polylines(pts, (pts.size // 2,), (closed,), layer=layer)
+            return
+        self._ensure_layer(layer)
+        super().add_polyline([(float(x), float(self._fy(y))) for x, y in pts], layer=layer, closed=closed)
+
+    def add_polylines(self, coords, ends, closed, layer="0", offset=(0.0, 0.0)):
+        self._ensure_layer(layer)
+        flat = array("d", self._flip(coords, offset).tobytes())
+        super().add_polylines(flat, ends, closed, layer=layer)
+
+    def add_text(self, x, y, text, height=200.0, layer="TEXT", rotation=0.0, center=False, align_code=None):
+        self._ensure_layer(layer)
+        super().add_text(float(x), float(self._fy(y)), text, height=height, layer=layer, rotation=rotation,
+                         center=center, align_code=align_code)
+
+    def add_block(self, name: str, pts, closed=False):
+        self.blocks[name] = ([(float(x), float(-y)) for x, y in pts], closed)
+
+    def add_insert(self, name: str, x, y, rotation=0.0, layer="0"):
+        self._ensure_layer(layer)
+        self.inserts.append((layer, name, float(x), float(self._fy(y)), float(rotation)))
+
+    def save(self, path=None):
+        pass
+
+
+# export_to_dxf(backend=...) seçenekleri (binary=True ise ikinci tablo)
+DXF_BACKENDS = {"ezdxf": _DXFWriter, "stream": _StreamDXFWriter, "memory": _MemoryDXFWriter}
+DXF_BINARY_BACKENDS = {"ezdxf": _BinaryDXFWriter, "stream": _BinaryStreamDXFWriter}
+
+
 # =========================================================
 # Donatı Çizim Yardımcı Fonksiyonları
 # =========================================================
@@ -289,7 +730,7 @@ def _draw_oneway_reinforcement_detail(
     w: _DXFWriter,
     sid: str,
     s: Slab,
-    dcache: dict,
+    dcache: SlabDesign,
     x0: float, y0: float, x1: float, y1: float,
     bw_mm: float,
     slab_index: int = 0
@@ -301,10 +742,10 @@ def _draw_oneway_reinforcement_detail(
     - Dağıtma donatısı: 1-2 adet.
     - Yazı konumları: Line'dan 30mm uzakta, başlangıçtan Ln/6 ötede.
     """
-    cover = float(dcache.get("cover_mm", 25.0))
-    auto_dir = dcache.get("auto_dir", "X")
-    choices = dcache.get("choices", {})
-    edge_cont = dcache.get("edge_continuity", {})
+    cover = float(dcache.cover_mm)
+    auto_dir = dcache.auto_dir or "X"
+    choices = dcache.choices
+    edge_cont = dcache.edge_continuity
     
     # İç sınırlar (pas payı düşülmüş)
     ix0, iy0, ix1, iy1 = x0 + cover, y0 + cover, x1 - cover, y1 - cover
@@ -315,21 +756,21 @@ def _draw_oneway_reinforcement_detail(
     Ly = iy1 - iy0  # mm
     
     # Donatı seçimleri
-    ch_duz = choices.get("duz")
-    ch_pilye = choices.get("pilye")
-    ch_dist = choices.get("dist")
-    ch_kenar_start = choices.get("kenar_mesnet_start")
-    ch_kenar_end = choices.get("kenar_mesnet_end")
-    ch_ic_start = choices.get("ic_mesnet_start")
-    ch_ic_end = choices.get("ic_mesnet_end")
-    ch_ek_start = choices.get("mesnet_ek_start")
-    ch_ek_end = choices.get("mesnet_ek_end")
+    ch_duz = choices.duz
+    ch_pilye = choices.pilye
+    ch_dist = choices.dist
+    ch_kenar_start = choices.kenar_mesnet_start
+    ch_kenar_end = choices.kenar_mesnet_end
+    ch_ic_start = choices.ic_mesnet_start
+    ch_ic_end = choices.ic_mesnet_end
+    ch_ek_start = choices.mesnet_ek_start
+    ch_ek_end = choices.mesnet_ek_end
     
     # Kenar süreklilik durumları
-    uzun_start_cont = edge_cont.get("uzun_start", False)
-    uzun_end_cont = edge_cont.get("uzun_end", False)
-    kisa_start_cont = edge_cont.get("kisa_start", False)
-    kisa_end_cont = edge_cont.get("kisa_end", False)
+    uzun_start_cont = edge_cont.uzun_start
+    uzun_end_cont = edge_cont.uzun_end
+    kisa_start_cont = edge_cont.kisa_start
+    kisa_end_cont = edge_cont.kisa_end
     
     # Orta noktalar
     midx = (ix0 + ix1) / 2.0
@@ -553,213 +994,300 @@ def _draw_oneway_reinforcement_detail(
             _draw_support_extra_x(w, x1, midy + offset_val, bw_mm, ch_ek_end, L_ext, is_left=False)
 
 
-def export_to_dxf(system: SlabSystem, filename: str, design_cache: dict, bw_val: float,
-                  real_slabs: dict = None):
-    from twoway_slab import slab_edge_has_beam
-
-    # Kiriş olan kenarlara bw/2 ekle → Lx = Lxnet + bw etkisi
-    # ======================================================================
-    # Çizilmiş kirişleri takip et (aynı kirişi iki kez çizmemek için)
-    drawn_beams = set()
-
-    # Toplam Yüksekliği Hesapla (Y ekseni simetrisi için)
-    max_y_mm = 0.0
+# Katmanlar: (ad, ACI renk, çizgi kalınlığı)
+# Renk Kodları (ACI): 1=Red, 2=Yellow, 3=Green, 4=Cyan, 5=Blue, 6=Magenta, 7=White
+LAYER_DEFS = [
+    ("SLAB_EDGE", 7, 25),       # White, Thin
+    ("BEAM", 7, 50),            # White, Thick (0.50mm)
+    ("REB_MAIN_DUZ", 1, -3),    # Red
+    ("REB_MAIN_PILYE", 1, -3),  # Red
+    ("REB_DIST", 2, -3),        # Yellow
+    ("REB_KENAR", 3, -3),       # Green
+    ("REB_IC_MESNET", 5, -3),   # Blue
+    ("REB_EK_MESNET", 4, -3),   # Cyan
+    ("REB_BALCONY_MAIN", 6, -3),# Magenta
+    ("REB_BALCONY_DIST", 30, -3),# Orange (30 is usually orange-ish)
+    ("TEXT", 7, -3),
+    ("DIM", 7, -3)
+]
+LAYER_COLORS = {name: color for name, color, _ in LAYER_DEFS}
+
+
+def _plan_height_mm(system: SlabSystem, real_slabs: dict = None) -> float:
+    """Toplam plan yüksekliği (Y ekseni simetrisi için, mm)."""
     if real_slabs:
         max_h = 0.0
         for rs in real_slabs.values():
             bottom = rs.y + rs.h
             if bottom > max_h:
                 max_h = bottom
-        max_y_mm = max_h * 1000.0
+        return max_h * 1000.0
+    # Fallback
+    _, total_my = system.size_m_gross()
+    return total_my * 1000.0
+
+
+def _slab_edges_have_beam(s: Slab) -> bool:
+    """Kenarlarda kiriş var mı (balkonun kenarlarında kiriş çizilmez)."""
+    return s.kind != "BALCONY"
+
+
+def slab_boxes(system: SlabSystem, sid: str, bw_mm: float, idx: int = 0,
+               real_slabs: dict = None) -> Tuple[Tuple[float, float, float, float],
+                                                 Tuple[float, float, float, float]]:
+    """
+    Döşemenin aks (brüt) ve net sınırları, mm cinsinden (GUI yönü, Y aşağı).
+
+    Girdi Lx/Ly = Aks-aks mesafesi (brüt) kabul edilir.
+    Net döşeme = Brüt - (varsa kiriş/2); kirişler akslar üzerine oturtulur.
+
+    Args:
+        idx: real_slabs yoksa yan yana dizmede kullanılan sıra
+
+    Returns:
+        ((grid_x0, grid_y0, grid_x1, grid_y1), (x0, y0, x1, y1))
+    """
+    s = system.slabs[sid]
+    Lx_m, Ly_m = s.size_m_gross()
+    half = bw_mm / 2.0 if _slab_edges_have_beam(s) else 0.0
+
+    # Grid hatları (Brüt sınırlar) - mm cinsinden
+    if real_slabs and sid in real_slabs:
+        rs = real_slabs[sid]
+        grid_x0 = rs.x * 1000.0
+        grid_y0 = rs.y * 1000.0
+        grid_x1 = grid_x0 + (rs.w * 1000.0)
+        grid_y1 = grid_y0 + (rs.h * 1000.0)
     else:
-        # Fallback
-        _, total_my = system.size_m_gross()
-        max_y_mm = total_my * 1000.0
+        # Fallback (yan yana diz)
+        grid_x0 = idx * (Lx_m * 1000.0)
+        grid_y0 = 0.0
+        grid_x1 = grid_x0 + (Lx_m * 1000.0)
+        grid_y1 = grid_y0 + (Ly_m * 1000.0)
 
-    # Margin ekle (isteğe bağlı, şimdilik tam sınır)
-    max_y_mm += 0.0 
+    # Net Döşeme Koordinatları (Shrink): kiriş olan kenarlardan içeri çek
+    net = (grid_x0 + half, grid_y0 + half, grid_x1 - half, grid_y1 - half)
+    return (grid_x0, grid_y0, grid_x1, grid_y1), net
 
-    w = _DXFWriter(max_height=max_y_mm)
-    
-    # Katmanları ekle
-    # Renk Kodları (ACI): 1=Red, 2=Yellow, 3=Green, 4=Cyan, 5=Blue, 6=Magenta, 7=White
-    layer_defs = [
-        ("SLAB_EDGE", 7, 25),       # White, Thin
-        ("BEAM", 7, 50),            # White, Thick (0.50mm)
-        ("REB_MAIN_DUZ", 1, -3),    # Red
-        ("REB_MAIN_PILYE", 1, -3),  # Red
-        ("REB_DIST", 2, -3),        # Yellow
-        ("REB_KENAR", 3, -3),       # Green
-        ("REB_IC_MESNET", 5, -3),   # Blue
-        ("REB_EK_MESNET", 4, -3),   # Cyan
-        ("REB_BALCONY_MAIN", 6, -3),# Magenta
-        ("REB_BALCONY_DIST", 30, -3),# Orange (30 is usually orange-ish)
-        ("TEXT", 7, -3),
-        ("DIM", 7, -3)
-    ]
-    
-    for name, color, weight in layer_defs:
-        w.add_layer(name, color=color, lineweight=weight)
 
-    bw_mm = bw_val * 1000.0
+SLAB_NAME_OFFSET = (50.0, 100.0)  # Döşeme ismi konumu: sınırın (x0, y1) köşesinden (sağa, içeri), mm
+SLAB_NAME_HEIGHT = 125
+
+
+def slab_geometry(system: SlabSystem, sid: str, dcache: Optional[SlabDesign],
+                  box: Tuple[float, float, float, float], bw_mm: float, idx: int = 0) -> SlabGeometry:
+    """
+    Döşemenin çizimini (sınır, isim, donatı detayı) ara temsile kaydeder.
+
+    Args:
+        dcache: Döşemenin tasarımı (None ise yalnızca sınır ve isim)
+        box: Net sınırlar (x0, y0, x1, y1), mm
+
+    Returns:
+        DXF, SVG veya Tk'ya oynatılabilecek SlabGeometry
+    """
+    g = SlabGeometry()
+    x0, y0, x1, y1 = box
+
+    # Döşeme sınır çizgisi
+    g.add_polyline([(x0, y0), (x1, y0), (x1, y1), (x0, y1)],
+                   layer="SLAB_EDGE", closed=True)
+
+    # Döşeme ismi - sol üst köşeden 50mm sağ, 100mm aşağı
+    dx, dy = SLAB_NAME_OFFSET
+    g.add_text(x0 + dx, y1 - dy, sid, height=SLAB_NAME_HEIGHT, layer="TEXT")
+
+    if dcache:
+        spec = get_slab_kind(dcache.kind)
+        if spec is not None and spec.draw is not None:
+            spec.draw(g, sid, system.slabs[sid], dcache, box, bw_mm, idx, system)
+    return g
+
+
+BEAM_MERGE_EPS = 0.1  # mm; bu kadar yakın kiriş aralıkları birleşik sayılır
+
+
+def _merge_intervals(intervals, eps: float = BEAM_MERGE_EPS) -> List[Tuple[float, float]]:
+    """Aralıkların birleşimi (sıralı, çakışan/değen aralıklar tek aralık)."""
+    merged: List[Tuple[float, float]] = []
+    for a, b in sorted(intervals):
+        if merged and a <= merged[-1][1] + eps:
+            if b > merged[-1][1]:
+                merged[-1] = (merged[-1][0], b)
+        else:
+            merged.append((a, b))
+    return merged
+
+
+def _draw_beam_network(w, grids, bw_mm: float):
+    """
+    Katın kirişlerini aks başına aralık birleşimiyle çizer.
+
+    Her döşeme dört kenarındaki aksa bir kiriş aralığı ekler; aralıklar
+    köşelerde tam örtüşme için bw/2 uzatılır (V-kiriş: [y0 - bw/2, y1 + bw/2],
+    H-kiriş: [x0 - bw/2, x1 + bw/2]). Aynı akstaki aralıklar birleştirilir ve
+    her kesintisiz kiriş tek bir dikdörtgenle çizilir; kısmen örtüşen
+    kirişler de tek çizgiye iner.
+
+    Args:
+        grids: Kirişli döşemelerin aks sınırları (grid_x0, grid_y0, grid_x1, grid_y1), mm
+    """
     half = bw_mm / 2.0
+    vertical: Dict[float, Tuple[float, list]] = {}    # yuvarlanmış x -> (x, aralıklar)
+    horizontal: Dict[float, Tuple[float, list]] = {}  # yuvarlanmış y -> (y, aralıklar)
+    for grid_x0, grid_y0, grid_x1, grid_y1 in grids:
+        for gx in (grid_x0, grid_x1):
+            vertical.setdefault(round(gx, 1), (gx, []))[1].append((grid_y0 - half, grid_y1 + half))
+        for gy in (grid_y0, grid_y1):
+            horizontal.setdefault(round(gy, 1), (gy, []))[1].append((grid_x0 - half, grid_x1 + half))
+
+    # Dikey Kirişler (soldan sağa)
+    for key in sorted(vertical):
+        gx, intervals = vertical[key]
+        for y_start, y_end in _merge_intervals(intervals):
+            w.add_polyline([
+                (gx - half, y_start), (gx + half, y_start),
+                (gx + half, y_end), (gx - half, y_end)
+            ], layer="BEAM", closed=True)
+
+    # Yatay Kirişler (yukarıdan aşağı)
+    for key in sorted(horizontal):
+        gy, intervals = horizontal[key]
+        for x_start, x_end in _merge_intervals(intervals):
+            w.add_polyline([
+                (x_start, gy - half), (x_end, gy - half),
+                (x_end, gy + half), (x_start, gy + half)
+            ], layer="BEAM", closed=True)
+
+
+def _neighbour_key(system: SlabSystem, sid: str) -> tuple:
+    """Sağ ve alt komşular (ID, tip, brüt boyut); mesnet ek donatısı bunlara göre çizilir."""
+    key = []
+    for direction in ("X", "Y"):
+        nids = system.neighbor_slabs_on_side(sid, direction, "END")
+        key.append(tuple(sorted((nid, system.slabs[nid].kind, system.slabs[nid].size_m_gross())
+                                for nid in nids)))
+    return tuple(key)
+
+
+class DrawingCache:
+    """
+    Döşeme çizimlerinin önbelleği: sid -> (anahtar, SlabGeometry).
 
+    Anahtar net sınırlar, kiriş genişliği, tasarım (dcache) ve komşu
+    sürekliliğidir; bunlar değişmedikçe çizim yeniden üretilmez. Böylece
+    küçük bir düzenlemeden sonraki çıktı yalnızca değişen döşemeleri çizer.
+    Kayıtlar değiştirilmediği için çıktılar arasında paylaşılabilir.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def slab(self, system: SlabSystem, sid: str, dcache: Optional[SlabDesign],
+             box: Tuple[float, float, float, float], bw_mm: float, idx: int = 0) -> SlabGeometry:
+        """Önbellekteki çizim veya (anahtar değiştiyse) yeniden üretilmiş çizim."""
+        key = (box, bw_mm, dcache, _neighbour_key(system, sid))
+        entry = self._entries.get(sid)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        geom = slab_geometry(system, sid, dcache, box, bw_mm, idx)
+        self._entries[sid] = (key, geom)
+        return geom
+
+    def prune(self, sids):
+        """Planda olmayan döşemelerin kayıtlarını siler."""
+        for sid in self._entries.keys() - set(sids):
+            del self._entries[sid]
+
+
+def plan_geometry(system: SlabSystem, design_cache: Dict[str, SlabDesign], bw_val: float,
+                  real_slabs: dict = None, cache: Optional[DrawingCache] = None) -> List[SlabGeometry]:
+    """
+    Planın çizimi: önce kat kirişleri, sonra döşemeler (soldan sağa sırayla),
+    her biri ayrı bir SlabGeometry olarak.
+
+    Args:
+        cache: Verilirse değişmeyen döşemelerin çizimleri buradan alınır
+    """
     if not system.slabs:
-        w.save(filename)
-        return
+        return []
+    bw_mm = bw_val * 1000.0
 
     # Döşemeleri pozisyonuna göre sırala (soldan sağa)
     sorted_sids = sorted(system.slabs.keys(),
                          key=lambda sid: (system.slabs[sid].i0, system.slabs[sid].j0))
+    boxes = [slab_boxes(system, sid, bw_mm, idx, real_slabs) for idx, sid in enumerate(sorted_sids)]
 
-    for idx, sid in enumerate(sorted_sids):
-        s = system.slabs[sid]
-        Lx_m, Ly_m = s.size_m_gross()
-
-        # Kenar kiriş durumlarını kontrol et
-        if s.kind == "BALCONY":
-            has_left = False
-            has_right = False
-            has_top = False
-            has_bottom = False
-        else:
-            has_left = True
-            has_right = True
-            has_top = True
-            has_bottom = True
-
+    # Kat kirişleri (her çıktıda ayrı geçişte, önbelleksiz)
+    beams = SlabGeometry()
+    _draw_beam_network(beams, [grid for sid, (grid, _) in zip(sorted_sids, boxes)
+                               if _slab_edges_have_beam(system.slabs[sid])], bw_mm)
 
-            
-        # =========================================================
-        # Yeni Mantık (Kullanıcı İsteği):
-        # Girdi Lx/Ly = Aks-aks mesafesi (brüt) kabul edilir.
-        # Net döşeme = Brüt - (varsa kiriş/2)
-        # Kirişler = Akslar üzerine oturtulur.
-        # =========================================================
-        
-        # Grid hatları (Brüt sınırlar) - mm cinsinden
-        if real_slabs and sid in real_slabs:
-            rs = real_slabs[sid]
-            grid_x0 = rs.x * 1000.0
-            grid_y0 = rs.y * 1000.0
-            grid_x1 = grid_x0 + (rs.w * 1000.0)
-            grid_y1 = grid_y0 + (rs.h * 1000.0)
+    if cache is not None:
+        cache.prune(sorted_sids)
+    slabs = []
+    for idx, (sid, (_, box)) in enumerate(zip(sorted_sids, boxes)):
+        dcache = design_cache.get(sid)
+        if cache is not None:
+            slabs.append(cache.slab(system, sid, dcache, box, bw_mm, idx))
         else:
-            # Fallback (yan yana diz)
-            # Bu modda Lx net kabul ediliyordu eskiden, ama tutarlılık için
-            # burayı da brüt gibi düşünebiliriz veya olduğu gibi bırakabiliriz.
-            # Şimdilik basitçe yan yana koyuyoruz.
-            grid_x0 = idx * (Lx_m * 1000.0) 
-            grid_y0 = 0.0
-            grid_x1 = grid_x0 + (Lx_m * 1000.0)
-            grid_y1 = grid_y0 + (Ly_m * 1000.0)
-
-        # Net Döşeme Koordinatları (Shrink)
-        # Kiriş olan kenarlardan içeri çek
-        x0 = grid_x0 + (half if has_left else 0)
-        y0 = grid_y0 + (half if has_top else 0)
-        x1 = grid_x1 - (half if has_right else 0)
-        y1 = grid_y1 - (half if has_bottom else 0)
-
-        # Döşeme sınır çizgisi
-        w.add_polyline([(x0, y0), (x1, y0), (x1, y1), (x0, y1)],
-                       layer="SLAB_EDGE", closed=True)
-
-        # Kirişleri Çiz (Grid hatları üzerine ortalanmış)
-        # Her kiriş, aks boyunca (grid_x/y) tam boyutta çizilir.
-        # Kesişim noktalarında üst üste binmeleri sağlamak için uzatmalar (extensions) eklenir.
-        
-        ext_left = half if has_left else 0.0
-        ext_right = half if has_right else 0.0
-        ext_top = half if has_top else 0.0
-        ext_bottom = half if has_bottom else 0.0
-
-        if has_left:
-            # Sol Dikey Kiriş: grid_x0 üzerinde
-            # Yukarı ve aşağı uzantılar: Top/Bottom kiriş varsa onların içine kadar uzan
-            # Aslında köşe birleşiminde "kimin üstte olduğu" DXF'de önemli değil,
-            # sadece taranmış alanın (hatch/solid) veya sınırların birleşimi önemli.
-            # Biz polyline çiziyoruz. Köşede L birleşim varsa:
-            # V-kiriş: [y0 - half, y1 + half] (eğer üst/alt kiriş varsa)
-            # H-kiriş: [x0 - half, x1 + half] (eğer sol/sağ kiriş varsa)
-            # Böylece (x0,y0) köşesinde tam bir kare (w*w) örtüşme olur.
-            
-            y_start = grid_y0 - ext_top
-            y_end = grid_y1 + ext_bottom
-            
-            beam_key = ("V", round(grid_x0, 1), round(y_start, 1), round(y_end, 1))
-            if beam_key not in drawn_beams:
-                drawn_beams.add(beam_key)
-                w.add_polyline([
-                    (grid_x0 - half, y_start), (grid_x0 + half, y_start),
-                    (grid_x0 + half, y_end), (grid_x0 - half, y_end)
-                ], layer="BEAM", closed=True)
-
-        if has_right:
-            # Sağ Dikey Kiriş: grid_x1 üzerinde
-            y_start = grid_y0 - ext_top
-            y_end = grid_y1 + ext_bottom
-            
-            beam_key = ("V", round(grid_x1, 1), round(y_start, 1), round(y_end, 1))
-            if beam_key not in drawn_beams:
-                drawn_beams.add(beam_key)
-                w.add_polyline([
-                    (grid_x1 - half, y_start), (grid_x1 + half, y_start),
-                    (grid_x1 + half, y_end), (grid_x1 - half, y_end)
-                ], layer="BEAM", closed=True)
-
-        if has_top:
-            # Üst Yatay Kiriş: grid_y0 üzerinde
-            x_start = grid_x0 - ext_left
-            x_end = grid_x1 + ext_right
-            
-            beam_key = ("H", round(x_start, 1), round(grid_y0, 1), round(x_end, 1))
-            if beam_key not in drawn_beams:
-                drawn_beams.add(beam_key)
-                w.add_polyline([
-                    (x_start, grid_y0 - half), (x_end, grid_y0 - half),
-                    (x_end, grid_y0 + half), (x_start, grid_y0 + half)
-                ], layer="BEAM", closed=True)
-
-        if has_bottom:
-            # Alt Yatay Kiriş: grid_y1 üzerinde
-            x_start = grid_x0 - ext_left
-            x_end = grid_x1 + ext_right
-            
-            beam_key = ("H", round(x_start, 1), round(grid_y1, 1), round(x_end, 1))
-            if beam_key not in drawn_beams:
-                drawn_beams.add(beam_key)
-                w.add_polyline([
-                    (x_start, grid_y1 - half), (x_end, grid_y1 - half),
-                    (x_end, grid_y1 + half), (x_start, grid_y1 + half)
-                ], layer="BEAM", closed=True)
+            slabs.append(slab_geometry(system, sid, dcache, box, bw_mm, idx))
+    return [beams] + slabs
 
-        # Döşeme ismi - sol üst köşeden 50mm sağ, 100mm aşağı
-        w.add_text(x0 + 50, y1 - 100, sid, height=125, layer="TEXT")
 
-        dcache = design_cache.get(sid)
-        if not dcache:
-            continue
+def export_to_dxf(system: SlabSystem, filename: str, design_cache: Dict[str, SlabDesign], bw_val: float,
+                  real_slabs: dict = None, backend: str = "ezdxf",
+                  cache: Optional[DrawingCache] = None, blocks: bool = False,
+                  binary: bool = False):
+    """
+    Planı DXF'e yazar.
+
+    Args:
+        backend: "ezdxf" (bellekte belge, R2010), "stream" (doğrudan dosyaya
+            akan R12 yazıcı; büyük planlarda çok daha hızlı ve az bellekli)
+            veya "memory" (dosyasız yakalama, doğrulama betikleri için)
+        cache: Ardışık çıktılarda döşeme çizimlerini yeniden kullanmak için
+        blocks: True ise tekrar eden şekiller (pilye, hat, kiriş, döşeme sınırı)
+            bir kez BLOCK olarak tanımlanır ve INSERT ile yerleştirilir
+        binary: True ise ikili (binary) DXF yazılır; koordinat ağırlıklı
+            çizimlerde ASCII'den küçük ve daha hızlı açılır
+
+    Returns:
+        Kullanılan yazıcı; backend="memory" ise dosya yazılmaz (filename
+        yok sayılır) ve çizim bu yazıcıda DXF koordinatlarında kalır
+    """
+    backends = DXF_BINARY_BACKENDS if binary else DXF_BACKENDS
+    w = backends[backend](max_height=_plan_height_mm(system, real_slabs))
 
-        kind = dcache.get("kind")
+    for name, color, weight in LAYER_DEFS:
+        w.add_layer(name, color=color, lineweight=weight)
 
-        if kind == "ONEWAY":
-            _draw_oneway_reinforcement_detail(w, sid, s, dcache, x0, y0, x1, y1, bw_mm, slab_index=idx)
+    geoms = plan_geometry(system, design_cache, bw_val, real_slabs, cache)
+    if blocks:
+        replay_blocks(geoms, w)
+    else:
+        for geom in geoms:
+            geom.replay(w)
 
-        elif kind == "TWOWAY":
-            _draw_twoway_reinforcement_detail(w, sid, s, dcache, x0, y0, x1, y1, bw_mm, slab_index=idx, system=system)
+    w.save(filename)
+    return w
 
-        elif kind == "BALCONY":
-            _draw_balcony_reinforcement_detail(w, sid, s, dcache, x0, y0, x1, y1, bw_mm)
 
-    w.save(filename)
+def export_to_svg(system: SlabSystem, filename: str, design_cache: Dict[str, SlabDesign], bw_val: float,
+                  real_slabs: dict = None, cache: Optional[DrawingCache] = None):
+    """Planı DXF ile aynı çizimle SVG'ye yazar (mm, Y aşağı)."""
+    write_svg(plan_geometry(system, design_cache, bw_val, real_slabs, cache), filename, LAYER_COLORS)
 
 
 def _draw_twoway_reinforcement_detail(
     w: _DXFWriter,
     sid: str,
     s: Slab,
-    dcache: dict,
+    dcache: SlabDesign,
     x0: float, y0: float, x1: float, y1: float,
     bw_mm: float,
     slab_index: int = 0,
@@ -769,9 +1297,9 @@ def _draw_twoway_reinforcement_detail(
     Çift doğrultulu döşeme için detaylı donatı krokisi çizer.
     Hem X hem Y yönünde ana donatı (düz + pilye) bulunur.
     """
-    cover = float(dcache.get("cover_mm", 25.0))
-    choices = dcache.get("choices", {})
-    edge_cont = dcache.get("edge_continuity", {})
+    cover = float(dcache.cover_mm)
+    choices = dcache.choices
+    edge_cont = dcache.edge_continuity
 
     # İç sınırlar (pas payı düşülmüş)
     ix0, iy0, ix1, iy1 = x0 + cover, y0 + cover, x1 - cover, y1 - cover
@@ -784,10 +1312,10 @@ def _draw_twoway_reinforcement_detail(
     midy = (iy0 + iy1) / 2.0
 
     # Süreklilik durumları (True=Sürekli, False=Süreksiz)
-    cont_L = edge_cont.get("L", False)
-    cont_R = edge_cont.get("R", False)
-    cont_T = edge_cont.get("T", False)
-    cont_B = edge_cont.get("B", False)
+    cont_L = edge_cont.L
+    cont_R = edge_cont.R
+    cont_T = edge_cont.T
+    cont_B = edge_cont.B
 
     # Kanca uzunluğu (düz ve pilye için aynı kanca boyu)
     hook_len = bw_mm - 30.0 
@@ -799,9 +1327,9 @@ def _draw_twoway_reinforcement_detail(
     # =========================================================
     # 1. X YÖNÜ DONATILARI (Yatay Çizilenler)
     # =========================================================
-    ch_x_duz = choices.get("x_span_duz")
-    ch_x_pilye = choices.get("x_span_pilye")
-    ch_x_ek = choices.get("x_support_extra")
+    ch_x_duz = choices.x_span_duz
+    ch_x_pilye = choices.x_span_pilye
+    ch_x_ek = choices.x_support_extra
 
     # Spacing hesapla (Offset için)
     # Düz ve Pilye arası mesafe 's' kadar olsun. 
@@ -872,9 +1400,9 @@ def _draw_twoway_reinforcement_detail(
     # =========================================================
     # 2. Y YÖNÜ DONATILARI (Dikey Çizilenler)
     # =========================================================
-    ch_y_duz = choices.get("y_span_duz")
-    ch_y_pilye = choices.get("y_span_pilye")
-    ch_y_ek = choices.get("y_support_extra")
+    ch_y_duz = choices.y_span_duz
+    ch_y_pilye = choices.y_span_pilye
+    ch_y_ek = choices.y_support_extra
 
     # Spacing
     sy = ch_y_pilye.s_mm if ch_y_pilye else 200.0
@@ -1049,7 +1577,7 @@ def _draw_balcony_reinforcement_detail(
     w: _DXFWriter,
     sid: str,
     s: Slab,
-    dcache: dict,
+    dcache: SlabDesign,
     x0: float, y0: float, x1: float, y1: float,
     bw_mm: float
 ):
@@ -1059,7 +1587,7 @@ def _draw_balcony_reinforcement_detail(
     - Serbest kenarda kanca yapar (AŞAĞI/İÇE).
     - Dağıtma donatısı diğer yönde.
     """
-    cover = float(dcache.get("cover_mm", 25.0))
+    cover = float(dcache.cover_mm)
     ix0, iy0, ix1, iy1 = x0 + cover, y0 + cover, x1 - cover, y1 - cover
     midx = (ix0 + ix1) / 2.0
     midy = (iy0 + iy1) / 2.0
@@ -1067,10 +1595,10 @@ def _draw_balcony_reinforcement_detail(
     Lx = ix1 - ix0
     Ly = iy1 - iy0
     
-    choices = dcache.get("choices", {})
-    ch_main = choices.get("main")
-    ch_dist = choices.get("dist")
-    fixed = dcache.get("fixed_edge", "L") # Hangi kenar ankastre (bina tarafı)
+    choices = dcache.choices
+    ch_main = choices.main
+    ch_dist = choices.dist
+    fixed = dcache.fixed_edge or "L" # Hangi kenar ankastre (bina tarafı)
 
     beam_ext = bw_mm - 30.0
     hook_len = bw_mm - 30.0
@@ -1166,7 +1694,7 @@ def _get_neighbor_id_on_edge(system, sid, edge):
         neigh_set = system.neighbor_slabs_on_side(sid, "X" if edge in "LR" else "Y", "START" if edge in "LT" else "END")
         # Genelde 1 komşu vardır ama set döner. İlkini alalım.
         if neigh_set:
-            nid = list(neigh_set)[0]
+            nid = min(neigh_set)  # Birden çok komşuda sabit seçim (küme sırası sürece göre değişir)
             nkind = system.slabs[nid].kind
             return nid, nkind
     except:
@@ -1281,3 +1809,14 @@ def _draw_hat_bar(w, cx, cy, bw_mm, choice, L_ext_left, L_ext_right, axis="X"):
         
         w.add_polyline(pts, layer="REB_EK_MESNET")
         w.add_text(x_main - 30, cy, f"Ek {choice.label()}", height=100, layer="TEXT", rotation=90, center=True)
+
+
+# =========================================================
+# Döşeme tipi kaydı: DXF donatı detayı çizicileri
+# =========================================================
+register_slab_kind("ONEWAY", draw=lambda w, sid, s, d, box, bw_mm, idx, system:
+                   _draw_oneway_reinforcement_detail(w, sid, s, d, *box, bw_mm, slab_index=idx))
+register_slab_kind("TWOWAY", draw=lambda w, sid, s, d, box, bw_mm, idx, system:
+                   _draw_twoway_reinforcement_detail(w, sid, s, d, *box, bw_mm, slab_index=idx, system=system))
+register_slab_kind("BALCONY", draw=lambda w, sid, s, d, box, bw_mm, idx, system:
+                   _draw_balcony_reinforcement_detail(w, sid, s, d, *box, bw_mm))
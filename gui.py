@@ -1,8 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, simpledialog, messagebox
 import os
-import math
-from typing import Tuple, Optional, Dict
+import queue
+from typing import Tuple, Optional, Dict, Set, Iterable, List, TYPE_CHECKING
+import bisect
 
 from constants import CONCRETE_FCK, STEEL_FYK
 from struct_design import (
@@ -11,13 +12,34 @@ from struct_design import (
     rho_min_oneway
 )
 from slab_model import SlabSystem, Slab, color_for_id, clamp, rect_normalize
-from dxf_out import export_to_dxf
+from slab_kinds import slab_kind_names
 
 # Yeni modüller - hesap ve raporlama
-from oneway_slab import compute_oneway_report
-from twoway_slab import compute_twoway_report
-from moment_balance_slab import balance_support_moments
-from balcony_slab import compute_balcony_report
+# Hesap (numpy) ve DXF (ezdxf) modülleri pencere açılışını yavaşlatmasın diye
+# ilk kullanıldıkları yerde yüklenir.
+if TYPE_CHECKING:
+    from load_cases import SlabLoads
+    from solve_runner import SolveParams, SolveResult, SolveWorker
+from spatial_index import SpatialIndex
+from report_view import ReportModel, VirtualReportView
+from plan_history import PlanHistory, PlanSnapshot
+
+# Arka plan hesabının kuyruk okuma aralığı (ms)
+SOLVE_POLL_MS = 50
+# Canlı hesapta son düzenlemeden sonra bekleme süresi (ms)
+LIVE_DEBOUNCE_MS = 100
+
+# Yakınlaştırma: tekerlek adımı ve ölçek sınırları (px/m)
+ZOOM_STEP = 1.2
+MIN_SCALE, MAX_SCALE = 0.5, 2000.0
+# Ayrıntı düzeyi: ekrandaki döşeme boyutu (px) bu sınırların altındaysa çizilmez
+LOD_OUTLINE_PX = 8     # Kalın kenar çizgisi
+LOD_DIM_PX = 30        # Boyut çizgileri
+LOD_LABEL_W_PX, LOD_LABEL_H_PX = 50, 40   # ID/tip/boyut etiketi
+LOD_REBAR_H_PX = 100   # Donatı etiketi
+LOD_DETAIL_PX = 250    # DXF ile aynı donatı detayı
+# Görünüm dışındaki boyut çizgileri için kenar payı (px)
+CULL_MARGIN_PX = 40
 
 # ---------------------------------------------------------------------------
 # Gerçek koordinat tabanlı döşeme bilgisi (metre cinsinden)
@@ -25,7 +47,7 @@ from balcony_slab import compute_balcony_report
 class RealSlab:
     """Metre cinsinden gerçek koordinatlarla döşeme."""
     def __init__(self, sid: str, x: float, y: float, w: float, h: float,
-                 kind: str, pd: float, b: float):
+                 kind: str, pd: float, b: float, loads: Optional["SlabLoads"] = None):
         self.sid = sid
         self.x = x      # sol üst köşe X (metre)
         self.y = y      # sol üst köşe Y (metre)
@@ -34,6 +56,7 @@ class RealSlab:
         self.kind = kind
         self.pd = pd
         self.b = b
+        self.loads = loads  # Yük durumları (None: yalnızca pd)
 
     def edges(self):
         """L, R, T, B kenarlarının (x0,y0,x1,y1) koordinatları."""
@@ -77,16 +100,54 @@ class App(tk.Tk):
         self.mode = tk.StringVar(value="PLACE_ONEWAY")
         self.last_design = {}
 
+        # Mesnet dengelemesi: False -> TS500 tek adım, True -> iteratif moment dağıtma
+        self.iterative_balance = tk.BooleanVar(value=False)
+        self.last_distribution = None  # Sonraki çözüm için başlangıç değeri
+
+        # TWOWAY momentleri: False -> katsayı yöntemi, True -> sonlu farklar plak çözümü
+        self.plate_solver = tk.BooleanVar(value=False)
+
+        # Arka plan hesabı: her düzenleme plan sürümünü artırır
+        self.plan_version = 0
+        self.solve_worker = None
+        self.last_result = None       # Son SolveResult (artımlı hesap için)
+
+        # Canlı hesap: her düzenlemeden LIVE_DEBOUNCE_MS sonra etkilenen döşemeler hesaplanır
+        self.live_mode = tk.BooleanVar(value=False)
+        self._live_after = None
+        self._dirty: Set[str] = set()         # Son hesaptan beri düzenlenen döşemeler
+        self._slab_sigs: Dict[str, tuple] = {}
+        self._beam_sig: frozenset = frozenset()
+
+        # Döşeme listesi satırları (sıralı ID'ler ve gösterilen metinler)
+        self._list_sids: List[str] = []
+        self._list_labels: Dict[str, str] = {}
+
         # Orantılı çizim verileri
         self.real_slabs: Dict[str, RealSlab] = {}
+        self.slab_index = SpatialIndex()  # real_slabs ile _collect_dirty'de eşitlenir
         self.scale = 80.0             # metre -> pixel
         self.canvas_pad = 60          # kenar boşluğu (px)
+        self.view = None              # None: planı sığdır, (scale, origin_x, origin_y): kullanıcı görünümü
+        self._pan_last = None
         self.highlighted_edge = None  # (sid, edge_name) or None
         self.selected_edge = None     # (sid, edge_name) or None
 
+        # Kalıcı canvas öğeleri: çizildikleri ölçek/orijin ve döşeme imzaları
+        self._drawn_view = None
+        self._drawn_slabs: Dict[str, tuple] = {}
+        self._drawn_beams: Dict[tuple, int] = {}
+        self.drawing_cache = None  # dxf_out.DrawingCache: ekran detayı ve DXF çıktısı paylaşır
+
         # Kiriş kenarları: set of normalized edge tuples ((x0,y0,x1,y1))
         self.beam_edges: set = set()
 
+        # Geri al / yinele: real_slabs ve beam_edges anlık görüntülerle paylaşılır,
+        # ilk değişiklikten önce kopyalanır (_begin_edit)
+        self.history = PlanHistory()
+        self._plan_shared = False
+        self.history.reset(self._snapshot())
+
         # Yeni döşeme boyutu dialogda kullanılacak
         self.new_slab_width = tk.DoubleVar(value=4.0)
         self.new_slab_height = tk.DoubleVar(value=5.0)
@@ -127,12 +188,8 @@ class App(tk.Tk):
         # Tools
         tools = ttk.LabelFrame(top, text="Araçlar")
         tools.pack(side="left", padx=10)
-        modes = [
-            ("ONEWAY", "PLACE_ONEWAY"),
-            ("TWOWAY", "PLACE_TWOWAY"),
-            ("BALCONY", "PLACE_BALCONY"),
-            ("Kiriş Ekle/Sil", "BEAM"),
-        ]
+        modes = [(kind, f"PLACE_{kind}") for kind in slab_kind_names()]
+        modes.append(("Kiriş Ekle/Sil", "BEAM"))
         for i, (txt, val) in enumerate(modes):
             ttk.Radiobutton(tools, text=txt, variable=self.mode, value=val).grid(
                 row=0, column=i, sticky="w", padx=4)
@@ -143,6 +200,15 @@ class App(tk.Tk):
         ttk.Button(act, text="Hesapla", command=self.compute_and_report).pack(fill="x", pady=1)
         ttk.Button(act, text="DXF", command=self.export_dxf_and_open).pack(fill="x", pady=1)
         ttk.Button(act, text="Temizle", command=self.reset_all).pack(fill="x", pady=1)
+        ttk.Button(act, text="Geri Al", command=self.undo).pack(fill="x", pady=1)
+        ttk.Button(act, text="Yinele", command=self.redo).pack(fill="x", pady=1)
+        ttk.Button(act, text="Sığdır", command=self.fit_view).pack(fill="x", pady=1)
+        ttk.Checkbutton(act, text="Moment dağıtma (iteratif)",
+                        variable=self.iterative_balance).pack(fill="x", pady=1)
+        ttk.Checkbutton(act, text="Plak çözücü (FD)",
+                        variable=self.plate_solver).pack(fill="x", pady=1)
+        ttk.Checkbutton(act, text="Canlı hesap",
+                        variable=self.live_mode).pack(fill="x", pady=1)
 
         # Main Area
         mid = ttk.Frame(self)
@@ -157,6 +223,17 @@ class App(tk.Tk):
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.canvas.bind("<Motion>", self.on_canvas_motion)
         self.canvas.bind("<Configure>", lambda e: self.redraw())
+        # Yakınlaştırma (Windows/macOS tekerlek, X11 düğme 4/5) ve orta/sağ tuşla kaydırma
+        self.canvas.bind("<MouseWheel>", self.on_canvas_wheel)
+        self.canvas.bind("<Button-4>", self.on_canvas_wheel)
+        self.canvas.bind("<Button-5>", self.on_canvas_wheel)
+        for btn in (2, 3):
+            self.canvas.bind(f"<ButtonPress-{btn}>", self.on_pan_start)
+            self.canvas.bind(f"<B{btn}-Motion>", self.on_pan_drag)
+        self.canvas.bind("<Double-Button-2>", lambda e: self.fit_view())
+        self.bind("<Control-z>", lambda e: self.undo())
+        self.bind("<Control-y>", lambda e: self.redo())
+        self.bind("<Control-Shift-Z>", lambda e: self.redo())
 
         right = ttk.Frame(mid, width=500)
         right.pack(side="left", fill="y", padx=10)
@@ -166,16 +243,39 @@ class App(tk.Tk):
         list_frame.pack(fill="x")
         self.slab_list = tk.Listbox(list_frame, height=8, font=("Consolas", 9))
         self.slab_list.pack(fill="x", padx=4, pady=4)
-        ttk.Button(list_frame, text="Seçiliyi Sil", command=self.delete_selected_slab).pack(pady=2)
-
-        self.output = tk.Text(right, wrap="word", height=30, font=("Consolas", 9))
-        self.output.pack(fill="both", expand=True, pady=5)
+        self.slab_list.bind("<<ListboxSelect>>", self.on_slab_list_select)
+        btns = ttk.Frame(list_frame)
+        btns.pack(pady=2)
+        ttk.Button(btns, text="Seçiliyi Sil", command=self.delete_selected_slab).pack(side="left", padx=2)
+        ttk.Button(btns, text="Yükler...", command=self.edit_selected_loads).pack(side="left", padx=2)
+
+        self.progress = ttk.Progressbar(right, mode="determinate")
+        self.progress.pack(fill="x", pady=(5, 0))
+        self.progress_label = ttk.Label(right, text="")
+        self.progress_label.pack(anchor="w")
+
+        # Rapor: model widget dışında tutulur, yalnızca görünen satırlar çizilir
+        flt = ttk.Frame(right)
+        flt.pack(fill="x", pady=(5, 0))
+        ttk.Label(flt, text="Filtre:").pack(side="left")
+        self.report_filter = tk.StringVar(value="")
+        ttk.Entry(flt, textvariable=self.report_filter).pack(side="left", fill="x", expand=True, padx=4)
+        self.report_filter.trace_add("write", lambda *_: self.report_view.set_filter(self.report_filter.get()))
+
+        self.report_view = VirtualReportView(right, height=30, font=("Consolas", 9))
+        self.report_view.pack(fill="both", expand=True, pady=5)
 
     # =========================================================
     # Orantılı çizim yardımcıları
     # =========================================================
     def _compute_scale(self):
-        """Canvas boyutuna göre ölçek hesapla - tüm döşemeler sığacak şekilde."""
+        """
+        Ölçek ve orijini belirle. Kullanıcı yakınlaştırdı/kaydırdıysa o görünüm
+        korunur; aksi halde canvas boyutuna göre tüm döşemeler sığdırılır.
+        """
+        if self.view is not None:
+            self.scale, self.origin_x, self.origin_y = self.view
+            return
         if not self.real_slabs:
             return
 
@@ -225,9 +325,15 @@ class App(tk.Tk):
     # Çizim
     # =========================================================
     def redraw(self):
-        self.canvas.delete("all")
-
+        """
+        Canvas'ı planla eşitler. Öğeler kalıcıdır ve etiketlidir
+        (slab:<sid>, beam, hover, selected); yalnızca görünümdeki döşeme ve
+        kirişler çizilir, imzası değişenler ve görünüme girip çıkanlar güncellenir.
+        Kaydırmada öğeler taşınır; ölçek değişirse (yakınlaştırma, pencere
+        boyutu, plan sınırları) tümü yeniden kurulur.
+        """
         if not self.real_slabs:
+            self._clear_canvas()
             # Boş canvas - yardım mesajı
             cw = self.canvas.winfo_width()
             ch = self.canvas.winfo_height()
@@ -236,118 +342,197 @@ class App(tk.Tk):
                     cw / 2, ch / 2,
                     text="Lx ve Ly değerlerini girip 'Döşeme Ekle' butonuna basın\n"
                          "veya mevcut döşemenin kenarına tıklayarak komşu döşeme ekleyin.",
-                    font=("Arial", 12), fill="#999999", justify="center")
+                    font=("Arial", 12), fill="#999999", justify="center", tags=("help",))
             return
 
+        self.canvas.delete("help")
         self._compute_scale()
+        if self._drawn_view is None or self.scale != self._drawn_view[0]:
+            self._clear_canvas()
+        else:
+            dx = self.origin_x - self._drawn_view[1]
+            dy = self.origin_y - self._drawn_view[2]
+            if dx or dy:
+                self.canvas.move("all", dx, dy)
+        self._drawn_view = (self.scale, self.origin_x, self.origin_y)
+
+        # Görünüm penceresi (metre), boyut çizgileri için paylı
+        pad = CULL_MARGIN_PX / self.scale
+        vx0, vy0 = self.px_to_m(0, 0)
+        vx1, vy1 = self.px_to_m(self.canvas.winfo_width(), self.canvas.winfo_height())
+        visible_order = self.slab_index.query_rect(vx0 - pad, vy0 - pad, vx1 + pad, vy1 + pad)
+        visible = set(visible_order)
+
+        changed = False
+
+        # Döşemeler: kaldırılan, görünümden çıkan veya imzası değişenlerin öğelerini sil
+        for sid in list(self._drawn_slabs):
+            rs = self.real_slabs.get(sid)
+            if sid not in visible or rs is None or self._slab_draw_sig(rs) != self._drawn_slabs[sid]:
+                self.canvas.delete(f"slab:{sid}")
+                del self._drawn_slabs[sid]
+        for sid in visible_order:
+            if sid not in self._drawn_slabs:
+                rs = self.real_slabs[sid]
+                self._draw_slab(rs)
+                self._drawn_slabs[sid] = self._slab_draw_sig(rs)
+                changed = True
+
+        # Kirişler (kalın siyah çizgi)
+        beams = {k for k in self.beam_edges
+                 if k[0] <= vx1 and vx0 <= k[2] and k[1] <= vy1 and vy0 <= k[3]}
+        for edge_key in list(self._drawn_beams):
+            if edge_key not in beams:
+                self.canvas.delete(self._drawn_beams.pop(edge_key))
+        for edge_key in beams:
+            if edge_key not in self._drawn_beams:
+                self._drawn_beams[edge_key] = self._draw_beam_line(edge_key)
+                changed = True
+
+        # Yeni döşeme öğeleri kirişlerin altında kalmalı
+        if changed:
+            self.canvas.tag_raise("beam")
+
+        self._update_edge_overlays()
+
+    def _clear_canvas(self):
+        """Tüm öğeleri siler ve çizim kayıtlarını sıfırlar."""
+        self.canvas.delete("all")
+        self._drawn_view = None
+        self._drawn_slabs = {}
+        self._drawn_beams = {}
 
-        # Döşemeleri çiz
-        for sid, rs in self.real_slabs.items():
-            self._draw_slab(rs)
+    def _slab_draw_sig(self, rs: RealSlab) -> tuple:
+        """Döşeme çizimini belirleyen değerler; değişirse öğeleri yeniden çizilir."""
+        return (rs.x, rs.y, rs.w, rs.h, rs.kind, self.last_design.get(rs.sid))
 
-        # Kirişleri çiz (kalın siyah çizgi)
-        for edge_key in self.beam_edges:
-            self._draw_beam_line(edge_key)
+    def _update_edge_overlays(self):
+        """Vurgulanan ve seçilen kenar çizgilerini günceller (yalnızca iki öğe)."""
+        color = "#0066FF" if self.mode.get() == "BEAM" else "#FF6600"
+        self._set_edge_overlay("hover", self.highlighted_edge, color=color, width=4)
+        self._set_edge_overlay("selected", self.selected_edge, color="#FF0000", width=5)
 
-        # Vurgulanan kenarı çiz
-        if self.highlighted_edge:
-            sid, edge = self.highlighted_edge
-            if sid in self.real_slabs:
-                color = "#0066FF" if self.mode.get() == "BEAM" else "#FF6600"
-                self._draw_edge_highlight(self.real_slabs[sid], edge, color=color, width=4)
+    def _set_edge_overlay(self, tag: str, edge_info: Optional[Tuple[str, str]], color: str, width: int):
+        """
+        Etiketli tek bir kenar çizgisini taşır/gizler; öğe yoksa oluşturur.
 
-        # Seçilen kenarı çiz
-        if self.selected_edge:
-            sid, edge = self.selected_edge
-            if sid in self.real_slabs:
-                self._draw_edge_highlight(self.real_slabs[sid], edge, color="#FF0000", width=5)
+        Args:
+            tag: "hover" veya "selected"
+            edge_info: (sid, edge_name) veya None
+        """
+        if edge_info is None or edge_info[0] not in self.real_slabs:
+            self.canvas.itemconfigure(tag, state="hidden")
+            return
+        sid, edge = edge_info
+        ex0, ey0, ex1, ey1 = self.real_slabs[sid].edges()[edge]
+        px0, py0 = self.m_to_px(ex0, ey0)
+        px1, py1 = self.m_to_px(ex1, ey1)
+        if self.canvas.find_withtag(tag):
+            self.canvas.coords(tag, px0, py0, px1, py1)
+            self.canvas.itemconfigure(tag, fill=color, width=width, state="normal")
+        else:
+            self.canvas.create_line(px0, py0, px1, py1, fill=color, width=width, tags=(tag,))
+        self.canvas.tag_raise(tag)
 
     def _draw_slab(self, rs: RealSlab):
-        """Tek bir döşemeyi orantılı çiz."""
+        """Tek bir döşemeyi orantılı çiz; küçük görünen döşemelerde ayrıntılar atlanır."""
         x0, y0 = self.m_to_px(rs.x, rs.y)
         x1, y1 = self.m_to_px(rs.x + rs.w, rs.y + rs.h)
+        w_px, h_px = x1 - x0, y1 - y0
 
         fill_color = color_for_id(rs.sid)
+        tags = (f"slab:{rs.sid}",)
 
         # Dolgu
-        self.canvas.create_rectangle(x0, y0, x1, y1, fill=fill_color,
-                                     outline="#333333", width=2)
+        self.canvas.create_rectangle(x0, y0, x1, y1, fill=fill_color, outline="#333333",
+                                     width=2 if min(w_px, h_px) >= LOD_OUTLINE_PX else 1, tags=tags)
 
         # Etiket
         cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
-        label = f"{rs.sid}\n{rs.kind}\n{rs.w:.2f}×{rs.h:.2f} m"
-        self.canvas.create_text(cx, cy, text=label,
-                                font=("Arial", 10, "bold"), justify="center")
+        if w_px >= LOD_LABEL_W_PX and h_px >= LOD_LABEL_H_PX:
+            label = f"{rs.sid}\n{rs.kind}\n{rs.w:.2f}×{rs.h:.2f} m"
+            self.canvas.create_text(cx, cy, text=label,
+                                    font=("Arial", 10, "bold"), justify="center", tags=tags)
+
+        # Yakın görünümde DXF ile aynı donatı detayı, aksi halde son hesaptan donatı etiketi
+        detail = (min(w_px, h_px) >= LOD_DETAIL_PX and rs.sid in self.last_design
+                  and rs.sid in self.system.slabs)
+        if detail:
+            self._draw_slab_detail(rs.sid, tags)
+        rebar = (self._rebar_label(rs.sid)
+                 if not detail and h_px >= LOD_REBAR_H_PX and w_px >= LOD_LABEL_W_PX else "")
+        if rebar:
+            self.canvas.create_text(cx, cy + 30, text=rebar, font=("Consolas", 8),
+                                    fill="#003399", justify="center", tags=tags)
+
+        if min(w_px, h_px) < LOD_DIM_PX:
+            return
 
         # Boyut çizgileri (kenar dışında)
         dim_offset = 18
         # Üst kenar - genişlik
         self.canvas.create_line(x0, y0 - dim_offset, x1, y0 - dim_offset,
-                                fill="#666666", width=1, arrow="both")
+                                fill="#666666", width=1, arrow="both", tags=tags)
         self.canvas.create_text((x0 + x1) / 2, y0 - dim_offset - 10,
-                                text=f"{rs.w:.2f} m", font=("Arial", 8), fill="#666666")
+                                text=f"{rs.w:.2f} m", font=("Arial", 8), fill="#666666", tags=tags)
         # Sol kenar - yükseklik
         self.canvas.create_line(x0 - dim_offset, y0, x0 - dim_offset, y1,
-                                fill="#666666", width=1, arrow="both")
+                                fill="#666666", width=1, arrow="both", tags=tags)
         self.canvas.create_text(x0 - dim_offset - 10, (y0 + y1) / 2,
                                 text=f"{rs.h:.2f} m", font=("Arial", 8), fill="#666666",
-                                angle=90)
-
-    def _draw_edge_highlight(self, rs: RealSlab, edge: str, color: str, width: int):
-        """Bir döşemenin belirli kenarını vurgula."""
-        edges = rs.edges()
-        ex0, ey0, ex1, ey1 = edges[edge]
-        px0, py0 = self.m_to_px(ex0, ey0)
-        px1, py1 = self.m_to_px(ex1, ey1)
-        self.canvas.create_line(px0, py0, px1, py1, fill=color, width=width)
+                                angle=90, tags=tags)
+
+    def _draw_slab_detail(self, sid: str, tags: tuple):
+        """Döşemenin donatı detayını DXF çıktısıyla aynı ara temsilden çizer."""
+        from dxf_out import LAYER_COLORS, slab_boxes
+        from drawing_ir import draw_tk
+        bw_mm = self.bw.get() * 1000.0
+        # Ara temsil ölçekten bağımsızdır; yakınlaştırma/kaydırmada önbellekten gelir
+        _, box = slab_boxes(self.system, sid, bw_mm, real_slabs=self.real_slabs)
+        geom = self._get_drawing_cache().slab(self.system, sid, self.last_design[sid], box, bw_mm)
+        draw_tk(geom, self.canvas, lambda x, y: self.m_to_px(x / 1000.0, y / 1000.0),
+                self.scale / 1000.0, tags, LAYER_COLORS)
+
+    def _get_drawing_cache(self):
+        """Döşeme çizim önbelleği (dxf_out ilk kullanımda yüklenir)."""
+        if self.drawing_cache is None:
+            from dxf_out import DrawingCache
+            self.drawing_cache = DrawingCache()
+        return self.drawing_cache
+
+    def _rebar_label(self, sid: str) -> str:
+        """Döşemenin son hesaptaki açıklık donatılarını kısa metin olarak döndürür."""
+        d = self.last_design.get(sid)
+        if d is None:
+            return ""
+        ch = d.choices
+        if d.kind == "TWOWAY":
+            parts = [f"X: {ch.x_span.label()}" if ch.x_span else "",
+                     f"Y: {ch.y_span.label()}" if ch.y_span else ""]
+        else:
+            parts = [ch.main.label() if ch.main else "",
+                     f"dağ. {ch.dist.label()}" if ch.dist else ""]
+        return "\n".join(p for p in parts if p)
 
-    def _draw_beam_line(self, edge_key):
-        """Kiriş çizgisini kalın siyah çizgi olarak çiz."""
+    def _draw_beam_line(self, edge_key) -> int:
+        """Kiriş çizgisini kalın siyah çizgi olarak çiz; öğe kimliğini döndürür."""
         x0, y0, x1, y1 = edge_key
         px0, py0 = self.m_to_px(x0, y0)
         px1, py1 = self.m_to_px(x1, y1)
-        self.canvas.create_line(px0, py0, px1, py1, fill="#111111", width=5)
+        return self.canvas.create_line(px0, py0, px1, py1, fill="#111111", width=5, tags=("beam",))
 
     # =========================================================
     # Kenar algılama
     # =========================================================
     def _find_nearest_edge(self, px: float, py: float, threshold_px: float = 15.0) -> Optional[Tuple[str, str]]:
-        """Tıklanan noktaya en yakın döşeme kenarını bul."""
+        """Tıklanan noktaya en yakın döşeme kenarını bul (mekânsal indeksle)."""
         mx, my = self.px_to_m(px, py)
-        best_dist = float('inf')
-        best = None
-
-        for sid, rs in self.real_slabs.items():
-            edges = rs.edges()
-            for edge_name, (ex0, ey0, ex1, ey1) in edges.items():
-                dist = self._point_to_segment_dist(mx, my, ex0, ey0, ex1, ey1)
-                dist_px = dist * self.scale
-                if dist_px < threshold_px and dist_px < best_dist:
-                    best_dist = dist_px
-                    best = (sid, edge_name)
-
-        return best
-
-    def _point_to_segment_dist(self, px, py, x0, y0, x1, y1) -> float:
-        """Noktanın doğru parçasına uzaklığı (metre)."""
-        dx = x1 - x0
-        dy = y1 - y0
-        len_sq = dx * dx + dy * dy
-        if len_sq < 1e-12:
-            return math.hypot(px - x0, py - y0)
-
-        t = max(0, min(1, ((px - x0) * dx + (py - y0) * dy) / len_sq))
-        proj_x = x0 + t * dx
-        proj_y = y0 + t * dy
-        return math.hypot(px - proj_x, py - proj_y)
+        return self.slab_index.nearest_edge(mx, my, threshold_px / self.scale)
 
     def _find_slab_at(self, px: float, py: float) -> Optional[str]:
         """Tıklanan noktadaki döşemeyi bul."""
         mx, my = self.px_to_m(px, py)
-        for sid, rs in self.real_slabs.items():
-            if rs.x <= mx <= rs.x + rs.w and rs.y <= my <= rs.y + rs.h:
-                return sid
-        return None
+        return self.slab_index.item_at(mx, my)
 
     # =========================================================
     # Mouse olayları
@@ -360,7 +545,35 @@ class App(tk.Tk):
         edge = self._find_nearest_edge(evt.x, evt.y)
         if edge != self.highlighted_edge:
             self.highlighted_edge = edge
-            self.redraw()
+            self._update_edge_overlays()
+
+    def on_canvas_wheel(self, evt):
+        """İmleç altındaki nokta sabit kalacak şekilde yakınlaştır/uzaklaştır."""
+        if not self.real_slabs:
+            return
+        zoom_in = evt.num == 4 or getattr(evt, "delta", 0) > 0
+        scale = self.scale * (ZOOM_STEP if zoom_in else 1.0 / ZOOM_STEP)
+        scale = min(max(scale, MIN_SCALE), MAX_SCALE)
+        mx, my = self.px_to_m(evt.x, evt.y)
+        self.view = (scale, evt.x - mx * scale, evt.y - my * scale)
+        self.redraw()
+
+    def on_pan_start(self, evt):
+        self._pan_last = (evt.x, evt.y)
+
+    def on_pan_drag(self, evt):
+        """Görünümü fare ile kaydır."""
+        if self._pan_last is None or not self.real_slabs:
+            return
+        dx, dy = evt.x - self._pan_last[0], evt.y - self._pan_last[1]
+        self._pan_last = (evt.x, evt.y)
+        self.view = (self.scale, self.origin_x + dx, self.origin_y + dy)
+        self.redraw()
+
+    def fit_view(self):
+        """Kullanıcı görünümünü bırakıp tüm planı sığdır."""
+        self.view = None
+        self.redraw()
 
     def on_canvas_click(self, evt):
         """Canvas'a tıklandığında moda göre işlem yap."""
@@ -370,7 +583,7 @@ class App(tk.Tk):
         edge = self._find_nearest_edge(evt.x, evt.y)
         if not edge:
             self.selected_edge = None
-            self.redraw()
+            self._update_edge_overlays()
             return
 
         if self.mode.get() == "BEAM":
@@ -379,7 +592,7 @@ class App(tk.Tk):
         else:
             # Döşeme modu: kenar seç ve komşu döşeme ekle
             self.selected_edge = edge
-            self.redraw()
+            self._update_edge_overlays()
             self.after(100, lambda: self._add_adjacent_slab_dialog(edge))
 
     # =========================================================
@@ -398,6 +611,7 @@ class App(tk.Tk):
         """Kenardaki kirişi ekle veya kaldır."""
         sid, edge_name = edge_info
         key = self._edge_to_key(sid, edge_name)
+        self._begin_edit()
         if key in self.beam_edges:
             self.beam_edges.discard(key)
         else:
@@ -426,11 +640,8 @@ class App(tk.Tk):
                 return
             self._delete_real_slab(sid)
 
-        kind = "ONEWAY"
-        if "TWOWAY" in self.mode.get():
-            kind = "TWOWAY"
-        if "BALCONY" in self.mode.get():
-            kind = "BALCONY"
+        mode = self.mode.get()
+        kind = mode[len("PLACE_"):] if mode.startswith("PLACE_") else "ONEWAY"
 
         # İlk döşeme ise (0,0); değilse mevcut döşemelerin sağına ekle
         if not self.real_slabs:
@@ -442,6 +653,7 @@ class App(tk.Tk):
             y = 0.0
 
         rs = RealSlab(sid, x, y, w, h, kind, self.pd.get(), self.b_width.get())
+        self._begin_edit()
         self.real_slabs[sid] = rs
         self._sync_to_cell_system()
         self.refresh_slab_list()
@@ -489,7 +701,7 @@ class App(tk.Tk):
         ttk.Label(frame, text="Tip:").grid(row=2, column=0, sticky="w", pady=3)
         kind_var = tk.StringVar(value=self.mode.get().replace("PLACE_", ""))
         kind_combo = ttk.Combobox(frame, textvariable=kind_var,
-                                  values=["ONEWAY", "TWOWAY", "BALCONY"], width=10)
+                                  values=slab_kind_names(), width=10)
         kind_combo.grid(row=2, column=1, pady=3)
 
         def do_add():
@@ -527,14 +739,15 @@ class App(tk.Tk):
             else:
                 return
 
-            # Çakışma kontrolü
-            for osid, ors in self.real_slabs.items():
-                if self._rects_overlap(nx, ny, nw, nh, ors.x, ors.y, ors.w, ors.h):
-                    messagebox.showerror("Hata", f"Çakışma: {osid}", parent=dlg)
-                    return
+            # Çakışma kontrolü (mekânsal indeksle)
+            overlaps = self.slab_index.overlapping((nx, ny, nw, nh))
+            if overlaps:
+                messagebox.showerror("Hata", f"Çakışma: {overlaps[0]}", parent=dlg)
+                return
 
             rs = RealSlab(new_sid, nx, ny, nw, nh, kind_var.get(),
                           self.pd.get(), self.b_width.get())
+            self._begin_edit()
             self.real_slabs[new_sid] = rs
             self.selected_edge = None
             self._sync_to_cell_system()
@@ -544,11 +757,28 @@ class App(tk.Tk):
 
         ttk.Button(dlg, text="Ekle", command=do_add).pack(pady=10)
 
-    def _rects_overlap(self, x1, y1, w1, h1, x2, y2, w2, h2) -> bool:
-        """İki dikdörtgenin çakışıp çakışmadığını kontrol et (kenar teması hariç)."""
-        eps = 0.001
-        return not (x1 + w1 <= x2 + eps or x2 + w2 <= x1 + eps or
-                    y1 + h1 <= y2 + eps or y2 + h2 <= y1 + eps)
+    def add_slabs(self, slabs: Iterable[RealSlab]):
+        """
+        Üretilmiş planlar için toplu döşeme ekleme. Tüm dikdörtgenler mekânsal
+        indeksle birlikte doğrulanır; plan yalnızca bir kez senkronize edilir.
+
+        Raises:
+            ValueError: ID çakışması veya döşemeler üst üste biniyorsa (hiçbiri eklenmez)
+        """
+        slabs = list(slabs)
+        existing = [rs.sid for rs in slabs if rs.sid in self.real_slabs]
+        if existing:
+            raise ValueError(f"Döşeme ID zaten var: {', '.join(existing[:5])}")
+        conflicts = self.slab_index.bulk_insert((rs.sid, (rs.x, rs.y, rs.w, rs.h)) for rs in slabs)
+        if conflicts:
+            pairs = ", ".join(f"{a}/{b}" for a, b in conflicts[:5])
+            raise ValueError(f"Çakışma ({len(conflicts)}): {pairs}")
+        self._begin_edit()
+        for rs in slabs:
+            self.real_slabs[rs.sid] = rs
+        self._sync_to_cell_system()
+        self.refresh_slab_list()
+        self.redraw()
 
     # =========================================================
     # Hücre sistemi senkronizasyonu
@@ -560,13 +790,14 @@ class App(tk.Tk):
         Bu, mevcut hesaplama altyapısının (oneway, twoway, balcony) 
         değişmeden çalışmasını sağlar.
         """
-        # Eski sistemdeki tüm slabları temizle
-        for sid in list(self.system.slabs.keys()):
-            self.system.delete_slab(sid)
-        self.system.V_beam.clear()
-        self.system.H_beam.clear()
-
+        # Eski sistem değiştirilmez (arka plan hesabı onu kullanıyor olabilir);
+        # her senkronizasyonda yeni bir SlabSystem kurulur.
+        self._plan_changed()
+        self._collect_dirty(self.system)
         if not self.real_slabs:
+            self.system = SlabSystem(self.system.Nx, self.system.Ny)
+            self._record_history()
+            self._schedule_live_solve()
             return
 
         # Tüm benzersiz X ve Y koordinatlarını topla
@@ -580,6 +811,8 @@ class App(tk.Tk):
 
         x_sorted = sorted(x_coords)
         y_sorted = sorted(y_coords)
+        x_pos = {v: i for i, v in enumerate(x_sorted)}
+        y_pos = {v: j for j, v in enumerate(y_sorted)}
 
         # Grid boyutunu güncelle
         self.Nx = max(len(x_sorted), 2)
@@ -588,10 +821,10 @@ class App(tk.Tk):
 
         # Her döşeme için hücre indekslerini bul
         for sid, rs in self.real_slabs.items():
-            i0 = x_sorted.index(round(rs.x, 6))
-            i1 = x_sorted.index(round(rs.x + rs.w, 6)) - 1
-            j0 = y_sorted.index(round(rs.y, 6))
-            j1 = y_sorted.index(round(rs.y + rs.h, 6)) - 1
+            i0 = x_pos[round(rs.x, 6)]
+            i1 = x_pos[round(rs.x + rs.w, 6)] - 1
+            j0 = y_pos[round(rs.y, 6)]
+            j1 = y_pos[round(rs.y + rs.h, 6)] - 1
 
             if i1 < i0:
                 i1 = i0
@@ -604,7 +837,7 @@ class App(tk.Tk):
             auto_dx = rs.w / nx_cells
             auto_dy = rs.h / ny_cells
 
-            s = Slab(sid, i0, j0, i1, j1, rs.kind, auto_dx, auto_dy, rs.pd, rs.b)
+            s = Slab(sid, i0, j0, i1, j1, rs.kind, auto_dx, auto_dy, rs.pd, rs.b, rs.loads)
             self.system.add_slab(s)
 
         # Komşu döşemeler arasındaki ortak kenarları kiriş olarak işaretle
@@ -612,29 +845,34 @@ class App(tk.Tk):
             s = self.system.slabs.get(sid)
             if not s:
                 continue
-            for osid, ors in self.real_slabs.items():
+            # Aday komşular: sağ ve alt kenara değen döşemeler (mekânsal indeksle)
+            x1, y1 = rs.x + rs.w, rs.y + rs.h
+            candidates = (self.slab_index.query_rect(x1 - 0.001, rs.y, x1 + 0.001, y1) +
+                          self.slab_index.query_rect(rs.x, y1 - 0.001, x1, y1 + 0.001))
+            for osid in dict.fromkeys(candidates):
                 if osid == sid:
                     continue
+                ors = self.real_slabs[osid]
                 # Sağ kenar = diğerinin sol kenarı
                 if abs((rs.x + rs.w) - ors.x) < 0.001:
                     # Dikey ortak kenar - V_beam ekle
-                    x_idx = x_sorted.index(round(rs.x + rs.w, 6))
+                    x_idx = x_pos[round(rs.x + rs.w, 6)]
                     ov_y_start = max(round(rs.y, 6), round(ors.y, 6))
                     ov_y_end = min(round(rs.y + rs.h, 6), round(ors.y + ors.h, 6))
                     if ov_y_end > ov_y_start:
-                        j_start = y_sorted.index(round(ov_y_start, 6))
-                        j_end_idx = y_sorted.index(round(ov_y_end, 6))
+                        j_start = y_pos[round(ov_y_start, 6)]
+                        j_end_idx = y_pos[round(ov_y_end, 6)]
                         for jj in range(j_start, j_end_idx):
                             self.system.V_beam.add((x_idx - 1, jj))
 
                 # Alt kenar = diğerinin üst kenarı
                 if abs((rs.y + rs.h) - ors.y) < 0.001:
-                    y_idx = y_sorted.index(round(rs.y + rs.h, 6))
+                    y_idx = y_pos[round(rs.y + rs.h, 6)]
                     ov_x_start = max(round(rs.x, 6), round(ors.x, 6))
                     ov_x_end = min(round(rs.x + rs.w, 6), round(ors.x + ors.w, 6))
                     if ov_x_end > ov_x_start:
-                        i_start = x_sorted.index(round(ov_x_start, 6))
-                        i_end_idx = x_sorted.index(round(ov_x_end, 6))
+                        i_start = x_pos[round(ov_x_start, 6)]
+                        i_end_idx = x_pos[round(ov_x_end, 6)]
                         for ii in range(i_start, i_end_idx):
                             self.system.H_beam.add((ii, y_idx - 1))
 
@@ -647,12 +885,12 @@ class App(tk.Tk):
                 # Dikey kiriş
                 bx_r = round(bx0, 6)
                 if bx_r in x_coords:
-                    x_idx = x_sorted.index(bx_r)
+                    x_idx = x_pos[bx_r]
                     by_start_r = round(by0, 6)
                     by_end_r = round(by1, 6)
                     if by_start_r in y_coords and by_end_r in y_coords:
-                        j_start = y_sorted.index(by_start_r)
-                        j_end = y_sorted.index(by_end_r)
+                        j_start = y_pos[by_start_r]
+                        j_end = y_pos[by_end_r]
                         for jj in range(j_start, j_end):
                             if x_idx > 0:
                                 self.system.V_beam.add((x_idx - 1, jj))
@@ -661,191 +899,353 @@ class App(tk.Tk):
                 # Yatay kiriş
                 by_r = round(by0, 6)
                 if by_r in y_coords:
-                    y_idx = y_sorted.index(by_r)
+                    y_idx = y_pos[by_r]
                     bx_start_r = round(bx0, 6)
                     bx_end_r = round(bx1, 6)
                     if bx_start_r in x_coords and bx_end_r in x_coords:
-                        i_start = x_sorted.index(bx_start_r)
-                        i_end = x_sorted.index(bx_end_r)
+                        i_start = x_pos[bx_start_r]
+                        i_end = x_pos[bx_end_r]
                         for ii in range(i_start, i_end):
                             if y_idx > 0:
                                 self.system.H_beam.add((ii, y_idx - 1))
 
+        self._record_history()
+        self._schedule_live_solve()
+
+    def _collect_dirty(self, old_system: SlabSystem):
+        """
+        Son senkronizasyondan beri değişen döşemeleri _dirty'ye ekler:
+        eklenen/silinen/değişen döşemeler, eski komşuları ve kirişi
+        değişen kenarlara sahip döşemeler.
+        """
+        from solve_runner import slab_neighbors
+        sigs = {sid: (rs.x, rs.y, rs.w, rs.h, rs.kind, rs.pd, rs.b, rs.loads)
+                for sid, rs in self.real_slabs.items()}
+        changed = {sid for sid in sigs.keys() | self._slab_sigs.keys()
+                   if sigs.get(sid) != self._slab_sigs.get(sid)}
+        for sid in changed - sigs.keys():
+            self.slab_index.remove(sid)
+        for sid, rs in self.real_slabs.items():
+            if sid in changed:
+                self.slab_index.insert(sid, (rs.x, rs.y, rs.w, rs.h))
+        beams = frozenset(self.beam_edges)
+        for bx0, by0, bx1, by1 in beams ^ self._beam_sig:
+            mx, my = (bx0 + bx1) / 2, (by0 + by1) / 2
+            for sid in self.slab_index.query_rect(mx - 0.001, my - 0.001, mx + 0.001, my + 0.001):
+                rs = self.real_slabs[sid]
+                on_x = abs(mx - rs.x) < 0.001 or abs(mx - (rs.x + rs.w)) < 0.001
+                on_y = abs(my - rs.y) < 0.001 or abs(my - (rs.y + rs.h)) < 0.001
+                inside_x = rs.x - 0.001 <= mx <= rs.x + rs.w + 0.001
+                inside_y = rs.y - 0.001 <= my <= rs.y + rs.h + 0.001
+                if (on_x and inside_y) or (on_y and inside_x):
+                    changed.add(sid)
+        for sid in list(changed):
+            if sid in old_system.slabs:
+                changed |= slab_neighbors(old_system, sid)
+        self._dirty |= changed
+        self._slab_sigs = sigs
+        self._beam_sig = beams
+
     # =========================================================
     # Slab yönetimi
     # =========================================================
     def _delete_real_slab(self, sid: str):
         """Bir döşemeyi sil."""
         if sid in self.real_slabs:
+            self._begin_edit()
             del self.real_slabs[sid]
         self._sync_to_cell_system()
 
     def reset_all(self):
-        self.real_slabs.clear()
-        self.beam_edges.clear()
-        self.system = SlabSystem(self.Nx, self.Ny)
-        self.output.delete("1.0", "end")
+        """Planı temizler (geri alınabilir)."""
+        self.real_slabs = {}
+        self.beam_edges = set()
+        self._plan_shared = False
+        self._sync_to_cell_system()
+        self.last_distribution = None
+        self.last_result = None
+        self.last_design = {}
+        self._dirty.clear()
+        self.report_view.set_model(ReportModel())
+        self.selected_edge = None
+        self.highlighted_edge = None
+        self.view = None
+        self.refresh_slab_list()
+        self.redraw()
+
+    # =========================================================
+    # Geri al / yinele
+    # =========================================================
+    def _snapshot(self) -> PlanSnapshot:
+        """Güncel planın anlık görüntüsü (kaplar kopyalanmaz, paylaşılır)."""
+        self._plan_shared = True
+        return PlanSnapshot(self.real_slabs, self._beam_sig, self.system)
+
+    def _record_history(self):
+        """Senkronize edilen planı geçmişe ekler."""
+        self.history.push(self._snapshot())
+
+    def _begin_edit(self):
+        """
+        real_slabs/beam_edges değiştirilmeden önce çağrılır: bir anlık görüntüyle
+        paylaşılıyorlarsa sığ kopyalanır (RealSlab nesneleri paylaşılmaya devam eder).
+        """
+        if self._plan_shared:
+            self.real_slabs = dict(self.real_slabs)
+            self.beam_edges = set(self.beam_edges)
+            self._plan_shared = False
+
+    def undo(self):
+        snap = self.history.undo()
+        if snap is not None:
+            self._restore(snap)
+
+    def redo(self):
+        snap = self.history.redo()
+        if snap is not None:
+            self._restore(snap)
+
+    def _restore(self, snap: PlanSnapshot):
+        """
+        Anlık görüntüyü yeniden hesap yapmadan geri yükler. Görüntüde o plana
+        ait hesap sonucu varsa rapor ve tasarımlar doğrudan ondan alınır;
+        yoksa eski plana ait tasarım ve rapor temizlenir ve değişen döşemeler
+        normal düzenlemedeki gibi işaretlenir (last_result artımlı hesap için kalır).
+        """
+        self._plan_changed()
+        old_system = self.system
+        self.real_slabs = snap.slabs
+        self.beam_edges = snap.beams
+        self.system = snap.system
+        self._plan_shared = True
+        self._collect_dirty(old_system)
         self.selected_edge = None
         self.highlighted_edge = None
+        if snap.result is not None:
+            self._dirty.clear()
+            self._apply_solve_result(snap.result)
+        elif not self.real_slabs:
+            self.last_result = None
+            self.last_design = {}
+            self._dirty.clear()
+            self.report_view.set_model(ReportModel())
+        else:
+            self.last_design = {}
+            self.report_view.set_model(ReportModel())
+            self._schedule_live_solve()
         self.refresh_slab_list()
         self.redraw()
 
     def refresh_slab_list(self):
-        self.slab_list.delete(0, "end")
-        for sid in sorted(self.real_slabs.keys()):
-            rs = self.real_slabs[sid]
-            self.slab_list.insert("end", f"{sid} ({rs.kind}) {rs.w:.2f}×{rs.h:.2f} m")
+        """Döşeme listesini günceller; yalnızca eklenen/silinen/değişen satırlara dokunur."""
+        labels = {sid: f"{sid} ({rs.kind}) {rs.w:.2f}×{rs.h:.2f} m"
+                       + (f" G={rs.loads.g:g} Q={rs.loads.q:g}" if rs.loads is not None else "")
+                  for sid, rs in self.real_slabs.items()}
+        for sid in [s for s in self._list_sids if labels.get(s) != self._list_labels[s]]:
+            i = bisect.bisect_left(self._list_sids, sid)
+            self.slab_list.delete(i)
+            del self._list_sids[i]
+            del self._list_labels[sid]
+        for sid in sorted(labels.keys() - self._list_labels.keys()):
+            i = bisect.bisect_left(self._list_sids, sid)
+            self.slab_list.insert(i, labels[sid])
+            self._list_sids.insert(i, sid)
+            self._list_labels[sid] = labels[sid]
+
+    def on_slab_list_select(self, evt=None):
+        """Listede seçilen döşemenin rapor bölümüne atla."""
+        idx = self.slab_list.curselection()
+        if idx:
+            self.report_view.jump_to(self._list_sids[idx[0]])
 
     def delete_selected_slab(self):
         idx = self.slab_list.curselection()
         if not idx:
             return
-        text = self.slab_list.get(idx[0])
-        sid = text.split()[0]
+        sid = self._list_sids[idx[0]]
         self._delete_real_slab(sid)
         self.refresh_slab_list()
         self.redraw()
 
+    def set_slab_loads(self, sid: str, loads: Optional["SlabLoads"]):
+        """
+        Döşemenin yük durumlarını ayarlar (None: yalnızca pd). Yük verilirse pd
+        tam yük kombinasyonuna eşitlenir. RealSlab anlık görüntülerle
+        paylaşıldığı için yerinde değiştirilmez, yenisiyle değiştirilir
+        (geri alınabilir).
+        """
+        rs = self.real_slabs[sid]
+        pd = loads.design_load() if loads is not None else rs.pd
+        self._begin_edit()
+        self.real_slabs[sid] = RealSlab(sid, rs.x, rs.y, rs.w, rs.h, rs.kind, pd, rs.b, loads)
+        self._sync_to_cell_system()
+        self.refresh_slab_list()
+        self.redraw()
+
+    def edit_selected_loads(self):
+        """Listede seçili döşemenin ölü / hareketli / bölme duvarı yüklerini düzenler."""
+        idx = self.slab_list.curselection()
+        if not idx:
+            return
+        sid = self._list_sids[idx[0]]
+        rs = self.real_slabs[sid]
+        from load_cases import SlabLoads, slab_loads
+        cur = slab_loads(rs)
+
+        dlg = tk.Toplevel(self)
+        dlg.title(f"{sid} Yükleri")
+        dlg.transient(self)
+        dlg.grab_set()
+
+        frame = ttk.Frame(dlg)
+        frame.pack(pady=10, padx=20, fill="x")
+        fields = [("G (kN/m²):", cur.g), ("Q (kN/m²):", cur.q), ("Bölme (kN/m²):", cur.partition)]
+        vars_ = []
+        for r, (text, value) in enumerate(fields):
+            ttk.Label(frame, text=text).grid(row=r, column=0, sticky="w", pady=3)
+            var = tk.DoubleVar(value=round(value, 3))
+            ttk.Entry(frame, textvariable=var, width=10).grid(row=r, column=1, pady=3)
+            vars_.append(var)
+
+        def do_apply():
+            try:
+                g, q, partition = (v.get() for v in vars_)
+            except tk.TclError:
+                messagebox.showerror("Hata", "Yükler sayı olmalı!", parent=dlg)
+                return
+            if min(g, q, partition) < 0 or g + q + partition <= 0:
+                messagebox.showerror("Hata", "Yükler negatif olamaz ve toplamı pozitif olmalı!", parent=dlg)
+                return
+            self.set_slab_loads(sid, SlabLoads(g, q, partition))
+            dlg.destroy()
+
+        def do_clear():
+            self.set_slab_loads(sid, None)
+            dlg.destroy()
+
+        btns = ttk.Frame(dlg)
+        btns.pack(pady=10)
+        ttk.Button(btns, text="Uygula", command=do_apply).pack(side="left", padx=4)
+        ttk.Button(btns, text="Yalnızca pd", command=do_clear).pack(side="left", padx=4)
+
     # =========================================================
     # Hesaplama (mevcut mantık korunuyor)
     # =========================================================
+    def _solve_params(self) -> "SolveParams":
+        """Hesap girdilerini Tk değişkenlerinden okur (ana iş parçacığında)."""
+        from solve_runner import SolveParams
+        return SolveParams(
+            conc=self.conc.get(), steel=self.steel.get(),
+            h=self.h_mm.get(), cover=self.cover_mm.get(), bw=self.bw.get(),
+            iterative_balance=self.iterative_balance.get(),
+            plate_solver=self.plate_solver.get(),
+            warm_start=self.last_distribution,
+        )
+
+    def _plan_changed(self):
+        """Plan düzenlendi: sürümü artır, süren hesabı iptal et."""
+        self.plan_version += 1
+        if self.solve_worker is not None:
+            self.solve_worker.cancel()
+            self._dirty |= self.solve_worker.dirty
+            self.solve_worker = None
+            self._set_progress("İptal edildi (plan değişti)", 0, 1)
+
+    def _set_progress(self, text: str, value: int, maximum: int):
+        self.progress.configure(maximum=max(maximum, 1), value=value)
+        self.progress_label.configure(text=text)
+
     def compute_and_report(self):
-        if not self.system.slabs:
-            return
+        """Tüm planın hesabını arka planda başlatır; sonuç _poll_solve ile aktarılır."""
+        self._start_solve(incremental=False)
 
-        self.output.delete("1.0", "end")
-        conc = self.conc.get(); steel = self.steel.get()
-        h = self.h_mm.get(); cover = self.cover_mm.get()
-        bw = self.bw.get()
+    def _schedule_live_solve(self):
+        """Canlı hesap açıksa hesabı son düzenlemeden LIVE_DEBOUNCE_MS sonraya ertele."""
+        if not self.live_mode.get():
+            return
+        if self._live_after is not None:
+            self.after_cancel(self._live_after)
+        self._live_after = self.after(LIVE_DEBOUNCE_MS, self._live_solve)
 
-        self.output.insert("end", f"Hesap Raporu\nBeton: {conc}, Çelik: {steel}, h={h}mm, cover={cover}mm\n\n")
-        self.last_design = {}
+    def _live_solve(self):
+        self._live_after = None
+        self._start_solve(incremental=True)
 
-        # ==== İKİ GEÇİŞLİ HESAPLAMA ====
-        # 1. Geçiş: Tüm döşemelerin temel donatılarını hesapla ve pilye alanlarını topla
-        pilye_areas = {}  # {sid: pilye_area_mm2_per_m}
-        moment_results = {}  # {sid: (res, steps)}
+    def _start_solve(self, incremental: bool):
+        """
+        Arka plan hesabını başlatır. incremental=True ise yalnızca son
+        hesaptan beri düzenlenen döşemeler ve etkiledikleri yeniden hesaplanır.
+        """
+        if not self.system.slabs:
+            self.last_result = None
+            self.last_design = {}
+            self.redraw()
+            return
 
-        for sid in sorted(self.system.slabs.keys()):
-            s = self.system.slabs[sid]
-            try:
-                if s.kind == "ONEWAY":
-                    res, steps = self.system.compute_oneway_per_slab(sid, bw)
-                    moment_results[sid] = (res, steps)
-                    from oneway_slab import oneway_smax_main
-                    from struct_design import split_duz_pilye, twoway_smax_short
-                    Mpos = res["Mpos_max"] or 0.0
-                    smax = oneway_smax_main(h)
-                    As_main, ch_main, _ = self.system.design_main_rebar_from_M(
-                        Mpos, conc, steel, h, cover, smax, label_prefix="")
-                    _, pilye = split_duz_pilye(ch_main)
-                    pilye_areas[sid] = pilye.area_mm2_per_m
-                elif s.kind == "TWOWAY":
-                    res, steps = self.system.compute_twoway_per_slab(sid, bw)
-                    moment_results[sid] = (res, steps)
-                    from struct_design import split_duz_pilye, twoway_smax_short, twoway_smax_long
-                    short_dir = res.get("short_dir", "X")
-                    mxn, mxp = res["Mx"]
-                    myn, myp = res["My"]
-                    if short_dir == "X":
-                        Mpos_short = mxp or 0.0
-                        smax_short = twoway_smax_short(h)
-                    else:
-                        Mpos_short = myp or 0.0
-                        smax_short = twoway_smax_short(h)
-                    As_main, ch_main, _ = self.system.design_main_rebar_from_M(
-                        Mpos_short, conc, steel, h, cover, smax_short, label_prefix="")
-                    _, pilye = split_duz_pilye(ch_main)
-                    pilye_areas[sid] = pilye.area_mm2_per_m
-                elif s.kind == "BALCONY":
-                    res, steps = self.system.compute_balcony_per_slab(sid, bw)
-                    moment_results[sid] = (res, steps)
-            except Exception as e:
-                moment_results[sid] = None
-
-        # 1.5 Geçiş: TWOWAY döşemeler için mesnet dengelemesi (TS500)
-        raw_twoway_moments = {sid: res for sid, (res, _) in moment_results.items()
-                              if res is not None and self.system.slabs.get(sid) and self.system.slabs[sid].kind == "TWOWAY"}
-
-        for sid, val in moment_results.items():
-            if val is not None and self.system.slabs.get(sid) and self.system.slabs[sid].kind == "ONEWAY":
-                raw_twoway_moments[sid] = val[0]
-
-        balanced_moments = {}
-        balance_log = []
-        if raw_twoway_moments:
-            balanced_moments, balance_log = balance_support_moments(self.system, raw_twoway_moments, bw)
-
-        if balance_log:
-            self.output.insert("end", "=== MESNET DENGELEMESİ (TS500) ===\n")
-            for line in balance_log:
-                self.output.insert("end", line + "\n")
-            self.output.insert("end", "\n")
-
-        # 2. Geçiş: Tüm döşemelerin tam donatı hesabını yap (pilye bilgileriyle)
-        for sid in sorted(self.system.slabs.keys()):
-            s = self.system.slabs[sid]
-            self.output.insert("end", f"--- {sid} ({s.kind}) ---\n")
+        if self.solve_worker is not None:
+            self.solve_worker.cancel()
+            self._dirty |= self.solve_worker.dirty
+        dirty, self._dirty = self._dirty, set()
+        previous = self.last_result if incremental else None
+        from solve_runner import SolveWorker
+        worker = SolveWorker(self.system, self._solve_params(), self.plan_version,
+                             previous=previous, dirty=dirty)
+        self.solve_worker = worker
+        self._set_progress("Hesaplanıyor...", 0, 2 * len(self.system.slabs))
+        worker.start()
+        self.after(SOLVE_POLL_MS, self._poll_solve, worker)
+
+    def _poll_solve(self, worker: "SolveWorker"):
+        """Hesap kuyruğunu okur; eski veya iptal edilmiş hesapları yok sayar."""
+        if worker is not self.solve_worker:
+            return
+        while True:
             try:
-                if moment_results.get(sid) is None:
-                    self.output.insert("end", "HATA: Moment hesabı başarısız\n\n")
-                    continue
+                msg = worker.queue.get_nowait()
+            except queue.Empty:
+                break
+            kind = msg[0]
+            if kind == "progress":
+                _, phase, done, total = msg
+                offset = total if phase == "Donatı" else 0
+                self._set_progress(f"{phase}: {done}/{total}", offset + done, 2 * total)
+            elif kind == "done":
+                self.solve_worker = None
+                if worker.version == self.plan_version:
+                    self._apply_solve_result(msg[1])
+                    self._set_progress("Tamamlandı", 1, 1)
+                return
+            elif kind == "error":
+                self.solve_worker = None
+                # Hesaplanamayan döşemeler bir sonraki hesapta yeniden denenir
+                self._dirty |= worker.dirty
+                self._set_progress(f"Hata: {msg[1]}", 0, 1)
+                return
+            else:  # cancelled
+                return
+        self.after(SOLVE_POLL_MS, self._poll_solve, worker)
+
+    def _apply_solve_result(self, result: "SolveResult"):
+        """Rapor ve tasarımları tek adımda arayüze aktarır."""
+        self.report_view.set_model(ReportModel.from_result(result))
+        self.last_design = result.design
+        self.last_result = result
+        self.history.attach_result(self.system, result)
+        if result.distribution is not None:
+            self.last_distribution = result.distribution
+        self.redraw()
 
-                res, steps = moment_results[sid]
-                design_res = {}
-
-                if s.kind == "ONEWAY":
-                    for l in steps:
-                        self.output.insert("end", l + "\n")
-
-                    design_res, report_lines = compute_oneway_report(
-                        self.system, sid, res, conc, steel, h, cover, bw,
-                        neighbor_pilye_areas=pilye_areas
-                    )
-                    for l in report_lines:
-                        self.output.insert("end", l + "\n")
-
-                elif s.kind == "TWOWAY":
-                    for l in steps:
-                        self.output.insert("end", l + "\n")
-
-                    balanced_res = balanced_moments.get(sid, res)
-                    if balanced_res:
-                        mxn_bal, mxp_bal = balanced_res.get("Mx", (None, None))
-                        myn_bal, myp_bal = balanced_res.get("My", (None, None))
-                        mxn_orig, _ = res.get("Mx", (None, None))
-                        myn_orig, _ = res.get("My", (None, None))
-                        if mxn_bal != mxn_orig or myn_bal != myn_orig:
-                            mxn_str = f"{mxn_bal:.3f}" if mxn_bal is not None else "-"
-                            myn_str = f"{myn_bal:.3f}" if myn_bal is not None else "-"
-                            self.output.insert("end", f"Dengelenmiş momentler: Mx_neg={mxn_str}, My_neg={myn_str}\n")
-                        res = balanced_res
-
-                    design_res, report_lines = compute_twoway_report(
-                        self.system, sid, res, conc, steel, h, cover, bw,
-                        neighbor_pilye_areas=pilye_areas
-                    )
-                    for l in report_lines:
-                        self.output.insert("end", l + "\n")
-
-                elif s.kind == "BALCONY":
-                    for l in steps:
-                        self.output.insert("end", l + "\n")
-
-                    design_res, report_lines = compute_balcony_report(
-                        self.system, sid, res, conc, steel, h, cover, bw
-                    )
-                    for l in report_lines:
-                        self.output.insert("end", l + "\n")
-
-                self.last_design[sid] = design_res
-
-            except Exception as e:
-                self.output.insert("end", f"HATA: {e}\n\n")
+    def compute_now(self):
+        """Hesabı ana iş parçacığında (bloklayarak) yapar; DXF çıktısı için."""
+        if not self.system.slabs:
+            return
+        self._dirty.clear()
+        from solve_runner import solve_plan
+        self._apply_solve_result(solve_plan(self.system, self._solve_params()))
 
     def export_dxf_and_open(self):
         if not self.last_design:
-            self.compute_and_report()
+            self.compute_now()
         if not self.last_design:
             return
 
@@ -856,8 +1256,9 @@ class App(tk.Tk):
             fname += ".dxf"
 
         try:
+            from dxf_out import export_to_dxf
             export_to_dxf(self.system, fname, self.last_design, self.bw.get(),
-                          real_slabs=self.real_slabs)
+                          real_slabs=self.real_slabs, cache=self._get_drawing_cache())
             messagebox.showinfo("OK", f"Kaydedildi: {fname}")
             try:
                 os.startfile(os.path.abspath(fname))
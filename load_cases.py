@@ -0,0 +1,254 @@
+"""
+Yük Durumları Modülü
+====================
+Döşemeler için adlandırılmış yük durumları (ölü, hareketli, bölme duvarı,
+alternatif açıklıklara dama yüklemesi) ve bunların toplu değerlendirilmesi.
+
+Tek doğrultulu zincirler için geometri bir kez derlenir: üç moment
+denklemi matrisi çözülerek açıklık yüklerini mesnet momentlerine bağlayan
+etki matrisi elde edilir. Tüm yük durumları bu matrisle tek bir dizi
+işleminde çözülür, kombinasyonlar ve zarflar vektörel olarak hesaplanır.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple, List, Optional, Sequence
+import numpy as np
+
+# TS500 yük katsayıları (1.4G + 1.6Q)
+GAMMA_G = 1.4
+GAMMA_Q = 1.6
+
+
+@dataclass(frozen=True, slots=True)
+class SlabLoads:
+    """Döşeme karakteristik yükleri (kN/m²)."""
+    g: float                # Ölü yük (öz ağırlık + kaplama)
+    q: float                # Hareketli yük
+    partition: float = 0.0  # Bölme duvarı yükü
+
+    def design_load(self) -> float:
+        """Tüm açıklıklar yüklüyken tasarım yükü pd = 1.4(G + bölme) + 1.6Q (kN/m²)."""
+        return GAMMA_G * (self.g + self.partition) + GAMMA_Q * self.q
+
+
+@dataclass(frozen=True, slots=True)
+class LoadCase:
+    """
+    Adlandırılmış yük durumu.
+    component: "g", "q" veya "partition" (SlabLoads alanı)
+    pattern: "ALL" tüm açıklıklar, "ODD" 1., 3., ... açıklıklar, "EVEN" 2., 4., ... açıklıklar
+    """
+    name: str
+    component: str
+    factor: float
+    pattern: str = "ALL"
+
+
+DEFAULT_LOAD_CASES: Tuple[LoadCase, ...] = (
+    LoadCase("G", "g", GAMMA_G),
+    LoadCase("G_bolme", "partition", GAMMA_G),
+    LoadCase("Q", "q", GAMMA_Q),
+    LoadCase("Q_tek", "q", GAMMA_Q, "ODD"),
+    LoadCase("Q_cift", "q", GAMMA_Q, "EVEN"),
+)
+
+# Her kombinasyon, toplanacak yük durumu adlarının listesidir
+DEFAULT_COMBINATIONS: Tuple[Tuple[str, ...], ...] = (
+    ("G", "G_bolme", "Q"),
+    ("G", "G_bolme", "Q_tek"),
+    ("G", "G_bolme", "Q_cift"),
+)
+
+
+def slab_loads(s) -> SlabLoads:
+    """
+    Döşemenin yüklerini döndürür. Yük tanımlanmamışsa pd (tasarım yükü)
+    tamamen kalıcı yük kabul edilir; böylece 1.4G = pd olur.
+    """
+    loads = getattr(s, "loads", None)
+    if loads is not None:
+        return loads
+    return SlabLoads(g=s.pd / GAMMA_G, q=0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class ChainGeometry:
+    """Derlenmiş tek doğrultulu zincir geometrisi."""
+    direction: str
+    chain: Tuple[str, ...]
+    Ls: Tuple[float, ...]        # Açıklık uzunlukları (m)
+    owners: Tuple[str, ...]      # Her açıklığın sahibi döşeme
+    fixed_start: bool
+    fixed_end: bool
+
+
+_INFLUENCE_CACHE: Dict[Tuple, np.ndarray] = {}
+
+
+def chain_direction(s) -> str:
+    """Tek doğrultulu döşemenin zincir yönü (compute_oneway_per_slab ile aynı kural)."""
+    Lx_g, Ly_g = s.size_m_gross()
+    return "Y" if Lx_g < Ly_g else "X"
+
+
+def compile_oneway_chain(system, sid: str, bw: float) -> ChainGeometry:
+    """
+    Döşemenin ait olduğu tek doğrultulu zinciri derler.
+    Sürekli veya ankastre uçlar (compute_oneway_per_slab'daki tek açıklık
+    kuralıyla aynı şekilde) ankastre kabul edilir.
+    """
+    from oneway_slab import build_oneway_chain, chain_end_fixity, oneway_chain_spans
+
+    direction = chain_direction(system.slabs[sid])
+    chain = build_oneway_chain(system, sid, direction)
+    (fixed_start, fixed_end), (continuous_start, continuous_end) = chain_end_fixity(system, chain, direction)
+    spans = oneway_chain_spans(system, chain, direction, bw)
+    return ChainGeometry(
+        direction=direction, chain=tuple(chain),
+        Ls=tuple(L for (L, _o, _n) in spans), owners=tuple(o for (_L, o, _n) in spans),
+        fixed_start=fixed_start or continuous_start, fixed_end=fixed_end or continuous_end
+    )
+
+
+def support_influence_matrix(Ls: Sequence[float], fixed_start: bool, fixed_end: bool) -> np.ndarray:
+    """
+    Üç moment denklemiyle açıklık yüklerini (w, kN/m) mesnet momentlerine
+    bağlayan (n+1) × n etki matrisini döndürür. Sonuç önbelleklenir.
+
+    İç mesnet i için:
+        M[i-1]·La + 2·M[i]·(La + Lb) + M[i+1]·Lb = -(wa·La³ + wb·Lb³)/4
+    Ankastre uç sıfır uzunluklu hayali açıklıkla, basit mesnet M = 0 ile
+    temsil edilir.
+    """
+    key = (tuple(round(L, 6) for L in Ls), fixed_start, fixed_end)
+    S = _INFLUENCE_CACHE.get(key)
+    if S is not None:
+        return S
+
+    n = len(Ls)
+    A = np.zeros((n + 1, n + 1))
+    B = np.zeros((n + 1, n))
+    for i in range(n + 1):
+        La = Ls[i - 1] if i > 0 else 0.0
+        Lb = Ls[i] if i < n else 0.0
+        is_end = i == 0 or i == n
+        if is_end and not (fixed_start if i == 0 else fixed_end):
+            A[i, i] = 1.0  # Basit mesnet: M = 0
+            continue
+        A[i, i] = 2.0 * (La + Lb)
+        if i > 0:
+            A[i, i - 1] = La
+            B[i, i - 1] = -La ** 3 / 4.0
+        if i < n:
+            A[i, i + 1] = Lb
+            B[i, i] = -Lb ** 3 / 4.0
+    S = np.linalg.solve(A, B)
+    _INFLUENCE_CACHE[key] = S
+    return S
+
+
+def span_load_matrix(system, geom: ChainGeometry, cases: Sequence[LoadCase]) -> np.ndarray:
+    """
+    Her açıklık ve yük durumu için çizgisel yükü (kN/m) n × k matris olarak kurar.
+    Dama yüklemesi açıklık sırasına göre uygulanır.
+    """
+    n = len(geom.Ls)
+    W = np.zeros((n, len(cases)))
+    for i, owner in enumerate(geom.owners):
+        s = system.slabs[owner]
+        loads = slab_loads(s)
+        for k, case in enumerate(cases):
+            if case.pattern == "ODD" and i % 2 != 0:
+                continue
+            if case.pattern == "EVEN" and i % 2 != 1:
+                continue
+            W[i, k] = case.factor * getattr(loads, case.component) * s.b
+    return W
+
+
+def span_max_moments(Ls: np.ndarray, W: np.ndarray, M: np.ndarray) -> np.ndarray:
+    """
+    Uç momentleri ve düzgün yük altında her açıklığın en büyük pozitif
+    momentini vektörel olarak hesaplar.
+
+    Args:
+        Ls: (n,) açıklıklar
+        W: (n, k) çizgisel yükler
+        M: (n+1, k) mesnet momentleri (mesnette negatif)
+    """
+    L = Ls[:, None]
+    Ml, Mr = M[:-1], M[1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.where(W > 0, L / 2.0 + (Mr - Ml) / (W * L), 0.0)
+    x = np.clip(x, 0.0, L)
+    Mx = W * x * (L - x) / 2.0 + Ml * (1.0 - x / L) + Mr * (x / L)
+    return np.maximum(Mx, 0.0)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LoadEnvelope:
+    """Bir zincir için yük durumu / kombinasyon sonuçları ve zarfları."""
+    geometry: ChainGeometry
+    case_names: Tuple[str, ...]
+    combination_names: Tuple[str, ...]
+    support_M: np.ndarray   # (n+1, c) kombinasyon mesnet momentleri (negatif)
+    span_M: np.ndarray      # (n, c) kombinasyon açıklık momentleri
+    support_env: np.ndarray  # (n+1,) en büyük mesnet momenti (negatif)
+    span_env: np.ndarray     # (n,) en büyük açıklık momenti
+
+    def slab_envelope(self, sid: str) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Döşemeye ait açıklık ve mesnetlerin zarf değerleri.
+
+        Returns:
+            (Mpos_max, Mneg_min)
+        """
+        owned = [i for i, o in enumerate(self.geometry.owners) if o == sid]
+        if not owned:
+            return None, None
+        touching = sorted(set(owned) | {i + 1 for i in owned})
+        return float(np.max(self.span_env[owned])), float(np.min(self.support_env[touching]))
+
+
+def oneway_chain_envelope(system, sid: str, bw: float,
+                          cases: Sequence[LoadCase] = DEFAULT_LOAD_CASES,
+                          combinations: Sequence[Sequence[str]] = DEFAULT_COMBINATIONS,
+                          geom: Optional[ChainGeometry] = None) -> LoadEnvelope:
+    """
+    Döşemenin zincirini tüm yük durumları için tek seferde çözer ve
+    kombinasyon zarflarını hesaplar.
+
+    Args:
+        system: SlabSystem nesnesi
+        sid: Döşeme ID'si
+        bw: Kiriş genişliği (m)
+        cases: Yük durumları
+        combinations: Her biri yük durumu adlarından oluşan kombinasyonlar
+        geom: Önceden derlenmiş zincir (verilmezse derlenir)
+
+    Returns:
+        LoadEnvelope
+    """
+    if geom is None:
+        geom = compile_oneway_chain(system, sid, bw)
+    Ls = np.asarray(geom.Ls, dtype=float)
+    S = support_influence_matrix(geom.Ls, geom.fixed_start, geom.fixed_end)
+
+    # Kombinasyon matrisi: (k yük durumu) × (c kombinasyon)
+    names = [c.name for c in cases]
+    C = np.zeros((len(cases), len(combinations)))
+    for j, combo in enumerate(combinations):
+        for name in combo:
+            C[names.index(name), j] = 1.0
+
+    W = span_load_matrix(system, geom, cases) @ C   # (n, c)
+    M_sup = S @ W                                    # (n+1, c)
+    M_span = span_max_moments(Ls, W, M_sup)
+
+    return LoadEnvelope(
+        geometry=geom,
+        case_names=tuple(names),
+        combination_names=tuple("+".join(combo) for combo in combinations),
+        support_M=M_sup, span_M=M_span,
+        support_env=M_sup.min(axis=1), span_env=M_span.max(axis=1)
+    )
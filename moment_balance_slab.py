@@ -3,14 +3,19 @@ Mesnet Moment Dengelemesi Modülü
 ================================
 Bu modül TS500'e göre komşu döşemeler arasında mesnet moment dengelemesi yapar.
 TWOWAY-TWOWAY ve TWOWAY-ONEWAY arası dengeleme desteklenir.
+İsteğe bağlı olarak tüm mesnet grafiği üzerinde iteratif moment dağıtma
+(Hardy Cross) da yapılabilir.
 """
 
+from dataclasses import dataclass, replace
 from typing import Dict, Tuple, List, Optional
+import numpy as np
+from slab_results import OneWayMoments, TwoWayMoments
 
 
-def get_neighbor_on_edge(system, sid: str, edge: str) -> Tuple[Optional[str], Optional[str]]:
+def neighbors_on_edge(system, sid: str, edge: str) -> List[str]:
     """
-    Belirli bir kenarın komşu döşemesini ve türünü döndürür.
+    Bir kenar boyunca komşu olan tüm döşemeleri kenar tarama sırasıyla döndürür.
     
     Args:
         system: SlabSystem nesnesi
@@ -18,43 +23,55 @@ def get_neighbor_on_edge(system, sid: str, edge: str) -> Tuple[Optional[str], Op
         edge: Kenar ("L", "R", "T", "B")
     
     Returns:
-        (komşu_sid, komşu_kind) veya (None, None) eğer komşu yoksa
+        Komşu döşeme ID'leri (tekrarsız, kenar boyunca sıralı)
     """
     edge = edge.upper()
     s = system.slabs[sid]
     i0, j0, i1, j1 = s.bbox()
     
-    # Kenar komşularını bul
     if edge == "L":
         if i0 == 0:
-            return None, None
-        for j in range(j0, j1 + 1):
-            nb = system.cell_owner.get((i0 - 1, j))
-            if nb and nb != sid and nb in system.slabs:
-                return nb, system.slabs[nb].kind
+            return []
+        cells = [(i0 - 1, j) for j in range(j0, j1 + 1)]
     elif edge == "R":
         if i1 >= system.Nx - 1:
-            return None, None
-        for j in range(j0, j1 + 1):
-            nb = system.cell_owner.get((i1 + 1, j))
-            if nb and nb != sid and nb in system.slabs:
-                return nb, system.slabs[nb].kind
+            return []
+        cells = [(i1 + 1, j) for j in range(j0, j1 + 1)]
     elif edge == "T":
         if j0 == 0:
-            return None, None
-        for i in range(i0, i1 + 1):
-            nb = system.cell_owner.get((i, j0 - 1))
-            if nb and nb != sid and nb in system.slabs:
-                return nb, system.slabs[nb].kind
+            return []
+        cells = [(i, j0 - 1) for i in range(i0, i1 + 1)]
     elif edge == "B":
         if j1 >= system.Ny - 1:
-            return None, None
-        for i in range(i0, i1 + 1):
-            nb = system.cell_owner.get((i, j1 + 1))
-            if nb and nb != sid and nb in system.slabs:
-                return nb, system.slabs[nb].kind
+            return []
+        cells = [(i, j1 + 1) for i in range(i0, i1 + 1)]
+    else:
+        return []
+    
+    found = []
+    for cell in cells:
+        nb = system.cell_owner.get(cell)
+        if nb and nb != sid and nb in system.slabs and nb not in found:
+            found.append(nb)
+    return found
+
+
+def get_neighbor_on_edge(system, sid: str, edge: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Belirli bir kenarın komşu döşemesini ve türünü döndürür.
     
-    return None, None
+    Args:
+        system: SlabSystem nesnesi
+        sid: Döşeme ID'si
+        edge: Kenar ("L", "R", "T", "B")
+    
+    Returns:
+        (komşu_sid, komşu_kind) veya (None, None) eğer komşu yoksa
+    """
+    found = neighbors_on_edge(system, sid, edge)
+    if not found:
+        return None, None
+    return found[0], system.slabs[found[0]].kind
 
 
 def get_opposite_edge(edge: str) -> str:
@@ -63,16 +80,16 @@ def get_opposite_edge(edge: str) -> str:
     return opposite.get(edge.upper(), edge)
 
 
-def get_moment_for_edge(res: dict, edge: str) -> Optional[float]:
+def get_moment_for_edge(res: TwoWayMoments, edge: str) -> Optional[float]:
     """
-    Döşeme sonuç dict'inden belirli bir kenarın mesnet momentini döndürür.
+    Döşeme sonuç kaydından belirli bir kenarın mesnet momentini döndürür.
     
     Mx = X doğrultusundaki moment (L/R kenarları için)
     My = Y doğrultusundaki moment (T/B kenarları için)
     """
     edge = edge.upper()
-    mxn, mxp = res.get("Mx", (None, None))
-    myn, myp = res.get("My", (None, None))
+    mxn, mxp = res.Mx
+    myn, myp = res.My
     
     # L ve R kenarları X doğrultusunda, T ve B kenarları Y doğrultusunda
     if edge in ("L", "R"):
@@ -89,7 +106,7 @@ def get_oneway_support_moment(system, neighbor_id: str, bw: float) -> Optional[f
     
     try:
         res, _ = compute_oneway_per_slab(system, neighbor_id, bw)
-        Mneg = res.get("Mneg_min")
+        Mneg = res.Mneg_min
         return abs(Mneg) if Mneg is not None else None
     except:
         return None
@@ -116,31 +133,50 @@ def calculate_stiffness_ratio(L1: float, L2: float) -> Tuple[float, float]:
     return K1 / total, K2 / total
 
 
-def balance_support_moments(system, raw_moments: Dict[str, dict], bw: float) -> Tuple[Dict[str, dict], List[str]]:
+@dataclass(frozen=True, slots=True)
+class SupportEdge:
+    """İki döşemenin paylaştığı mesnet kenarı (dengeleme grafiğinin bir kenarı)."""
+    sid1: str
+    edge1: str
+    sid2: str
+    edge2: str
+    M1: float
+    M2: float
+    L1: float
+    L2: float
+    DF1: float
+    DF2: float
+
+
+def build_support_edges(system, raw_moments: Dict[str, object], bw: float) -> List[SupportEdge]:
     """
-    TWOWAY döşemelerin mesnet momentlerini TS500'e göre dengeler.
+    Dengelemeye girecek ortak mesnet kenarlarını bir kez çıkarır.
     
-    TS500 Kuralı:
-    - M_min < 0.8 × M_max ise: Farkın 2/3'ü rijitlik oranına göre dağıtılır
-    - Tasarımda büyük değer kullanılır
+    Her TWOWAY döşemenin her kenarındaki tüm TWOWAY/ONEWAY komşular için bir
+    kenar üretilir; aynı çift iki kez eklenmez. ONEWAY komşu momenti
+    raw_moments içinde varsa oradan alınır, yoksa bir kez hesaplanıp saklanır.
     
     Args:
         system: SlabSystem nesnesi
-        raw_moments: {sid: compute_twoway_per_slab sonucu}
+        raw_moments: {sid: moment sonucu}
         bw: Kiriş genişliği (m)
     
     Returns:
-        (balanced_moments, log_lines)
+        SupportEdge listesi (döşeme ve kenar sırasıyla)
     """
-    balanced = {}
-    log = []
-    
-    # Dengelenmiş momentleri saklamak için
-    # {(sid, edge): balanced_moment}
-    edge_balanced = {}
-    
-    # İşlenmiş kenar çiftleri (tekrar işlememek için)
+    edges = []
     processed_pairs = set()
+    oneway_cache = {}
+    
+    def oneway_moment(nb: str) -> Optional[float]:
+        if nb not in oneway_cache:
+            nb_res = raw_moments.get(nb)
+            if isinstance(nb_res, OneWayMoments):
+                Mneg = nb_res.Mneg_min
+                oneway_cache[nb] = abs(Mneg) if Mneg is not None else None
+            else:
+                oneway_cache[nb] = get_oneway_support_moment(system, nb, bw)
+        return oneway_cache[nb]
     
     for sid, res in raw_moments.items():
         if res is None:
@@ -150,139 +186,306 @@ def balance_support_moments(system, raw_moments: Dict[str, dict], bw: float) ->
         if sid not in system.slabs or system.slabs[sid].kind != "TWOWAY":
             continue
         
-        Lx_net = res.get("Lx_net", 1.0)
-        Ly_net = res.get("Ly_net", 1.0)
-        
         for edge in ("L", "R", "T", "B"):
-            # Bu kenar çifti zaten işlendi mi?
-            neighbor_id, neighbor_kind = get_neighbor_on_edge(system, sid, edge)
-            
-            if neighbor_id is None:
-                continue
-            
-            # Sadece TWOWAY veya ONEWAY komşular için dengeleme yap
-            if neighbor_kind not in ("TWOWAY", "ONEWAY"):
-                continue
-            
-            # Çift kontrolü (A-L-B aynı B-R-A ile)
-            pair_key = tuple(sorted([sid, neighbor_id])) + (edge if sid < neighbor_id else get_opposite_edge(edge),)
-            if pair_key in processed_pairs:
-                continue
-            processed_pairs.add(pair_key)
-            
-            # Bu döşemenin mesnet momenti
             M1 = get_moment_for_edge(res, edge)
             if M1 is None:
                 continue
             M1 = abs(M1)
-            
-            # Komşu döşemenin mesnet momenti
-            if neighbor_kind == "TWOWAY" and neighbor_id in raw_moments:
-                neighbor_res = raw_moments[neighbor_id]
-                if neighbor_res is None:
-                    continue
-                opposite_edge = get_opposite_edge(edge)
-                M2 = get_moment_for_edge(neighbor_res, opposite_edge)
-                if M2 is None:
-                    continue
-                M2 = abs(M2)
-                
-                # Komşu döşemenin açıklığı
-                L2 = neighbor_res.get("Lx_net" if edge in ("L", "R") else "Ly_net", 1.0)
-            elif neighbor_kind == "ONEWAY":
-                M2 = get_oneway_support_moment(system, neighbor_id, bw)
-                if M2 is None:
-                    continue
-                M2 = abs(M2)
-                
-                # ONEWAY döşeme açıklığı
-                neighbor_slab = system.slabs[neighbor_id]
-                Lx_n, Ly_n = neighbor_slab.size_m_gross()
-                L2 = min(Lx_n, Ly_n)  # Kısa açıklık
-            else:
-                continue
-            
+            opposite_edge = get_opposite_edge(edge)
             # Bu döşemenin açıklığı (ilgili yönde)
-            L1 = Lx_net if edge in ("L", "R") else Ly_net
-            
-            # M_max ve M_min belirleme
-            M_max = max(M1, M2)
-            M_min = min(M1, M2)
+            L1 = res.Lx_net if edge in ("L", "R") else res.Ly_net
             
-            log.append(f"Kenar {sid}-{edge} <-> {neighbor_id}-{get_opposite_edge(edge)}:")
-            log.append(f"  M1 ({sid}) = {M1:.3f}, M2 ({neighbor_id}) = {M2:.3f}")
-            
-            # TS500 kontrolü
-            if M_min < 0.8 * M_max:
-                # Fark fazla, dağıtım yapılacak
-                delta_M = M_max - M_min
-                
-                # Rijitlik oranı hesabı
-                DF1, DF2 = calculate_stiffness_ratio(L1, L2)
-                log.append(f"  L1 = {L1:.3f}, L2 = {L2:.3f}")
-                log.append(f"  DF1 = {DF1:.3f}, DF2 = {DF2:.3f}")
+            for neighbor_id in neighbors_on_edge(system, sid, edge):
+                neighbor_kind = system.slabs[neighbor_id].kind
                 
-                # 2/3 fark dağıtılır
-                distribute = (2.0 / 3.0) * delta_M
+                # Çift kontrolü (A-L-B aynı B-R-A ile)
+                pair_key = tuple(sorted([sid, neighbor_id])) + (edge if sid < neighbor_id else opposite_edge,)
+                if pair_key in processed_pairs:
+                    continue
                 
-                if M1 > M2:
-                    # M1 büyük, ondan düş, M2'ye ekle
-                    M1_adj = -distribute * DF1
-                    M2_adj = distribute * DF2
+                # Komşu döşemenin mesnet momenti ve açıklığı
+                if neighbor_kind == "TWOWAY" and neighbor_id in raw_moments:
+                    neighbor_res = raw_moments[neighbor_id]
+                    if neighbor_res is None:
+                        continue
+                    M2 = get_moment_for_edge(neighbor_res, opposite_edge)
+                    if M2 is None:
+                        continue
+                    L2 = neighbor_res.Lx_net if edge in ("L", "R") else neighbor_res.Ly_net
+                elif neighbor_kind == "ONEWAY":
+                    M2 = oneway_moment(neighbor_id)
+                    if M2 is None:
+                        continue
+                    Lx_n, Ly_n = system.slabs[neighbor_id].size_m_gross()
+                    L2 = min(Lx_n, Ly_n)  # Kısa açıklık
                 else:
-                    # M2 büyük
-                    M1_adj = distribute * DF1
-                    M2_adj = -distribute * DF2
-                
-                M1_new = M1 + M1_adj
-                M2_new = M2 + M2_adj
+                    continue
                 
+                processed_pairs.add(pair_key)
+                DF1, DF2 = calculate_stiffness_ratio(L1, L2)
+                edges.append(SupportEdge(sid, edge, neighbor_id, opposite_edge,
+                                         M1, abs(M2), L1, L2, DF1, DF2))
+    
+    return edges
+
+
+def balance_support_edges(edges: List[SupportEdge]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Tüm mesnet kenarlarını tek bir vektörel adımda TS500'e göre dengeler.
+    
+    Args:
+        edges: build_support_edges çıktısı
+    
+    Returns:
+        (M1_yeni, M2_yeni, M_tasarım, dağıtım_yapıldı) dizileri
+    """
+    M1 = np.array([e.M1 for e in edges], dtype=float)
+    M2 = np.array([e.M2 for e in edges], dtype=float)
+    DF1 = np.array([e.DF1 for e in edges], dtype=float)
+    DF2 = np.array([e.DF2 for e in edges], dtype=float)
+    
+    M_max = np.maximum(M1, M2)
+    M_min = np.minimum(M1, M2)
+    redistribute = M_min < 0.8 * M_max
+    
+    # Farkın 2/3'ü rijitlik oranına göre dağıtılır; büyük olandan düşülür
+    distribute = (2.0 / 3.0) * (M_max - M_min)
+    m1_larger = M1 > M2
+    M1_new = M1 + np.where(m1_larger, -distribute * DF1, distribute * DF1)
+    M2_new = M2 + np.where(m1_larger, distribute * DF2, -distribute * DF2)
+    
+    # Tasarımda büyük değer kullanılır
+    M_design = np.where(redistribute, np.maximum(M1_new, M2_new), M_max)
+    return M1_new, M2_new, M_design, redistribute
+
+
+def balance_support_moments(system, raw_moments: Dict[str, object], bw: float) -> Tuple[Dict[str, object], List[str]]:
+    """
+    TWOWAY döşemelerin mesnet momentlerini TS500'e göre dengeler.
+    
+    TS500 Kuralı:
+    - M_min < 0.8 × M_max ise: Farkın 2/3'ü rijitlik oranına göre dağıtılır
+    - Tasarımda büyük değer kullanılır
+    
+    Ortak mesnet kenarları önce bir kez çıkarılır, ardından hepsi birlikte
+    dengelenir. Bir doğrultuda birden fazla dengelenmiş kenar varsa en büyük
+    tasarım momenti kullanılır.
+    
+    Args:
+        system: SlabSystem nesnesi
+        raw_moments: {sid: compute_twoway_per_slab sonucu}
+        bw: Kiriş genişliği (m)
+    
+    Returns:
+        (balanced_moments, log_lines)
+    """
+    log = []
+    edges = build_support_edges(system, raw_moments, bw)
+    
+    # Dengelenmiş momentleri saklamak için
+    # {(sid, edge): balanced_moment}
+    edge_balanced = {}
+    
+    if edges:
+        M1_new, M2_new, M_design, redistribute = balance_support_edges(edges)
+        
+        for k, e in enumerate(edges):
+            M_max = max(e.M1, e.M2)
+            M_min = min(e.M1, e.M2)
+            Md = float(M_design[k])
+            
+            log.append(f"Kenar {e.sid1}-{e.edge1} <-> {e.sid2}-{e.edge2}:")
+            log.append(f"  M1 ({e.sid1}) = {e.M1:.3f}, M2 ({e.sid2}) = {e.M2:.3f}")
+            if redistribute[k]:
+                log.append(f"  L1 = {e.L1:.3f}, L2 = {e.L2:.3f}")
+                log.append(f"  DF1 = {e.DF1:.3f}, DF2 = {e.DF2:.3f}")
                 log.append(f"  M_min ({M_min:.3f}) < 0.8 × M_max ({0.8*M_max:.3f}) → Dağıtım yapılıyor")
-                log.append(f"  ΔM = {delta_M:.3f}, Dağıtılacak = {distribute:.3f}")
-                log.append(f"  M1_yeni = {M1_new:.3f}, M2_yeni = {M2_new:.3f}")
-                
-                # Tasarımda büyük değer kullanılır
-                M_design = max(M1_new, M2_new)
-                log.append(f"  Tasarım momenti: {M_design:.3f} kNm/m")
+                log.append(f"  ΔM = {M_max - M_min:.3f}, Dağıtılacak = {(2.0 / 3.0) * (M_max - M_min):.3f}")
+                log.append(f"  M1_yeni = {M1_new[k]:.3f}, M2_yeni = {M2_new[k]:.3f}")
             else:
-                # Fark az, büyük olanı kullan
-                M_design = M_max
                 log.append(f"  M_min ({M_min:.3f}) >= 0.8 × M_max ({0.8*M_max:.3f}) → Büyük değer kullanılıyor")
-                log.append(f"  Tasarım momenti: {M_design:.3f} kNm/m")
-            
-            # Dengelenmiş momentleri sakla
-            edge_balanced[(sid, edge)] = M_design
-            edge_balanced[(neighbor_id, get_opposite_edge(edge))] = M_design
+            log.append(f"  Tasarım momenti: {Md:.3f} kNm/m")
             log.append("")
+            
+            # Bir kenarda birden fazla komşu varsa büyük olan kalır
+            for key in ((e.sid1, e.edge1), (e.sid2, e.edge2)):
+                edge_balanced[key] = max(edge_balanced.get(key, Md), Md)
     
-    # Orijinal momentleri kopyala ve dengelenmiş değerleri uygula
+    return _apply_edge_moments(system, raw_moments, edge_balanced), log
+
+
+def _apply_edge_moments(system, raw_moments: Dict[str, object],
+                        edge_moments: Dict[Tuple[str, str], float]) -> Dict[str, object]:
+    """
+    Kenar bazlı mesnet momentlerini TWOWAY kayıtlarına uygular.
+    Her doğrultuda o doğrultudaki kenarların en büyük momenti kullanılır;
+    kayıtlar değişmez, değişmeyenler paylaşılır.
+    """
+    balanced = {}
     for sid, res in raw_moments.items():
+        balanced[sid] = res
         if res is None:
-            balanced[sid] = None
             continue
         
-        # Derin kopya
-        balanced[sid] = dict(res)
-        
         if sid not in system.slabs or system.slabs[sid].kind != "TWOWAY":
             continue
         
-        mxn, mxp = res.get("Mx", (None, None))
-        myn, myp = res.get("My", (None, None))
+        mxn, mxp = res.Mx
+        myn, myp = res.My
         
-        # L veya R kenarı için dengelenmiş moment kontrolü
-        for edge in ("L", "R"):
-            if (sid, edge) in edge_balanced:
-                mxn = -edge_balanced[(sid, edge)]  # Negatif moment olarak sakla
-                break
+        # L/R kenarlarından en büyük moment (negatif olarak saklanır)
+        x_vals = [edge_moments[(sid, e)] for e in ("L", "R") if (sid, e) in edge_moments]
+        if x_vals:
+            mxn = -max(x_vals)
         
-        # T veya B kenarı için dengelenmiş moment kontrolü
-        for edge in ("T", "B"):
-            if (sid, edge) in edge_balanced:
-                myn = -edge_balanced[(sid, edge)]  # Negatif moment olarak sakla
-                break
+        # T/B kenarlarından en büyük moment
+        y_vals = [edge_moments[(sid, e)] for e in ("T", "B") if (sid, e) in edge_moments]
+        if y_vals:
+            myn = -max(y_vals)
         
-        balanced[sid]["Mx"] = (mxn, mxp)
-        balanced[sid]["My"] = (myn, myp)
+        balanced[sid] = replace(res, Mx=(mxn, mxp), My=(myn, myp))
+    
+    return balanced
+
+
+JointKey = Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DistributionResult:
+    """distribute_support_moments sonucu."""
+    moments: Dict[str, object]
+    edge_moments: Dict[Tuple[str, str], float]
+    log: List[str]
+    iterations: int
+    residual: float
+    converged: bool
+    rotations: Dict[JointKey, float]  # Sonraki çözüm için başlangıç değeri
+
+
+def distribute_support_moments(system, raw_moments: Dict[str, object], bw: float,
+                               tol: float = 1e-4, max_iter: int = 500,
+                               warm_start: Optional[DistributionResult] = None) -> DistributionResult:
+    """
+    Mesnet momentlerini tüm mesnet grafiği üzerinde iteratif moment dağıtma
+    (Hardy Cross) yöntemiyle dengeler.
+    
+    Her döşeme şeridi bir çubuk, her ortak mesnet bir düğümdür. Bir kenarda
+    birden fazla komşu varsa bunlar aynı düğümde birleşir. Başlangıç
+    (ankastrelik) momentleri katsayı yönteminden gelen mesnet momentleridir;
+    rijitlik K = 1/L, taşıma katsayısı 1/2'dir. Grafiğe bağlı olmayan uçlar
+    ankastre kabul edilir.
+    
+    Çözüm düğüm dönmeleri (θ) cinsinden yürütülür: her adımda tüm düğümlerin
+    dengesizliği birlikte hesaplanıp dağıtılır, en büyük dengesizlik
+    tol × max|M| altına inince durulur. warm_start verilirse önceki çözümün
+    dönmeleri başlangıç değeri olarak kullanılır.
+    
+    Args:
+        system: SlabSystem nesnesi
+        raw_moments: {sid: moment sonucu}
+        bw: Kiriş genişliği (m)
+        tol: Bağıl yakınsama toleransı
+        max_iter: En fazla yineleme sayısı
+        warm_start: Önceki DistributionResult (düzenleme sonrası hızlı yakınsama)
+    
+    Returns:
+        DistributionResult
+    """
+    edges = build_support_edges(system, raw_moments, bw)
+    
+    # Çubuk uçları: (sid, kenar) -> indeks
+    end_index: Dict[Tuple[str, str], int] = {}
+    fem = []
+    stiff = []
+    for e in edges:
+        for key, M, L in (((e.sid1, e.edge1), e.M1, e.L1), ((e.sid2, e.edge2), e.M2, e.L2)):
+            if key not in end_index:
+                end_index[key] = len(fem)
+                fem.append(M)
+                stiff.append(1.0 / L if L > 0 else 0.0)
+    
+    n_end = len(fem)
+    if n_end == 0:
+        return DistributionResult(dict(raw_moments), {}, [], 0, 0.0, True, {})
+    
+    # Düğümler: aynı mesnetteki uçları birleştir (union-find)
+    parent = list(range(n_end))
+    
+    def find(a: int) -> int:
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+    
+    for e in edges:
+        ra = find(end_index[(e.sid1, e.edge1)])
+        rb = find(end_index[(e.sid2, e.edge2)])
+        if ra != rb:
+            parent[rb] = ra
+    
+    ends = list(end_index.keys())
+    root_to_joint: Dict[int, int] = {}
+    joint = np.empty(n_end, dtype=np.int64)
+    for k in range(n_end):
+        joint[k] = root_to_joint.setdefault(find(k), len(root_to_joint))
+    n_joint = len(root_to_joint)
+    
+    # İşaret: R/B uçları +1, L/T uçları -1 (saat yönü pozitif)
+    sign = np.array([1.0 if edge in ("R", "B") else -1.0 for _, edge in ends])
+    # Karşı uç: aynı çubuğun diğer ucu grafikte yoksa ankastre (θ = 0)
+    far_joint = np.array([joint[end_index[(sid, get_opposite_edge(edge))]]
+                          if (sid, get_opposite_edge(edge)) in end_index else n_joint
+                          for sid, edge in ends], dtype=np.int64)
+    fem_arr = np.array(fem, dtype=float)
+    k_arr = np.array(stiff, dtype=float)
+    k_joint = np.bincount(joint, weights=k_arr, minlength=n_joint)
+    k_joint[k_joint < 1e-12] = 1.0
+    
+    joint_keys: List[JointKey] = [()] * n_joint
+    members: Dict[int, List[Tuple[str, str]]] = {}
+    for k, key in enumerate(ends):
+        members.setdefault(int(joint[k]), []).append(key)
+    for j, keys in members.items():
+        joint_keys[j] = tuple(sorted(keys))
+    
+    # θ dizisinin son elemanı ankastre uçlar için sabit 0
+    theta = np.zeros(n_joint + 1)
+    if warm_start is not None:
+        for j, key in enumerate(joint_keys):
+            theta[j] = warm_start.rotations.get(key, 0.0)
+    
+    def end_moments(th: np.ndarray) -> np.ndarray:
+        # Dağıtılan moment: D = -s·K·θ ; karşı uçtan taşınan: -½·D_karşı
+        return fem_arr - sign * k_arr * th[joint] - 0.5 * sign * k_arr * th[far_joint]
+    
+    scale = max(float(np.max(np.abs(fem_arr))), 1e-9)
+    iterations = 0
+    H = end_moments(theta)
+    unbalance = np.bincount(joint, weights=sign * H, minlength=n_joint)
+    residual = float(np.max(np.abs(unbalance)))
+    while residual > tol * scale and iterations < max_iter:
+        theta[:n_joint] += unbalance / k_joint
+        H = end_moments(theta)
+        unbalance = np.bincount(joint, weights=sign * H, minlength=n_joint)
+        residual = float(np.max(np.abs(unbalance)))
+        iterations += 1
+    converged = residual <= tol * scale
+    
+    edge_moments = {key: float(H[k]) for k, key in enumerate(ends)}
+    
+    log = []
+    for j, keys in enumerate(joint_keys):
+        label = " / ".join(f"{sid}-{edge}" for sid, edge in keys)
+        vals = ", ".join(f"{sid}-{edge}: {fem_arr[end_index[(sid, edge)]]:.3f} → {edge_moments[(sid, edge)]:.3f}"
+                         for sid, edge in keys)
+        log.append(f"Düğüm {label}:")
+        log.append(f"  {vals}")
+    log.append("")
+    log.append(f"Moment dağıtma: {iterations} yineleme, artık dengesizlik = {residual:.2e} kNm/m, "
+               f"{'yakınsadı' if converged else 'YAKINSAMADI'}"
+               f"{' (önceki çözümden başlatıldı)' if warm_start is not None else ''}")
     
-    return balanced, log
+    rotations = {key: float(theta[j]) for j, key in enumerate(joint_keys)}
+    return DistributionResult(_apply_edge_moments(system, raw_moments, edge_moments),
+                              edge_moments, log, iterations, residual, converged, rotations)
@@ -8,8 +8,12 @@ from typing import Dict, Tuple, List, Optional
 from struct_design import (
     one_span_coeff_by_fixity, one_way_coefficients,
     oneway_smax_main, oneway_smax_dist, rho_min_oneway,
-    split_duz_pilye, select_rebar_min_area, RebarChoice
+    split_duz_pilye, select_rebar_min_area
 )
+from slab_results import (
+    OneWayMoments, SlabDesign, RebarSet, EdgeContinuity, RebarDirections
+)
+from slab_kinds import register_slab_kind
 
 
 def build_oneway_chain(system, sid: str, direction: str) -> List[str]:
@@ -166,34 +170,23 @@ def owner_slab_for_segment(system, chain: List[str], direction: str, g_mid: floa
     return chain[0]
 
 
-def compute_oneway_per_slab(system, sid: str, bw_val: float) -> Tuple[dict, List[str]]:
+def oneway_chain_spans(system, chain: List[str], direction: str, bw_val: float,
+                       steps: Optional[List[str]] = None) -> List[Tuple[float, str, float]]:
     """
-    Tek doğrultulu döşeme için moment hesabı yapar.
+    Zincirin mesnet gridline'larını bulup açıklıklara böler.
     
     Args:
         system: SlabSystem nesnesi
-        sid: Döşeme ID'si
+        chain: build_oneway_chain sonucu
+        direction: Taşıma doğrultusu ("X" veya "Y")
         bw_val: Kiriş genişliği (m)
+        steps: Hesap adımlarının ekleneceği liste (opsiyonel)
     
     Returns:
-        (sonuç_dict, hesap_adımları_listesi)
+        [(L_short, sahip_döşeme, Lnet), ...] açıklık listesi
     """
-    steps = []
-    s0 = system.slabs[sid]
-    w = s0.pd * s0.b
-    steps.append(f"w = pd*b = {s0.pd:.3f}*{s0.b:.3f} = {w:.3f} kN/m")
-
-    Lx_g, Ly_g = s0.size_m_gross()
-    direction = "Y" if Lx_g < Ly_g else "X"
-    steps.append(f"Otomatik açıklık yönü: Lx={Lx_g:.3f}, Ly={Ly_g:.3f} -> yön={direction}")
-
-    chain = build_oneway_chain(system, sid, direction)
-    steps.append(f"Zincir: {chain}")
-
-    (fixed_start, fixed_end), (continuous_start, continuous_end) = chain_end_fixity(system, chain, direction)
-    steps.append(f"Uzun kenar mesnet durumu:")
-    steps.append(f"  START: {'Ankastre (TWOWAY komşu)' if fixed_start else ('Sürekli (ONEWAY/BALCONY komşu)' if continuous_start else 'Serbest')}")
-    steps.append(f"  END: {'Ankastre (TWOWAY komşu)' if fixed_end else ('Sürekli (ONEWAY/BALCONY komşu)' if continuous_end else 'Serbest')}")
+    if steps is None:
+        steps = []
 
     # Uzun kenar yönü = taşıma doğrultusunun tersi
     long_edge_direction = "Y" if direction == "X" else "X"
@@ -221,12 +214,71 @@ def compute_oneway_per_slab(system, sid: str, bw_val: float) -> Tuple[dict, List
         # Kısa açıklık uzunluğunu kullan (taşıma doğrultusu)
         Lx_owner, Ly_owner = s_owner.size_m_gross()
         L_short = min(Lx_owner, Ly_owner)
-        left_is_beam = system.is_beam_gridline_for_slab(owner, direction, a)
-        right_is_beam = system.is_beam_gridline_for_slab(owner, direction, b_g)
+        left_is_beam = system.is_beam_gridline_for_slab(owner, long_edge_direction, a)
+        right_is_beam = system.is_beam_gridline_for_slab(owner, long_edge_direction, b_g)
         Lnet = system.net_span(L_short, left_is_beam, right_is_beam, bw_val)
         spans.append((L_short, owner, Lnet))
         steps.append(f"Span [{a}->{b_g}] owner={owner}: L_short={L_short:.3f} (hesapta kullanılan), Lnet={Lnet:.3f}")
 
+    return spans
+
+
+def _apply_load_envelope(system, sid: str, bw_val: float, chain: List[str],
+                         Mpos: Optional[float], Mneg: Optional[float],
+                         steps: List[str]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Zincirde yük durumu tanımlı döşeme varsa, dama yüklemesi dahil
+    kombinasyon zarfını katsayı momentleriyle birleştirir: tasarımda
+    büyük açıklık momenti ve en olumsuz mesnet momenti kullanılır.
+
+    Returns:
+        (Mpos_max, Mneg_min)
+    """
+    if not any(system.slabs[x].loads is not None for x in chain):
+        return Mpos, Mneg
+    env = system.compute_oneway_envelope(sid, bw_val)
+    Mpos_env, Mneg_env = env.slab_envelope(sid)
+    if Mpos_env is None:
+        return Mpos, Mneg
+    steps.append(f"Yük durumu zarfı ({len(env.combination_names)} kombinasyon): "
+                 f"M+ = {Mpos_env:.3f}, M- = {Mneg_env:.3f} kNm/m")
+    Mpos = Mpos_env if Mpos is None else max(Mpos, Mpos_env)
+    Mneg = Mneg_env if Mneg is None else min(Mneg, Mneg_env)
+    steps.append(f"Tasarım (katsayı ve zarfın olumsuzu): M+ = {Mpos:.3f}, M- = {Mneg:.3f} kNm/m")
+    return Mpos, Mneg
+
+
+def compute_oneway_per_slab(system, sid: str, bw_val: float) -> Tuple[OneWayMoments, List[str]]:
+    """
+    Tek doğrultulu döşeme için moment hesabı yapar.
+    
+    Args:
+        system: SlabSystem nesnesi
+        sid: Döşeme ID'si
+        bw_val: Kiriş genişliği (m)
+    
+    Returns:
+        (OneWayMoments, hesap_adımları_listesi)
+    """
+    steps = []
+    s0 = system.slabs[sid]
+    w = s0.pd * s0.b
+    steps.append(f"w = pd*b = {s0.pd:.3f}*{s0.b:.3f} = {w:.3f} kN/m")
+
+    Lx_g, Ly_g = s0.size_m_gross()
+    direction = "Y" if Lx_g < Ly_g else "X"
+    steps.append(f"Otomatik açıklık yönü: Lx={Lx_g:.3f}, Ly={Ly_g:.3f} -> yön={direction}")
+
+    chain = build_oneway_chain(system, sid, direction)
+    steps.append(f"Zincir: {chain}")
+
+    (fixed_start, fixed_end), (continuous_start, continuous_end) = chain_end_fixity(system, chain, direction)
+    steps.append(f"Uzun kenar mesnet durumu:")
+    steps.append(f"  START: {'Ankastre (TWOWAY komşu)' if fixed_start else ('Sürekli (ONEWAY/BALCONY komşu)' if continuous_start else 'Serbest')}")
+    steps.append(f"  END: {'Ankastre (TWOWAY komşu)' if fixed_end else ('Sürekli (ONEWAY/BALCONY komşu)' if continuous_end else 'Serbest')}")
+
+    spans = oneway_chain_spans(system, chain, direction, bw_val, steps)
+
     n_spans = len(spans)
     steps.append(f"Toplam span: {n_spans}")
 
@@ -242,12 +294,13 @@ def compute_oneway_per_slab(system, sid: str, bw_val: float) -> Tuple[dict, List
         Mneg_start = c_start * w * L**2
         Mneg_end = c_end * w * L**2
         steps.append(f"M+ = {Mpos:.3f}, M-start={Mneg_start:.3f}, M-end={Mneg_end:.3f}")
-        return {
-            "auto_dir": direction, "chain": chain,
-            "fixed_start": fixed_start, "fixed_end": fixed_end,
-            "continuous_start": continuous_start, "continuous_end": continuous_end,
-            "w": w, "Mpos_max": Mpos, "Mneg_min": min(Mneg_start, Mneg_end)
-        }, steps
+        Mpos, Mneg = _apply_load_envelope(system, sid, bw_val, chain, Mpos, min(Mneg_start, Mneg_end), steps)
+        return OneWayMoments(
+            auto_dir=direction, chain=tuple(chain), w=w,
+            Mpos_max=Mpos, Mneg_min=Mneg,
+            fixed_start=fixed_start, fixed_end=fixed_end,
+            continuous_start=continuous_start, continuous_end=continuous_end
+        ), steps
 
     support_c, span_c = one_way_coefficients(n_spans)
     Ls = [L for (L, *_rest) in spans]
@@ -288,15 +341,16 @@ def compute_oneway_per_slab(system, sid: str, bw_val: float) -> Tuple[dict, List
     for i in sorted(touching):
         steps.append(f"  Mesnet{i} M- = {support_Mneg[i]:.3f} kNm/m (katsayı: 1/{abs(1/support_c[i]):.0f})")
 
-    return {
-        "auto_dir": direction, "chain": chain,
-        "w": w, "Mpos_max": Mpos_max, "Mneg_min": Mneg_min
-    }, steps
+    Mpos_max, Mneg_min = _apply_load_envelope(system, sid, bw_val, chain, Mpos_max, Mneg_min, steps)
+    return OneWayMoments(
+        auto_dir=direction, chain=tuple(chain), w=w,
+        Mpos_max=Mpos_max, Mneg_min=Mneg_min
+    ), steps
 
 
-def compute_oneway_report(system, sid: str, res: dict, conc: str, steel: str, 
+def compute_oneway_report(system, sid: str, res: OneWayMoments, conc: str, steel: str, 
                           h: float, cover: float, bw: float,
-                          neighbor_pilye_areas: Optional[Dict[str, float]] = None) -> Tuple[dict, List[str]]:
+                          neighbor_pilye_areas: Optional[Dict[str, float]] = None) -> Tuple[SlabDesign, List[str]]:
     """
     Tek doğrultulu döşeme için donatı hesabı ve raporlama yapar.
     
@@ -312,18 +366,18 @@ def compute_oneway_report(system, sid: str, res: dict, conc: str, steel: str,
         neighbor_pilye_areas: Komşu döşemelerin pilye alanları {sid: area_mm2_per_m}
     
     Returns:
-        (tasarım_sonucu_dict, rapor_satırları_listesi)
+        (SlabDesign, rapor_satırları_listesi)
     """
     lines = []
     
-    Mpos = res["Mpos_max"] or 0.0
-    Mneg = res["Mneg_min"] or 0.0
+    Mpos = res.Mpos_max or 0.0
+    Mneg = res.Mneg_min or 0.0
     smax = oneway_smax_main(h)
     d_mm = h - cover  # efektif derinlik
     
     # Kenar süreklilik analizi - TÜM 4 KENAR BAĞIMSIZ KONTROL
-    chain = res.get("chain", [sid])
-    auto_dir = res.get("auto_dir", "X")
+    chain = res.chain or (sid,)
+    auto_dir = res.auto_dir or "X"
     
     # Tüm kenarların komşuluk durumunu al
     (Lf, Rf, Tf, Bf), (La, Ra, Ta, Ba), _ = system.twoway_edge_continuity_full(sid)
@@ -542,33 +596,69 @@ def compute_oneway_report(system, sid: str, res: dict, conc: str, steel: str,
     lines.append(f"    Mesnet Ek (sürekli uzun): START={ch_mesnet_ek_start.label() if ch_mesnet_ek_start else '-'}, END={ch_mesnet_ek_end.label() if ch_mesnet_ek_end else '-'}")
     lines.append("")
     
-    design_res = {
-        "kind": "ONEWAY", "auto_dir": res.get("auto_dir"), "cover_mm": cover,
-        "choices": {
-            "main": ch_main, 
-            "duz": duz,
-            "pilye": pilye,
-            "dist": ch_dist, 
-            "kenar_mesnet_start": ch_kenar_start,
-            "kenar_mesnet_end": ch_kenar_end,
-            "ic_mesnet_start": ch_ic_mesnet_start,
-            "ic_mesnet_end": ch_ic_mesnet_end,
-            "mesnet_ek_start": ch_mesnet_ek_start,
-            "mesnet_ek_end": ch_mesnet_ek_end
-        },
-        "edge_continuity": {
-            "uzun_start": uzun_kenar_start_surekli,
-            "uzun_end": uzun_kenar_end_surekli,
-            "kisa_start": kisa_kenar_start_surekli,
-            "kisa_end": kisa_kenar_end_surekli
-        },
-        "dogrultular": {
-            "ana_donati": kisa_kenar_dogrultusu,           # kısa kenara paralel
-            "dagitma": uzun_kenar_dogrultusu,              # uzun kenara paralel
-            "boyuna_kenar_mesnet": uzun_kenar_dogrultusu,  # uzun kenara paralel
-            "boyuna_ic_mesnet": uzun_kenar_dogrultusu,     # uzun kenara paralel
-            "ilave_mesnet": kisa_kenar_dogrultusu          # kısa kenara paralel
-        }
-    }
+    design_res = SlabDesign(
+        kind="ONEWAY", auto_dir=res.auto_dir, cover_mm=cover,
+        choices=RebarSet(
+            main=ch_main,
+            duz=duz,
+            pilye=pilye,
+            dist=ch_dist,
+            kenar_mesnet_start=ch_kenar_start,
+            kenar_mesnet_end=ch_kenar_end,
+            ic_mesnet_start=ch_ic_mesnet_start,
+            ic_mesnet_end=ch_ic_mesnet_end,
+            mesnet_ek_start=ch_mesnet_ek_start,
+            mesnet_ek_end=ch_mesnet_ek_end
+        ),
+        edge_continuity=EdgeContinuity(
+            uzun_start=uzun_kenar_start_surekli,
+            uzun_end=uzun_kenar_end_surekli,
+            kisa_start=kisa_kenar_start_surekli,
+            kisa_end=kisa_kenar_end_surekli
+        ),
+        dogrultular=RebarDirections(
+            ana_donati=kisa_kenar_dogrultusu,           # kısa kenara paralel
+            dagitma=uzun_kenar_dogrultusu,              # uzun kenara paralel
+            boyuna_kenar_mesnet=uzun_kenar_dogrultusu,  # uzun kenara paralel
+            boyuna_ic_mesnet=uzun_kenar_dogrultusu,     # uzun kenara paralel
+            ilave_mesnet=kisa_kenar_dogrultusu          # kısa kenara paralel
+        )
+    )
     
     return design_res, lines
+
+
+# =========================================================
+# Döşeme tipi kaydı (slab_kinds)
+# =========================================================
+def _oneway_solve(system, sid: str, params) -> Tuple[OneWayMoments, List[str]]:
+    return compute_oneway_per_slab(system, sid, params.bw)
+
+
+def _oneway_span_design(res: OneWayMoments, h: float) -> Tuple[float, float]:
+    return res.Mpos_max or 0.0, oneway_smax_main(h)
+
+
+def _oneway_report(system, sid: str, res: OneWayMoments, balanced, pilye_areas: Dict[str, float],
+                   params) -> Tuple[SlabDesign, List[str]]:
+    return compute_oneway_report(
+        system, sid, res, params.conc, params.steel, params.h, params.cover, params.bw,
+        neighbor_pilye_areas=pilye_areas
+    )
+
+
+def _oneway_support_moment(system, sid: str, edge: str, bw: float, plate_solver: bool = False) -> float:
+    r, _ = compute_oneway_per_slab(system, sid, bw)
+    return abs(r.Mneg_min) if r.Mneg_min is not None else 0.0
+
+
+def _oneway_coupled(system, sid: str) -> List[str]:
+    """Aynı zincirdeki döşemeler birlikte çözülür."""
+    Lx_g, Ly_g = system.slabs[sid].size_m_gross()
+    return build_oneway_chain(system, sid, "Y" if Lx_g < Ly_g else "X")
+
+
+register_slab_kind(
+    "ONEWAY", solve=_oneway_solve, span_design=_oneway_span_design, report=_oneway_report,
+    support_moment=_oneway_support_moment, coupled=_oneway_coupled, balance_order=1,
+)
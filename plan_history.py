@@ -0,0 +1,83 @@
+"""
+Plan Geçmişi Modülü
+===================
+Plan düzenlemeleri için geri al / yinele geçmişi.
+
+Her anlık görüntü (PlanSnapshot) döşeme sözlüğünü, kiriş kümesini
+(frozenset), o plana ait SlabSystem'i ve varsa o plan için tamamlanmış
+hesap sonucunu tutar. Anlık görüntüler kopyalanmaz, paylaşılır:
+
+- RealSlab nesneleri yerinde değiştirilmez (düzenleme yeni nesne üretir),
+  bu yüzden ardışık görüntüler aynı döşeme nesnelerini paylaşır.
+- Arayüz, kayda alınmış sözlüğü/kümeyi değiştirmeden önce kopyalar
+  (yazarken kopyala), böylece geri alma yalnızca referans atamasıdır.
+- SlabSystem her senkronizasyonda yeniden kurulduğundan görüntüdeki sistem
+  ve sonuç birlikte geri yüklenir; yeniden hesap gerekmez.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, FrozenSet, List, Optional
+
+# Saklanacak en fazla geri alma adımı
+HISTORY_LIMIT = 200
+
+
+@dataclass(frozen=True, slots=True)
+class PlanSnapshot:
+    """Bir plan durumu (alanlar paylaşılır; değiştirilmemelidir)."""
+    slabs: Dict[str, Any]          # sid -> RealSlab
+    beams: FrozenSet[tuple]        # Kiriş kenarları
+    system: Any                    # Bu plandan kurulan SlabSystem
+    result: Any = None             # Bu plan için tamamlanmış SolveResult (yoksa None)
+
+
+class PlanHistory:
+    """Geri al / yinele yığınları; her işlem O(1)."""
+
+    def __init__(self, limit: int = HISTORY_LIMIT):
+        self.limit = limit
+        self.current: Optional[PlanSnapshot] = None
+        self._undo: List[PlanSnapshot] = []
+        self._redo: List[PlanSnapshot] = []
+
+    def reset(self, snapshot: PlanSnapshot):
+        """Geçmişi temizler ve başlangıç durumunu ayarlar."""
+        self.current = snapshot
+        self._undo.clear()
+        self._redo.clear()
+
+    def push(self, snapshot: PlanSnapshot):
+        """Yeni düzenlemeyi kaydeder; yinele yığını boşaltılır."""
+        if self.current is not None:
+            self._undo.append(self.current)
+            if len(self._undo) > self.limit:
+                del self._undo[0]
+        self.current = snapshot
+        self._redo.clear()
+
+    def attach_result(self, system, result):
+        """Hesap sonucu, hesaplanan sistem hâlâ güncel durumsa ona eklenir."""
+        if self.current is not None and self.current.system is system:
+            self.current = replace(self.current, result=result)
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo(self) -> Optional[PlanSnapshot]:
+        """Önceki duruma döner (yoksa None)."""
+        if not self._undo:
+            return None
+        self._redo.append(self.current)
+        self.current = self._undo.pop()
+        return self.current
+
+    def redo(self) -> Optional[PlanSnapshot]:
+        """Geri alınan durumu yeniden uygular (yoksa None)."""
+        if not self._redo:
+            return None
+        self._undo.append(self.current)
+        self.current = self._redo.pop()
+        return self.current
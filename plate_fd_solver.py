@@ -0,0 +1,342 @@
+"""
+Sonlu Farklar Plak Çözücüsü Modülü
+==================================
+Katsayı yöntemine (ALPHA_TABLE) alternatif olarak dikdörtgen plakları
+biharmonik denklemin (D·∇⁴w = q) sonlu farklar çözümüyle hesaplar.
+
+- Sürekli kenarlar ankastre (w = 0, ∂w/∂n = 0), diğerleri basit mesnet
+  (w = 0, M_n = 0) kabul edilir; sınır koşulları hayali düğümlerle uygulanır.
+- Katsayı matrisi seyrek (CSR) kurulur. SciPy varsa splu ile, yoksa saf
+  NumPy bant Cholesky ayrıştırmasıyla çözülür (matris simetrik pozitif
+  tanımlı, bant genişliği kısa doğrultudaki düğüm sayısının iki katı).
+  Ayrıştırma geometri ve sınır koşulu imzasına göre önbelleklenir; yeni yük
+  durumları aynı ayrıştırmayı kullanır.
+- Sonuç TwoWayMoments olarak döner ve mevcut design_main_rebar_from_M
+  akışına doğrudan girer.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple, List, Optional, Sequence
+import numpy as np
+from slab_results import TwoWayMoments
+
+try:
+    from scipy.sparse import csc_matrix
+    from scipy.sparse.linalg import splu
+except ImportError:  # SciPy opsiyonel
+    csc_matrix = None
+    splu = None
+
+# Betonarme için Poisson oranı
+NU_CONCRETE = 0.2
+
+# Kısa kenar boyunca hedef bölme sayısı ve en fazla bilinmeyen sayısı
+FD_DIVISIONS_SHORT = 20
+FD_MAX_UNKNOWNS = 2500
+
+BoundarySig = Tuple[bool, bool, bool, bool]  # (L, R, T, B) ankastre mi
+
+
+@dataclass(frozen=True, slots=True)
+class PlateMoments:
+    """Bir yük durumu için plak moment özetleri (kNm/m, büyüklük olarak)."""
+    Mx_pos: float
+    My_pos: float
+    M_L: Optional[float]  # Ankastre kenar mesnet momentleri (basit mesnette None)
+    M_R: Optional[float]
+    M_T: Optional[float]
+    M_B: Optional[float]
+    w_max: float          # D = 1 için en büyük sehim (q·L⁴ birimi)
+
+
+class PlateFactor:
+    """
+    Belirli bir ağ ve sınır koşulu için ayrıştırılmış biharmonik operatör.
+    Birden fazla yük durumu (çok sağ taraf) aynı ayrıştırma ile çözülür.
+    """
+
+    def __init__(self, nx: int, ny: int, hx: float, hy: float, clamped: BoundarySig):
+        self.nx, self.ny = nx, ny
+        self.hx, self.hy = hx, hy
+        self.clamped = clamped
+        rows, cols, vals = _assemble_biharmonic(nx, ny, hx, hy, clamped)
+        n = (nx - 1) * (ny - 1)
+        self.n = n
+        if splu is not None:
+            A = csc_matrix((vals, (rows, cols)), shape=(n, n))
+            self._lu = splu(A)
+            self._band = None
+        else:
+            self._lu = None
+            self._pos = None
+            if ny > nx:
+                # Bant genişliği iç indeksin düğüm sayısıyla orantılı: kısa doğrultuyu içe al
+                i, j = np.divmod(np.arange(n), ny - 1)
+                self._pos = j * (nx - 1) + i
+                rows, cols = self._pos[rows], self._pos[cols]
+            self._band = _BandedCholesky(rows, cols, vals, n)
+
+    def solve(self, q: np.ndarray) -> np.ndarray:
+        """
+        Düğüm yüklerini (n,) veya (n, k) çözer; D = 1 için sehim döndürür.
+        """
+        q = np.asarray(q, dtype=float)
+        if self._lu is not None:
+            return self._lu.solve(q)
+        if self._pos is None:
+            return self._band.solve(q)
+        qp = np.empty_like(q)
+        qp[self._pos] = q
+        return self._band.solve(qp)[self._pos]
+
+    def deflection_grid(self, w: np.ndarray) -> np.ndarray:
+        """Bilinmeyen vektörünü sınır düğümleri dahil (nx+1, ny+1) ağa yerleştirir."""
+        W = np.zeros((self.nx + 1, self.ny + 1))
+        W[1:-1, 1:-1] = w.reshape(self.nx - 1, self.ny - 1)
+        return W
+
+    def moments(self, w: np.ndarray, nu: float) -> PlateMoments:
+        """Sehimden açıklık ve kenar momentlerini hesaplar (D = 1)."""
+        W = self.deflection_grid(w)
+        hx2, hy2 = self.hx ** 2, self.hy ** 2
+        wxx = (W[:-2, 1:-1] - 2 * W[1:-1, 1:-1] + W[2:, 1:-1]) / hx2
+        wyy = (W[1:-1, :-2] - 2 * W[1:-1, 1:-1] + W[1:-1, 2:]) / hy2
+        Mx = -(wxx + nu * wyy)
+        My = -(wyy + nu * wxx)
+
+        # Ankastre kenarda hayali düğüm = iç düğüm → w_nn = 2·w_1/h², w_tt = 0
+        cL, cR, cT, cB = self.clamped
+        M_L = float(np.max(2 * W[1, 1:-1] / hx2)) if cL else None
+        M_R = float(np.max(2 * W[-2, 1:-1] / hx2)) if cR else None
+        M_T = float(np.max(2 * W[1:-1, 1] / hy2)) if cT else None
+        M_B = float(np.max(2 * W[1:-1, -2] / hy2)) if cB else None
+        return PlateMoments(float(np.max(Mx)), float(np.max(My)),
+                            M_L, M_R, M_T, M_B, float(np.max(W)))
+
+
+class _BandedCholesky:
+    """
+    Simetrik pozitif tanımlı bant matris için A = Rᵀ·R ayrıştırması (saf NumPy).
+    R üst bant olarak R[i, k] = R(i, i+k) biçiminde tutulur; ayrıştırma
+    (p+1)×(p+1) kayan pencereyle O(n·p²), her çözüm O(n·p) işlem yapar.
+    """
+
+    def __init__(self, rows: np.ndarray, cols: np.ndarray, vals: np.ndarray, n: int):
+        p = int(np.max(np.abs(rows - cols))) if len(rows) else 0
+        upper = cols >= rows
+        band = np.zeros((n, p + 1))  # band[i, k] = A(i, i+k)
+        np.add.at(band, (rows[upper], cols[upper] - rows[upper]), vals[upper])
+        self.n, self.p = n, p
+
+        # Pencere: A[i:i+p+1, i:i+p+1]'in güncellenmiş hali
+        k = np.arange(p + 1)
+        win = np.zeros((p + 1, p + 1))
+        for r in range(p + 1):
+            win[r, r:] = band[r, :p + 1 - r]
+        win = np.triu(win) + np.triu(win, 1).T
+        R = np.zeros((n, p + 1))
+        for i in range(n):
+            d = np.sqrt(win[0, 0])
+            v = win[0, 1:] / d
+            R[i, 0] = d
+            R[i, 1:] = v
+            nxt = np.empty_like(win)
+            nxt[:p, :p] = win[1:, 1:] - np.outer(v, v)
+            # Yeni satır/sütun: t = i+p+1 düğümünün bant içindeki bağlantıları
+            t = i + p + 1
+            col = band[t - p + k[:-1], p - k[:-1]] if t < n else np.zeros(p)
+            nxt[:p, p] = col
+            nxt[p, :p] = col
+            nxt[p, p] = band[t, 0] if t < n else 1.0
+            win = nxt
+        self._R = R
+        # İleri yerine koyma için Rᵀ satırları: Rt[i, k] = R(i-p+k, i)
+        src = np.arange(n)[:, None] - p + k[None, :-1]
+        valid = src >= 0
+        off = np.broadcast_to(p - k[:-1], src.shape)
+        Rt = np.zeros((n, p))
+        Rt[valid] = R[src[valid], off[valid]]
+        self._Rt = Rt
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        n, p = self.n, self.p
+        R, Rt, d = self._R, self._Rt, self._R[:, 0]
+        b = np.asarray(b, dtype=float)
+        extra = b.shape[1:]
+        y = np.zeros((n + p,) + extra)  # Başta p sıfır: y[p + i] = y_i
+        for i in range(n):
+            y[p + i] = (b[i] - Rt[i] @ y[i:p + i]) / d[i]
+        x = np.zeros((n + p,) + extra)  # Sonda p sıfır
+        for i in range(n - 1, -1, -1):
+            x[i] = (y[p + i] - R[i, 1:] @ x[i + 1:i + p + 1]) / d[i]
+        return x[:n]
+
+
+def _assemble_biharmonic(nx: int, ny: int, hx: float, hy: float,
+                         clamped: BoundarySig) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ∇⁴w = ∂⁴w/∂x⁴ + 2∂⁴w/∂x²∂y² + ∂⁴w/∂y⁴ için 13 noktalı şablonu kurar.
+    Sınır düğümlerinde w = 0; sınır dışındaki hayali düğüm, ankastre kenarda
+    +w_iç, basit mesnette -w_iç alınır.
+
+    Returns:
+        (satır, sütun, değer) dizileri (COO)
+    """
+    cL, cR, cT, cB = clamped
+    sx = {-1: 1.0 if cL else -1.0, nx + 1: 1.0 if cR else -1.0}
+    sy = {-1: 1.0 if cT else -1.0, ny + 1: 1.0 if cB else -1.0}
+    mx = ny - 1
+
+    def idx(i: int, j: int) -> int:
+        return (i - 1) * mx + (j - 1)
+
+    c4x = 1.0 / hx ** 4
+    c4y = 1.0 / hy ** 4
+    cxy = 2.0 / (hx ** 2 * hy ** 2)
+    d4 = (1.0, -4.0, 6.0, -4.0, 1.0)
+    d2 = (1.0, -2.0, 1.0)
+
+    rows, cols, vals = [], [], []
+
+    def add(r: int, i: int, j: int, v: float):
+        # Sınır (w = 0) atlanır; hayali düğümler iç düğüme yansıtılır
+        if i in sx:
+            v *= sx[i]
+            i = 1 if i == -1 else nx - 1
+        if j in sy:
+            v *= sy[j]
+            j = 1 if j == -1 else ny - 1
+        if i <= 0 or i >= nx or j <= 0 or j >= ny:
+            return
+        rows.append(r)
+        cols.append(idx(i, j))
+        vals.append(v)
+
+    for i in range(1, nx):
+        for j in range(1, ny):
+            r = idx(i, j)
+            for a, c in zip(range(-2, 3), d4):
+                add(r, i + a, j, c * c4x)
+                add(r, i, j + a, c * c4y)
+            for a, ca in zip(range(-1, 2), d2):
+                for b, cb in zip(range(-1, 2), d2):
+                    add(r, i + a, j + b, ca * cb * cxy)
+
+    return np.array(rows), np.array(cols), np.array(vals)
+
+
+_FACTOR_CACHE: Dict[Tuple, PlateFactor] = {}
+
+
+def plate_grid(Lx: float, Ly: float, divisions: int = FD_DIVISIONS_SHORT) -> Tuple[int, int]:
+    """
+    Kısa kenarda yaklaşık `divisions` bölme olacak şekilde ağ boyutu seçer.
+    Bilinmeyen sayısı FD_MAX_UNKNOWNS ile sınırlanır.
+    """
+    ls = min(Lx, Ly)
+    nx = max(4, round(divisions * Lx / ls))
+    ny = max(4, round(divisions * Ly / ls))
+    while (nx - 1) * (ny - 1) > FD_MAX_UNKNOWNS:
+        nx = max(4, nx * 9 // 10)
+        ny = max(4, ny * 9 // 10)
+    return nx, ny
+
+
+def get_plate_factor(Lx: float, Ly: float, clamped: BoundarySig,
+                     divisions: int = FD_DIVISIONS_SHORT) -> PlateFactor:
+    """
+    Geometri ve sınır koşulu imzasına göre önbellekli ayrıştırmayı döndürür.
+    """
+    key = (round(Lx, 4), round(Ly, 4), tuple(clamped), divisions)
+    fac = _FACTOR_CACHE.get(key)
+    if fac is None:
+        nx, ny = plate_grid(Lx, Ly, divisions)
+        fac = PlateFactor(nx, ny, Lx / nx, Ly / ny, tuple(clamped))
+        _FACTOR_CACHE[key] = fac
+    return fac
+
+
+def clear_plate_cache():
+    """Ayrıştırma önbelleğini boşaltır."""
+    _FACTOR_CACHE.clear()
+
+
+def solve_plate(Lx: float, Ly: float, clamped: BoundarySig, loads: Sequence[float],
+                nu: float = NU_CONCRETE, divisions: int = FD_DIVISIONS_SHORT) -> List[PlateMoments]:
+    """
+    Düzgün yayılı yük durumları için plak momentlerini hesaplar.
+
+    Args:
+        Lx, Ly: Plak açıklıkları (m)
+        clamped: (L, R, T, B) kenarları ankastre mi
+        loads: Yük durumları (kN/m²); tek ayrıştırma ile birlikte çözülür
+        nu: Poisson oranı
+        divisions: Kısa kenardaki bölme sayısı
+
+    Returns:
+        Her yük durumu için PlateMoments
+    """
+    fac = get_plate_factor(Lx, Ly, clamped, divisions)
+    Q = np.outer(np.ones(fac.n), np.asarray(loads, dtype=float))
+    Wk = fac.solve(Q)
+    if Wk.ndim == 1:
+        Wk = Wk[:, None]
+    return [fac.moments(Wk[:, k], nu) for k in range(Wk.shape[1])]
+
+
+def compute_twoway_per_slab_fd(system, sid: str, bw: float,
+                               nu: float = NU_CONCRETE) -> Tuple[TwoWayMoments, List[str]]:
+    """
+    Çift doğrultulu döşeme momentlerini sonlu farklar plak çözümüyle hesaplar.
+    compute_twoway_per_slab ile aynı kaydı döndürür; tam sürekli kenarlar
+    ankastre, diğerleri basit mesnetli kabul edilir.
+
+    Args:
+        system: SlabSystem nesnesi
+        sid: Döşeme ID'si
+        bw: Kiriş genişliği (m)
+        nu: Poisson oranı
+
+    Returns:
+        (TwoWayMoments, hesap_adımları_listesi)
+    """
+    from twoway_slab import twoway_net_LxLy, twoway_edge_continuity_full, pick_two_way_case_exact
+
+    steps = []
+    s = system.slabs[sid]
+    pd = s.pd
+    Lx_n, Ly_n, st_net = twoway_net_LxLy(system, sid, bw)
+    steps.extend(st_net)
+
+    ll = max(Lx_n, Ly_n)
+    ls = min(Lx_n, Ly_n)
+    m = ll / ls if ls > 0 else 1.0
+    steps.append(f"m = {ll:.3f}/{ls:.3f} = {m:.3f}")
+
+    (Lf, Rf, Tf, Bf), *_ = twoway_edge_continuity_full(system, sid)
+    steps.append(f"Full süreklilik: L={Lf}, R={Rf}, T={Tf}, B={Bf}")
+    case = pick_two_way_case_exact(Lx_n, Ly_n, Lf, Rf, Tf, Bf)
+
+    fac = get_plate_factor(Lx_n, Ly_n, (Lf, Rf, Tf, Bf))
+    pm = fac.moments(fac.solve(np.full(fac.n, pd)), nu)
+    steps.append(f"Sonlu farklar plak çözümü: ağ {fac.nx}×{fac.ny}, ν = {nu}, "
+                 f"çözücü = {'SciPy splu' if splu is not None else 'NumPy bant Cholesky'}")
+    steps.append(f"  Mx_pos = {pm.Mx_pos:.3f}, My_pos = {pm.My_pos:.3f} kNm/m")
+
+    def edge_max(a: Optional[float], b: Optional[float]) -> Optional[float]:
+        vals = [v for v in (a, b) if v is not None]
+        return max(vals) if vals else None
+
+    Mx_neg = edge_max(pm.M_L, pm.M_R)
+    My_neg = edge_max(pm.M_T, pm.M_B)
+    fmt = lambda v: f"{v:.3f}" if v is not None else "-"
+    steps.append(f"  Mx_neg = {fmt(Mx_neg)}, My_neg = {fmt(My_neg)} kNm/m")
+
+    short_dir = "X" if Lx_n <= Ly_n else "Y"
+    steps.append(f"Kısa doğrultu: {short_dir}")
+
+    return TwoWayMoments(
+        Lx_net=Lx_n, Ly_net=Ly_n, ls=ls, m=m,
+        case=case, Mx=(Mx_neg, pm.Mx_pos), My=(My_neg, pm.My_pos),
+        short_dir=short_dir
+    ), steps
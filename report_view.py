@@ -0,0 +1,178 @@
+"""
+Rapor Görünümü Modülü
+=====================
+Hesap raporunun widget dışında tutulan modeli ve sanallaştırılmış görünümü.
+
+- ReportModel başlık ve döşeme bölümlerini ayrı ayrı saklar (Tk'dan bağımsız).
+  Satırlar yalnızca gerektiğinde bölünür; filtreye göre satır düzeni
+  (ReportLayout) önek toplamlarıyla kurulur.
+- VirtualReportView yalnızca ekranda görünen satırları Text widget'ına yazar;
+  kaydırma çubuğu tüm raporun satır sayısına göre çalışır. Döşemeye atlama
+  ve döşeme ID/tipine göre filtreleme desteklenir.
+"""
+
+import bisect
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Optional, Sequence
+
+HEADER = None  # Başlık bölümünün anahtarı (mesnet dengelemesi dahil)
+
+
+class ReportModel:
+    """Başlık + sıralı döşeme bölümleri."""
+
+    def __init__(self, header: str = "", sections: Optional[Dict[str, str]] = None,
+                 order: Optional[Sequence[str]] = None):
+        self.header = header
+        self.sections = dict(sections or {})
+        self.order = list(order) if order is not None else sorted(self.sections)
+        self._lines: Dict[Optional[str], List[str]] = {}
+
+    @classmethod
+    def from_result(cls, result) -> "ReportModel":
+        """SolveResult'tan model kurar (bölümler kopyalanmaz, paylaşılır)."""
+        return cls(result.header, result.sections)
+
+    def text(self) -> str:
+        """Tam rapor metni."""
+        return self.header + "".join(self.sections[sid] for sid in self.order)
+
+    def lines_of(self, key: Optional[str]) -> List[str]:
+        """Bölümün satırları (ilk istekte bölünür ve saklanır)."""
+        lines = self._lines.get(key)
+        if lines is None:
+            text = self.header if key is HEADER else self.sections[key]
+            lines = text.split("\n")
+            if lines and lines[-1] == "":
+                lines.pop()
+            self._lines[key] = lines
+        return lines
+
+    def matching(self, query: str = "") -> List[Optional[str]]:
+        """
+        Filtreye uyan bölümler. Boş filtrede başlık ve tüm döşemeler;
+        aksi halde ID'si veya başlık satırı (tip) filtreyi içeren döşemeler.
+        """
+        q = query.strip().lower()
+        if not q:
+            return [HEADER] + self.order
+        return [sid for sid in self.order
+                if q in sid.lower() or any(q in l.lower() for l in self.lines_of(sid)[:1])]
+
+    def layout(self, query: str = "") -> "ReportLayout":
+        return ReportLayout(self, self.matching(query))
+
+
+class ReportLayout:
+    """Filtrelenmiş bölümlerin satır düzeni (önek toplamlarıyla)."""
+
+    def __init__(self, model: ReportModel, parts: List[Optional[str]]):
+        self.model = model
+        self.parts = parts
+        self.offsets = [0]
+        for key in parts:
+            self.offsets.append(self.offsets[-1] + len(model.lines_of(key)))
+
+    @property
+    def total_lines(self) -> int:
+        return self.offsets[-1]
+
+    def line_of(self, key: Optional[str]) -> Optional[int]:
+        """Bölümün ilk satır numarası (filtrede yoksa None)."""
+        try:
+            return self.offsets[self.parts.index(key)]
+        except ValueError:
+            return None
+
+    def lines(self, start: int, count: int) -> List[str]:
+        """[start, start + count) aralığındaki satırlar."""
+        out: List[str] = []
+        i = bisect.bisect_right(self.offsets, start) - 1
+        pos = start
+        while i < len(self.parts) and len(out) < count:
+            sec = self.model.lines_of(self.parts[i])
+            k = pos - self.offsets[i]
+            chunk = sec[k:k + count - len(out)]
+            out.extend(chunk)
+            pos += len(chunk)
+            i += 1
+        return out
+
+
+class VirtualReportView(ttk.Frame):
+    """Yalnızca görünen satırları çizen rapor görünümü."""
+
+    def __init__(self, master, font=("Consolas", 9), **text_opts):
+        super().__init__(master)
+        self.model = ReportModel()
+        self.query = ""
+        self._layout = self.model.layout()
+        self.top = 0  # Görünen ilk satır
+
+        self.text = tk.Text(self, wrap="none", font=font, **text_opts)
+        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self._on_scroll)
+        self.text.pack(side="left", fill="both", expand=True)
+        self.scroll.pack(side="right", fill="y")
+
+        self.text.bind("<Configure>", lambda e: self._render())
+        self.text.bind("<MouseWheel>", self._on_wheel)
+        self.text.bind("<Button-4>", self._on_wheel)
+        self.text.bind("<Button-5>", self._on_wheel)
+        self.text.bind("<Prior>", lambda e: self._scroll_by(-self._rows()) or "break")
+        self.text.bind("<Next>", lambda e: self._scroll_by(self._rows()) or "break")
+
+    def set_model(self, model: ReportModel):
+        """Yeni raporu gösterir; filtre ve konum korunur."""
+        self.model = model
+        self._layout = model.layout(self.query)
+        self._render()
+
+    def set_filter(self, query: str):
+        self.query = query
+        self._layout = self.model.layout(query)
+        self.top = 0
+        self._render()
+
+    def jump_to(self, sid: str):
+        """Döşemenin bölümünü en üste getirir."""
+        line = self._layout.line_of(sid)
+        if line is not None:
+            self.top = line
+            self._render()
+
+    def _rows(self) -> int:
+        """Ekrana sığan satır sayısı."""
+        linespace = max(int(self.text.tk.call("font", "metrics", self.text.cget("font"), "-linespace")), 1)
+        return max(self.text.winfo_height() // linespace, 1)
+
+    def _scroll_by(self, n: int):
+        self.top += n
+        self._render()
+
+    def _on_wheel(self, evt):
+        if evt.num == 4 or getattr(evt, "delta", 0) > 0:
+            self._scroll_by(-3)
+        else:
+            self._scroll_by(3)
+        return "break"
+
+    def _on_scroll(self, *args):
+        total = self._layout.total_lines
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self._rows() if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self._render()
+
+    def _render(self):
+        rows = self._rows()
+        total = self._layout.total_lines
+        self.top = max(0, min(self.top, total - rows))
+        self.text.delete("1.0", "end")
+        self.text.insert("end", "\n".join(self._layout.lines(self.top, rows + 1)))
+        if total:
+            self.scroll.set(self.top / total, min((self.top + rows) / total, 1.0))
+        else:
+            self.scroll.set(0.0, 1.0)
@@ -1,9 +1,8 @@
 
-import ezdxf
-import os
 from slab_model import SlabSystem, Slab
 from dxf_out import export_to_dxf
 from struct_design import RebarChoice
+from slab_results import SlabDesign, RebarSet, EdgeContinuity
 
 def create_test_system():
     # Monkeypatch size_m_gross for reproduction
@@ -30,63 +29,53 @@ def create_test_system():
     ch = RebarChoice(8, 200, 251) # 8/200
     
     design_cache = {
-        "S1": {
-            "kind": "TWOWAY", "cover_mm": 25.0,
-            "choices": {
-                "x_span_duz": ch, "x_span_pilye": ch,
-                "x_support_extra": ch, # We want this to be drawn!
-                "y_span_duz": ch, "y_span_pilye": ch,
-                "y_support_extra": ch
-            },
-            "edge_continuity": {"L": False, "R": True, "T": False, "B": False}
-        },
-        "S2": {
-            "kind": "TWOWAY", "cover_mm": 25.0,
-            "choices": {
-                "x_span_duz": ch, "x_span_pilye": ch,
-                "x_support_extra": ch,
-                "y_span_duz": ch, "y_span_pilye": ch,
-                "y_support_extra": ch
-            },
-            "edge_continuity": {"L": True, "R": False, "T": False, "B": False}
-        }
+        "S1": SlabDesign(
+            kind="TWOWAY", cover_mm=25.0,
+            choices=RebarSet(
+                x_span_duz=ch, x_span_pilye=ch,
+                x_support_extra=ch, # We want this to be drawn!
+                y_span_duz=ch, y_span_pilye=ch,
+                y_support_extra=ch
+            ),
+            edge_continuity=EdgeContinuity(L=False, R=True, T=False, B=False)
+        ),
+        "S2": SlabDesign(
+            kind="TWOWAY", cover_mm=25.0,
+            choices=RebarSet(
+                x_span_duz=ch, x_span_pilye=ch,
+                x_support_extra=ch,
+                y_span_duz=ch, y_span_pilye=ch,
+                y_support_extra=ch
+            ),
+            edge_continuity=EdgeContinuity(L=True, R=False, T=False, B=False)
+        )
     }
     
     return system, design_cache
 
-def analyze_dxf(filename):
-    print(f"Analyzing {filename}...")
-    try:
-        doc = ezdxf.readfile(filename)
-        msp = doc.modelspace()
-        
-        # Count entities on REB_EK_MESNET layer
-        hat_bars = msp.query('LWPOLYLINE[layer=="REB_EK_MESNET"]')
-        print(f"Found {len(hat_bars)} support extra bars.")
-        
-        for i, poly in enumerate(hat_bars):
-            points = poly.get_points()
-            print(f"Bar {i+1} has {len(points)} points.")
-            # We expect a Hat shape, so maybe > 4 points?
-            # Start, CrankUp, Top, CrankDown, End -> 5 points minimum if simple
-            # If we add hooks -> +4 points -> ~9 points?
-            
-        if len(points) == 6:
+def analyze_capture(w):
+    """Yakalanan çizimde mesnet ek donatılarını (şapka) sayar."""
+    lay = w.layers.get("REB_EK_MESNET")
+    hat_bars = list(lay.polylines()) if lay else []
+    print(f"Found {len(hat_bars)} support extra bars.")
+
+    for i, (flat, _) in enumerate(hat_bars):
+        n_points = len(flat) // 2
+        print(f"Bar {i+1} has {n_points} points.")
+        # Start, CrankUp, Top, CrankDown, End -> 5 points minimum if simple
+        # If we add hooks -> +4 points -> ~9 points?
+        if n_points == 6:
             print("  -> Has 6 points (Hat Shape verified).")
         else:
-            print(f"  -> Has {len(points)} points (Expected 6 for Hat).")
-                
-        return len(hat_bars)
-        
-    except Exception as e:
-        print(f"Error reading DXF: {e}")
-        return 0
+            print(f"  -> Has {n_points} points (Expected 6 for Hat).")
+
+    return len(hat_bars)
 
 if __name__ == "__main__":
     sys, dc = create_test_system()
-    out_file = "check_hat.dxf"
-    export_to_dxf(sys, out_file, dc, bw_val=0.50) # 50cm beam
+    # Dosyaya yazmadan yakala
+    w = export_to_dxf(sys, None, dc, bw_val=0.50, backend="memory") # 50cm beam
     
-    count = analyze_dxf(out_file)
+    count = analyze_capture(w)
     # Start: Expect 2 (current faulty behavior - double draw) or 0 (if not implemented)
     # Target: Expect 1 (Owner rule)
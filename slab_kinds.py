@@ -0,0 +1,96 @@
+"""
+Döşeme Tipi Kayıt Modülü
+========================
+Her döşeme tipi (ONEWAY, TWOWAY, BALCONY ve ileride eklenecekler) hesap ve
+çizim kancalarını burada bir kez kaydeder; hesap, rapor ve DXF tarafı
+if/elif zincirleri yerine bu kayıttan tipe göre dağıtım yapar.
+
+- Tip modülleri (oneway_slab, twoway_slab, balcony_slab) kendi hesap
+  kancalarını modül sonunda kaydeder.
+- dxf_out çizim kancalarını aynı tipe ekler (register_slab_kind kısmi
+  güncellemeyi destekler; verilmeyen kancalar korunur).
+- Yeni bir tip, kendi modülünde register_slab_kind çağırarak eklenir.
+"""
+
+import importlib
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Kayıt boşken yüklenecek yerleşik tip modülleri
+BUILTIN_KIND_MODULES = ("oneway_slab", "twoway_slab", "balcony_slab")
+
+
+@dataclass(frozen=True, slots=True)
+class SlabKindSpec:
+    """
+    Bir döşeme tipinin kancaları.
+
+    solve(system, sid, params) -> (moment kaydı, hesap adımları)
+    span_design(res, h) -> (açıklık momenti, s_max): 1. geçişte pilye alanı için
+        ana donatı tasarımı; None ise tip pilye alanı üretmez
+    report(system, sid, res, balanced, pilye_areas, params) -> (SlabDesign, rapor satırları)
+    support_moment(system, sid, edge, bw, plate_solver=False) -> kenardaki mesnet momenti
+        (mutlak, kNm/m); plate_solver: SolveParams.plate_solver (TWOWAY için FD çözümü)
+    coupled(system, sid) -> birlikte yeniden hesaplanması gereken döşemeler
+    draw(w, sid, s, design, box, bw_mm, index, system): DXF donatı detayı
+    balance_order: mesnet dengelemesine katılan tiplerin sırası (None: katılmaz)
+    """
+    name: str
+    solve: Optional[Callable] = None
+    span_design: Optional[Callable[[object, float], Tuple[float, float]]] = None
+    report: Optional[Callable] = None
+    support_moment: Optional[Callable[..., float]] = None
+    coupled: Optional[Callable[[object, str], Iterable[str]]] = None
+    draw: Optional[Callable] = None
+    balance_order: Optional[int] = None
+
+
+_KINDS: Dict[str, SlabKindSpec] = {}
+_builtins_loaded = False
+
+
+def register_slab_kind(name: str, **hooks) -> SlabKindSpec:
+    """
+    Döşeme tipini kaydeder veya mevcut kaydın verilen kancalarını günceller.
+
+    Args:
+        name: Tip adı (Slab.kind)
+        **hooks: SlabKindSpec alanları
+
+    Returns:
+        Güncel SlabKindSpec
+    """
+    spec = _KINDS.get(name)
+    spec = SlabKindSpec(name, **hooks) if spec is None else replace(spec, **hooks)
+    _KINDS[name] = spec
+    return spec
+
+
+def _load_builtins():
+    global _builtins_loaded
+    if not _builtins_loaded:
+        _builtins_loaded = True
+        for module in BUILTIN_KIND_MODULES:
+            importlib.import_module(module)
+
+
+def get_slab_kind(name: str) -> Optional[SlabKindSpec]:
+    """Tipin kaydı (bilinmeyen tip için None)."""
+    spec = _KINDS.get(name)
+    if spec is None and not _builtins_loaded:
+        _load_builtins()
+        spec = _KINDS.get(name)
+    return spec
+
+
+def slab_kind_names() -> List[str]:
+    """Kayıtlı tip adları (kayıt sırasıyla)."""
+    _load_builtins()
+    return list(_KINDS)
+
+
+def balancing_kinds() -> List[str]:
+    """Mesnet dengelemesine katılan tipler, dengeleme sırasıyla."""
+    _load_builtins()
+    specs = [s for s in _KINDS.values() if s.balance_order is not None]
+    return [s.name for s in sorted(specs, key=lambda s: s.balance_order)]
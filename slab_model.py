@@ -9,7 +9,7 @@ Hesap mantığı ayrı modüllerde bulunur:
 """
 
 from dataclasses import dataclass
-from typing import Dict, Tuple, List, Set, Optional
+from typing import Dict, Tuple, List, Set, Optional, TYPE_CHECKING
 import hashlib
 from constants import ALPHA_TABLE, M_POINTS, CASE_DESC
 from struct_design import (
@@ -17,6 +17,16 @@ from struct_design import (
     as_from_abacus_steps, rho_min_oneway, select_rebar_min_area,
     max_possible_area, RebarChoice
 )
+from slab_results import OneWayMoments, TwoWayMoments, BalconyMoments
+# Tip modülleri slab_model'i içe aktarmaz; modül düzeyinde yüklenir ve
+# slab_kinds kaydına kendi tiplerini ekler.
+import oneway_slab
+import twoway_slab
+import balcony_slab
+
+if TYPE_CHECKING:
+    # load_cases numpy yükler; çalışma anında yalnızca zarf hesabında gerekir
+    from load_cases import SlabLoads, LoadEnvelope
 
 @dataclass
 class Slab:
@@ -30,6 +40,7 @@ class Slab:
     dy: float
     pd: float
     b: float
+    loads: Optional["SlabLoads"] = None  # Yük durumları için karakteristik yükler
 
     def bbox(self):
         return self.i0, self.j0, self.i1, self.j1
@@ -63,8 +74,11 @@ class SlabSystem:
         self.cell_owner: Dict[Tuple[int, int], str] = {}
         self.V_beam: Set[Tuple[int, int]] = set()
         self.H_beam: Set[Tuple[int, int]] = set()
+        # (döşeme, bw) -> (zincir imzası, yük zarfı); zincirin tüm döşemeleri aynı zarfı paylaşır
+        self._envelopes: Dict[Tuple[str, float], Tuple[tuple, "LoadEnvelope"]] = {}
 
     def add_slab(self, s: Slab):
+        self._envelopes.clear()
         self.slabs[s.slab_id] = s
         for i in range(s.i0, s.i1 + 1):
             for j in range(s.j0, s.j1 + 1):
@@ -73,6 +87,7 @@ class SlabSystem:
     def delete_slab(self, sid: str):
         if sid not in self.slabs:
             return
+        self._envelopes.clear()
         s = self.slabs[sid]
         for i in range(s.i0, s.i1 + 1):
             for j in range(s.j0, s.j1 + 1):
@@ -232,69 +247,86 @@ class SlabSystem:
     # =========================================================
     def build_oneway_chain(self, sid: str, direction: str) -> List[str]:
         """Wrapper: oneway_slab modülüne yönlendirir."""
-        from oneway_slab import build_oneway_chain
-        return build_oneway_chain(self, sid, direction)
+        return oneway_slab.build_oneway_chain(self, sid, direction)
 
     def chain_panel_boundary_supports(self, chain: List[str], direction: str) -> List[int]:
         """Wrapper: oneway_slab modülüne yönlendirir."""
-        from oneway_slab import chain_panel_boundary_supports
-        return chain_panel_boundary_supports(self, chain, direction)
+        return oneway_slab.chain_panel_boundary_supports(self, chain, direction)
 
     def chain_end_fixity(self, chain: List[str], direction: str) -> Tuple[bool, bool]:
         """Wrapper: oneway_slab modülüne yönlendirir."""
-        from oneway_slab import chain_end_fixity
-        return chain_end_fixity(self, chain, direction)
+        return oneway_slab.chain_end_fixity(self, chain, direction)
 
     def owner_slab_for_segment(self, chain: List[str], direction: str, g_mid: float) -> str:
         """Wrapper: oneway_slab modülüne yönlendirir."""
-        from oneway_slab import owner_slab_for_segment
-        return owner_slab_for_segment(self, chain, direction, g_mid)
+        return oneway_slab.owner_slab_for_segment(self, chain, direction, g_mid)
 
-    def compute_oneway_per_slab(self, sid: str, bw_val: float) -> Tuple[dict, List[str]]:
+    def compute_oneway_per_slab(self, sid: str, bw_val: float) -> Tuple[OneWayMoments, List[str]]:
         """Wrapper: oneway_slab modülüne yönlendirir."""
-        from oneway_slab import compute_oneway_per_slab
-        return compute_oneway_per_slab(self, sid, bw_val)
+        return oneway_slab.compute_oneway_per_slab(self, sid, bw_val)
+
+    def compute_oneway_envelope(self, sid: str, bw: float) -> "LoadEnvelope":
+        """
+        Wrapper: load_cases modülüne yönlendirir (yük durumu zarfları).
+        Zarf zincir başına bir kez hesaplanır: aynı yöndeki zincir döşemeleri
+        sonucu paylaşır. Önbellek anahtarı zincirin derlenmiş geometrisi
+        (açıklıklar, sahipler, uç ankastreliği) ile döşeme yükleridir; kiriş
+        veya yük değişince zarf yeniden hesaplanır.
+        """
+        from load_cases import compile_oneway_chain, oneway_chain_envelope, chain_direction, slab_loads
+        geom = compile_oneway_chain(self, sid, bw)
+        signature = (geom, tuple((slab_loads(self.slabs[o]), self.slabs[o].b) for o in geom.owners))
+        cached = self._envelopes.get((sid, bw))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        env = oneway_chain_envelope(self, sid, bw, geom=geom)
+        for member in geom.chain:
+            if chain_direction(self.slabs[member]) == geom.direction:
+                self._envelopes[(member, bw)] = (signature, env)
+        self._envelopes[(sid, bw)] = (signature, env)
+        return env
 
     # =========================================================
     # TWOWAY logic - wrapper metodlar (hesap twoway_slab.py'de)
     # =========================================================
     def slab_edge_has_beam(self, sid: str, edge: str) -> bool:
         """Wrapper: twoway_slab modülüne yönlendirir."""
-        from twoway_slab import slab_edge_has_beam
-        return slab_edge_has_beam(self, sid, edge)
+        return twoway_slab.slab_edge_has_beam(self, sid, edge)
 
     def twoway_net_LxLy(self, sid: str, bw: float) -> Tuple[float, float, List[str]]:
         """Wrapper: twoway_slab modülüne yönlendirir."""
-        from twoway_slab import twoway_net_LxLy
-        return twoway_net_LxLy(self, sid, bw)
+        return twoway_slab.twoway_net_LxLy(self, sid, bw)
 
-    def compute_twoway_per_slab(self, sid: str, bw: float) -> Tuple[dict, List[str]]:
+    def compute_twoway_per_slab(self, sid: str, bw: float) -> Tuple[TwoWayMoments, List[str]]:
         """Wrapper: twoway_slab modülüne yönlendirir."""
-        from twoway_slab import compute_twoway_per_slab
-        return compute_twoway_per_slab(self, sid, bw)
+        return twoway_slab.compute_twoway_per_slab(self, sid, bw)
+
+    def compute_twoway_per_slab_fd(self, sid: str, bw: float) -> Tuple[TwoWayMoments, List[str]]:
+        """Wrapper: plate_fd_solver modülüne yönlendirir (sonlu farklar plak çözümü).
+        numpy gerektirdiği için ilk kullanımda yüklenir."""
+        from plate_fd_solver import compute_twoway_per_slab_fd
+        return compute_twoway_per_slab_fd(self, sid, bw)
 
     # =========================================================
     # BALCONY logic - wrapper metodlar (hesap balcony_slab.py'de)
     # =========================================================
-    def compute_balcony_per_slab(self, sid: str, bw: float) -> Tuple[dict, List[str]]:
+    def compute_balcony_per_slab(self, sid: str, bw: float) -> Tuple[BalconyMoments, List[str]]:
         """Wrapper: balcony_slab modülüne yönlendirir."""
-        from balcony_slab import compute_balcony_per_slab
-        return compute_balcony_per_slab(self, sid, bw)
+        return balcony_slab.compute_balcony_per_slab(self, sid, bw)
 
     def balcony_fixed_edge_guess(self, sid: str) -> Tuple[str, List[str]]:
         """Wrapper: balcony_slab modülüne yönlendirir."""
-        from balcony_slab import balcony_fixed_edge_guess
-        return balcony_fixed_edge_guess(self, sid)
+        return balcony_slab.balcony_fixed_edge_guess(self, sid)
 
-    def neighbor_support_moment_for_edge(self, neighbor_id: str, edge: str, bw: float) -> float:
+    def neighbor_support_moment_for_edge(self, neighbor_id: str, edge: str, bw: float,
+                                         plate_solver: bool = False) -> float:
         """Wrapper: balcony_slab modülüne yönlendirir."""
-        from balcony_slab import neighbor_support_moment_for_edge
-        return neighbor_support_moment_for_edge(self, neighbor_id, edge, bw)
+        return balcony_slab.neighbor_support_moment_for_edge(self, neighbor_id, edge, bw, plate_solver)
 
-    def get_balcony_design_moment(self, sid: str, Mbal: float, bw: float) -> Tuple[float, List[str]]:
+    def get_balcony_design_moment(self, sid: str, Mbal: float, bw: float,
+                                  plate_solver: bool = False) -> Tuple[float, List[str]]:
         """Wrapper: balcony_slab modülüne yönlendirir."""
-        from balcony_slab import get_balcony_design_moment
-        return get_balcony_design_moment(self, sid, Mbal, bw)
+        return balcony_slab.get_balcony_design_moment(self, sid, Mbal, bw, plate_solver)
 
     # =========================================================
     # Design Wrapper
@@ -0,0 +1,113 @@
+"""
+Döşeme Sonuç Kayıtları Modülü
+=============================
+Moment ve donatı hesaplarının sonuçlarını taşıyan değişmez (frozen) kayıtlar.
+Kayıtlar __slots__ kullanır; kopyalama yerine dataclasses.replace ile
+yalnızca değişen alanlar yenilenir, diğer alanlar paylaşılır.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from struct_design import RebarChoice
+
+MomentPair = Tuple[Optional[float], Optional[float]]  # (negatif/mesnet, pozitif/açıklık)
+
+
+@dataclass(frozen=True, slots=True)
+class OneWayMoments:
+    """compute_oneway_per_slab sonucu."""
+    auto_dir: str
+    chain: Tuple[str, ...]
+    w: float
+    Mpos_max: Optional[float]
+    Mneg_min: Optional[float]
+    fixed_start: bool = False
+    fixed_end: bool = False
+    continuous_start: bool = False
+    continuous_end: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class TwoWayMoments:
+    """compute_twoway_per_slab sonucu."""
+    Lx_net: float
+    Ly_net: float
+    ls: float
+    m: float
+    case: int
+    Mx: MomentPair
+    My: MomentPair
+    short_dir: str
+
+
+@dataclass(frozen=True, slots=True)
+class BalconyMoments:
+    """compute_balcony_per_slab sonucu."""
+    direction: str
+    w: float
+    L_net: float
+    Mneg: float
+
+
+@dataclass(frozen=True, slots=True)
+class RebarSet:
+    """Bir döşemede seçilen donatılar (kullanılmayan roller None)."""
+    # ONEWAY / BALCONY
+    main: Optional[RebarChoice] = None
+    duz: Optional[RebarChoice] = None
+    pilye: Optional[RebarChoice] = None
+    dist: Optional[RebarChoice] = None
+    kenar_mesnet_start: Optional[RebarChoice] = None
+    kenar_mesnet_end: Optional[RebarChoice] = None
+    ic_mesnet_start: Optional[RebarChoice] = None
+    ic_mesnet_end: Optional[RebarChoice] = None
+    mesnet_ek_start: Optional[RebarChoice] = None
+    mesnet_ek_end: Optional[RebarChoice] = None
+    # TWOWAY
+    x_span: Optional[RebarChoice] = None
+    x_span_duz: Optional[RebarChoice] = None
+    x_span_pilye: Optional[RebarChoice] = None
+    y_span: Optional[RebarChoice] = None
+    y_span_duz: Optional[RebarChoice] = None
+    y_span_pilye: Optional[RebarChoice] = None
+    x_support_extra: Optional[RebarChoice] = None
+    y_support_extra: Optional[RebarChoice] = None
+
+
+@dataclass(frozen=True, slots=True)
+class EdgeContinuity:
+    """
+    Kenar süreklilikleri.
+    TWOWAY: L/R/T/B, ONEWAY: uzun/kısa kenar START/END.
+    """
+    L: bool = False
+    R: bool = False
+    T: bool = False
+    B: bool = False
+    uzun_start: bool = False
+    uzun_end: bool = False
+    kisa_start: bool = False
+    kisa_end: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class RebarDirections:
+    """ONEWAY donatılarının çizim doğrultuları (rapor bilgisi)."""
+    ana_donati: str
+    dagitma: str
+    boyuna_kenar_mesnet: str
+    boyuna_ic_mesnet: str
+    ilave_mesnet: str
+
+
+@dataclass(frozen=True, slots=True)
+class SlabDesign:
+    """compute_*_report tasarım sonucu; DXF çizimi bu kaydı kullanır."""
+    kind: str
+    cover_mm: float
+    choices: RebarSet
+    edge_continuity: EdgeContinuity = EdgeContinuity()
+    auto_dir: Optional[str] = None      # ONEWAY
+    short_dir: Optional[str] = None     # TWOWAY
+    fixed_edge: Optional[str] = None    # BALCONY
+    dogrultular: Optional[RebarDirections] = None
@@ -0,0 +1,312 @@
+"""
+Hesap Çalıştırıcı Modülü
+========================
+compute_and_report'un hesap kısmı: Tk'dan bağımsız, saf bir fonksiyon
+(solve_plan) ve bunu arka planda çalıştıran SolveWorker.
+
+- solve_plan yalnızca SlabSystem ve SolveParams alır; raporu metin olarak,
+  tasarımları sözlük olarak döndürür. Widget'lara dokunmaz.
+- SolveWorker hesabı ayrı bir iş parçacığında çalıştırır; ilerleme ve sonuç
+  mesajlarını bir kuyruğa yazar. Arayüz kuyruğu after() ile okur.
+- İptal, iş parçacığı her döşemeden önce kontrol edilen bir Event ile yapılır.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Dict, Tuple, List, Optional, Callable, Set, FrozenSet
+
+from slab_kinds import get_slab_kind, balancing_kinds
+from moment_balance_slab import balance_support_moments, distribute_support_moments, DistributionResult
+from struct_design import split_duz_pilye
+from slab_results import SlabDesign, OneWayMoments
+
+ProgressFn = Callable[[str, int, int], None]  # (geçiş adı, tamamlanan, toplam)
+
+
+@dataclass(frozen=True, slots=True)
+class SolveParams:
+    """Hesap girdileri (Tk değişkenlerinden ana iş parçacığında okunur)."""
+    conc: str
+    steel: str
+    h: float
+    cover: float
+    bw: float
+    iterative_balance: bool = False
+    plate_solver: bool = False
+    warm_start: Optional[DistributionResult] = None
+
+
+MomentEntry = Tuple[object, Tuple[str, ...]]  # (moment kaydı, hesap adımları)
+
+
+@dataclass(frozen=True, slots=True)
+class SolveResult:
+    """
+    solve_plan sonucu; arayüze tek seferde aktarılır.
+    Ara sonuçlar (momentler, pilye alanları, rapor bölümleri) artımlı
+    hesapta değişmeyen döşemeler için yeniden kullanılır.
+    """
+    report: str
+    design: Dict[str, SlabDesign]
+    distribution: Optional[DistributionResult] = None
+    params: Optional[SolveParams] = None
+    moments: Dict[str, Optional[MomentEntry]] = field(default_factory=dict)
+    pilye_areas: Dict[str, float] = field(default_factory=dict)
+    balanced: Dict[str, object] = field(default_factory=dict)
+    sections: Dict[str, str] = field(default_factory=dict)
+    recomputed: FrozenSet[str] = frozenset()  # Bu hesapta yeniden raporlanan döşemeler
+    header: str = ""  # Rapor başlığı ve mesnet dengelemesi (bölümler hariç)
+
+
+class SolveCancelled(Exception):
+    """Hesap, plan değiştiği için iptal edildi."""
+
+
+def _check_cancel(cancel: Optional[threading.Event]):
+    if cancel is not None and cancel.is_set():
+        raise SolveCancelled()
+
+
+def _moment_pass(system, sid: str, params: SolveParams) -> Tuple[Optional[MomentEntry], Optional[float]]:
+    """
+    1. Geçiş: döşemenin momentlerini ve açıklık donatısının pilye alanını hesaplar.
+
+    Returns:
+        ((res, steps) veya None, pilye_alanı veya None)
+    """
+    spec = get_slab_kind(system.slabs[sid].kind)
+    if spec is None or spec.solve is None:
+        return None, None
+    try:
+        res, steps = spec.solve(system, sid, params)
+        if spec.span_design is None:
+            return (res, tuple(steps)), None
+        Mpos, smax = spec.span_design(res, params.h)
+        As_main, ch_main, _ = system.design_main_rebar_from_M(
+            Mpos, params.conc, params.steel, params.h, params.cover, smax, label_prefix="")
+        _, pilye = split_duz_pilye(ch_main)
+        return (res, tuple(steps)), pilye.area_mm2_per_m
+    except Exception:
+        return None, None
+
+
+def _design_pass(system, sid: str, entry: Optional[MomentEntry], balanced_moments: Dict[str, object],
+                 pilye_areas: Dict[str, float], params: SolveParams) -> Tuple[str, Optional[SlabDesign], bool]:
+    """
+    2. Geçiş: döşemenin donatı hesabını yapar ve rapor bölümünü üretir.
+
+    Returns:
+        (rapor_bölümü, tasarım, tasarım_var_mı)
+    """
+    s = system.slabs[sid]
+    out = [f"--- {sid} ({s.kind}) ---\n"]
+    try:
+        if entry is None:
+            out.append("HATA: Moment hesabı başarısız\n\n")
+            return "".join(out), None, False
+
+        res, steps = entry
+        for l in steps:
+            out.append(l + "\n")
+
+        spec = get_slab_kind(s.kind)
+        design_res = None
+        if spec is not None and spec.report is not None:
+            design_res, report_lines = spec.report(
+                system, sid, res, balanced_moments.get(sid), pilye_areas, params)
+            for l in report_lines:
+                out.append(l + "\n")
+
+        return "".join(out), design_res, True
+
+    except Exception as e:
+        out.append(f"HATA: {e}\n\n")
+        return "".join(out), None, False
+
+
+def slab_neighbors(system, sid: str) -> Set[str]:
+    """Döşemenin dört kenarındaki tüm komşuları."""
+    found = set()
+    for direction in ("X", "Y"):
+        for side in ("START", "END"):
+            found |= system.neighbor_slabs_on_side(sid, direction, side)
+    return {nb for nb in found if nb in system.slabs}
+
+
+def affected_slabs(system, dirty: Set[str], previous: "SolveResult") -> Set[str]:
+    """
+    Düzenlenen döşemelerden etkilenen döşemeleri bulur: düzenlenenler,
+    komşuları ve bunların (eski ve yeni) tek doğrultulu zincirleri.
+    """
+    seeds = {sid for sid in dirty if sid in system.slabs}
+    for sid in list(seeds):
+        seeds |= slab_neighbors(system, sid)
+    affected = set(seeds)
+    for sid in seeds:
+        # Eski zincir (önceki hesaptan) ve yeni zincir birlikte yeniden hesaplanır
+        entry = previous.moments.get(sid)
+        if entry is not None and isinstance(entry[0], OneWayMoments):
+            affected |= {x for x in entry[0].chain if x in system.slabs}
+        spec = get_slab_kind(system.slabs[sid].kind)
+        if spec is not None and spec.coupled is not None:
+            affected |= set(spec.coupled(system, sid))
+    return affected
+
+
+def solve_plan(system, params: SolveParams, progress: Optional[ProgressFn] = None,
+               cancel: Optional[threading.Event] = None,
+               previous: Optional["SolveResult"] = None,
+               dirty: Optional[Set[str]] = None) -> SolveResult:
+    """
+    Tüm döşemelerin moment, mesnet dengelemesi ve donatı hesabını yapar.
+
+    previous ve dirty verilirse yalnızca etkilenen döşemeler yeniden
+    hesaplanır; diğerlerinin moment ve rapor bölümleri previous'tan alınır.
+    Mesnet dengelemesi her seferinde tüm plan için yapılır.
+
+    Args:
+        system: SlabSystem nesnesi (hesap boyunca değiştirilmemeli)
+        params: SolveParams
+        progress: İlerleme geri çağırımı (opsiyonel)
+        cancel: İptal olayı; ayarlanırsa SolveCancelled fırlatılır
+        previous: Önceki SolveResult (artımlı hesap için)
+        dirty: Düzenlenen döşeme ID'leri (eski komşular dahil)
+
+    Returns:
+        SolveResult
+    """
+    sids = sorted(system.slabs.keys())
+    incremental = (previous is not None and dirty is not None
+                   and replace(previous.params, warm_start=None) == replace(params, warm_start=None))
+    if incremental:
+        recompute = affected_slabs(system, dirty, previous)
+    else:
+        recompute = set(sids)
+
+    # ==== İKİ GEÇİŞLİ HESAPLAMA ====
+    # 1. Geçiş: Tüm döşemelerin temel donatılarını hesapla ve pilye alanlarını topla
+    pilye_areas: Dict[str, float] = {}
+    moment_results: Dict[str, Optional[MomentEntry]] = {}
+    todo = [sid for sid in sids if sid in recompute]
+    for n, sid in enumerate(todo):
+        _check_cancel(cancel)
+        moment_results[sid], area = _moment_pass(system, sid, params)
+        if area is not None:
+            pilye_areas[sid] = area
+        if progress:
+            progress("Moment", n + 1, len(todo))
+    for sid in sids:
+        if sid not in recompute:
+            moment_results[sid] = previous.moments.get(sid)
+            if sid in previous.pilye_areas:
+                pilye_areas[sid] = previous.pilye_areas[sid]
+
+    # 1.5 Geçiş: TWOWAY döşemeler için mesnet dengelemesi (TS500)
+    # Dengelemeye katılan tipler kayıttaki sırayla eklenir (önce TWOWAY, sonra ONEWAY)
+    _check_cancel(cancel)
+    raw_twoway_moments = {}
+    for kind in balancing_kinds():
+        for sid in sids:
+            if moment_results[sid] is not None and system.slabs[sid].kind == kind:
+                raw_twoway_moments[sid] = moment_results[sid][0]
+
+    balanced_moments = {}
+    balance_log = []
+    balance_title = "TS500"
+    distribution = None
+    if raw_twoway_moments:
+        if params.iterative_balance:
+            distribution = distribute_support_moments(system, raw_twoway_moments, bw=params.bw,
+                                                      warm_start=params.warm_start)
+            balanced_moments, balance_log = distribution.moments, distribution.log
+            balance_title = "Moment Dağıtma"
+        else:
+            balanced_moments, balance_log = balance_support_moments(system, raw_twoway_moments, params.bw)
+
+    # 2. Geçiş: Tüm döşemelerin tam donatı hesabını yap (pilye bilgileriyle)
+    # Artımlı hesapta: pilye alanı değişen döşemelerin komşuları ve dengelenmiş
+    # momenti değişen döşemeler de yeniden raporlanır.
+    redesign = set(recompute)
+    if incremental:
+        for sid in sids:
+            if sid in recompute:
+                if pilye_areas.get(sid) != previous.pilye_areas.get(sid):
+                    redesign |= slab_neighbors(system, sid)
+            elif balanced_moments.get(sid) != previous.balanced.get(sid):
+                redesign.add(sid)
+
+    sections: Dict[str, str] = {}
+    design: Dict[str, SlabDesign] = {}
+    todo = [sid for sid in sids if sid in redesign]
+    for n, sid in enumerate(todo):
+        _check_cancel(cancel)
+        text, design_res, has_design = _design_pass(
+            system, sid, moment_results[sid], balanced_moments, pilye_areas, params)
+        sections[sid] = text
+        if has_design:
+            design[sid] = design_res
+        if progress:
+            progress("Donatı", n + 1, len(todo))
+    for sid in sids:
+        if sid not in redesign:
+            sections[sid] = previous.sections[sid]
+            if sid in previous.design:
+                design[sid] = previous.design[sid]
+
+    out = [f"Hesap Raporu\nBeton: {params.conc}, Çelik: {params.steel}, "
+           f"h={params.h}mm, cover={params.cover}mm\n\n"]
+    if balance_log:
+        out.append(f"=== MESNET DENGELEMESİ ({balance_title}) ===\n")
+        for line in balance_log:
+            out.append(line + "\n")
+        out.append("\n")
+    header = "".join(out)
+    out.extend(sections[sid] for sid in sids)
+
+    return SolveResult(
+        report="".join(out), header=header, design=design, distribution=distribution,
+        params=params, moments=moment_results, pilye_areas=pilye_areas,
+        balanced=balanced_moments, sections=sections,
+        recomputed=frozenset(redesign),
+    )
+
+
+class SolveWorker:
+    """
+    solve_plan'ı arka plan iş parçacığında çalıştırır.
+
+    Kuyruk mesajları:
+        ("progress", geçiş, tamamlanan, toplam)
+        ("done", SolveResult)
+        ("cancelled",)
+        ("error", istisna)
+    """
+
+    def __init__(self, system, params: SolveParams, version: int,
+                 previous: Optional[SolveResult] = None, dirty: Optional[Set[str]] = None):
+        self.version = version  # Başlatıldığı andaki plan sürümü
+        self.dirty = set(dirty) if dirty else set()  # İptalde geri verilecek düzenlemeler
+        self.queue: "queue.Queue[Tuple]" = queue.Queue()
+        self.cancel_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(system, params, previous, dirty), daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self, system, params: SolveParams, previous: Optional[SolveResult], dirty: Optional[Set[str]]):
+        try:
+            result = solve_plan(system, params,
+                                progress=lambda p, d, t: self.queue.put(("progress", p, d, t)),
+                                cancel=self.cancel_event, previous=previous, dirty=dirty)
+            self.queue.put(("done", result))
+        except SolveCancelled:
+            self.queue.put(("cancelled",))
+        except Exception as e:
+            self.queue.put(("error", e))
@@ -0,0 +1,214 @@
+"""
+Mekânsal İndeks Modülü
+======================
+Döşeme dikdörtgenleri ve kenarları için metre cinsinden düzgün ızgara
+(uniform grid) indeksi.
+
+Her dikdörtgen kapladığı ızgara hücrelerine kaydedilir; nokta ve pencere
+sorguları yalnızca ilgili hücrelerdeki adaylara bakar. Ekleme/silme yalnızca
+o dikdörtgenin hücrelerini değiştirir, böylece indeks düzenlemelerle birlikte
+artımlı olarak güncellenir. Eşit uzaklıklarda ilk eklenen kayıt seçilir
+(doğrusal taramadaki sözlük sırasıyla aynı).
+"""
+
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+Rect = Tuple[float, float, float, float]   # (x, y, w, h) metre
+Cell = Tuple[int, int]
+
+# Varsayılan ızgara hücresi (m): tipik döşeme birkaç hücre kaplar
+DEFAULT_CELL_SIZE = 2.0
+# Çakışma toleransı (m): bu kadar içe giren kenar teması sayılır
+OVERLAP_EPS = 0.001
+
+
+def rect_edges(rect: Rect) -> Dict[str, Tuple[float, float, float, float]]:
+    """L, R, T, B kenarlarının (x0,y0,x1,y1) koordinatları (RealSlab.edges ile aynı)."""
+    x, y, w, h = rect
+    return {
+        "L": (x, y, x, y + h),
+        "R": (x + w, y, x + w, y + h),
+        "T": (x, y, x + w, y),
+        "B": (x, y + h, x + w, y + h),
+    }
+
+
+def rects_overlap(a: Rect, b: Rect, eps: float = OVERLAP_EPS) -> bool:
+    """İki dikdörtgenin çakışıp çakışmadığını kontrol et (kenar teması hariç)."""
+    x1, y1, w1, h1 = a
+    x2, y2, w2, h2 = b
+    return not (x1 + w1 <= x2 + eps or x2 + w2 <= x1 + eps or
+                y1 + h1 <= y2 + eps or y2 + h2 <= y1 + eps)
+
+
+def point_segment_distance(px: float, py: float, x0: float, y0: float, x1: float, y1: float) -> float:
+    """Noktanın doğru parçasına uzaklığı."""
+    dx = x1 - x0
+    dy = y1 - y0
+    len_sq = dx * dx + dy * dy
+    if len_sq < 1e-12:
+        return math.hypot(px - x0, py - y0)
+
+    t = max(0, min(1, ((px - x0) * dx + (py - y0) * dy) / len_sq))
+    return math.hypot(px - (x0 + t * dx), py - (y0 + t * dy))
+
+
+class SpatialIndex:
+    """Dikdörtgenler için düzgün ızgara indeksi (anahtar -> (x, y, w, h))."""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._rects: Dict[Hashable, Rect] = {}
+        self._order: Dict[Hashable, int] = {}        # Eklenme sırası (eşitlik kırıcı)
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, key) -> bool:
+        return key in self._rects
+
+    def rect(self, key) -> Optional[Rect]:
+        return self._rects.get(key)
+
+    def _cell_range(self, x0: float, y0: float, x1: float, y1: float):
+        c = self.cell_size
+        return (math.floor(x0 / c), math.floor(y0 / c),
+                math.floor(x1 / c), math.floor(y1 / c))
+
+    def _cells_of(self, rect: Rect):
+        x, y, w, h = rect
+        i0, j0, i1, j1 = self._cell_range(x, y, x + w, y + h)
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                yield i, j
+
+    def insert(self, key, rect: Rect):
+        """Dikdörtgeni ekler; anahtar varsa konumunu günceller (sırası korunur)."""
+        if key in self._rects:
+            self._unlink(key)
+        else:
+            self._order[key] = self._seq
+            self._seq += 1
+        rect = tuple(float(v) for v in rect)
+        self._rects[key] = rect
+        for cell in self._cells_of(rect):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key):
+        """Anahtarı indeksten çıkarır (yoksa bir şey yapmaz)."""
+        if key not in self._rects:
+            return
+        self._unlink(key)
+        del self._rects[key]
+        del self._order[key]
+
+    def clear(self):
+        self._rects.clear()
+        self._order.clear()
+        self._cells.clear()
+
+    def _unlink(self, key):
+        for cell in self._cells_of(self._rects[key]):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._cells[cell]
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> List[Hashable]:
+        """
+        Kapalı [x0, x1] × [y0, y1] penceresine değen dikdörtgenlerin anahtarları.
+
+        Returns:
+            Eklenme sırasına göre anahtar listesi
+        """
+        i0, j0, i1, j1 = self._cell_range(x0, y0, x1, y1)
+        found: Set[Hashable] = set()
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self._cells):
+            # Pencere dolu hücrelerden genişse (uzaklaştırılmış görünüm) boş
+            # hücreleri gezmek yerine dolu hücreler taranır
+            for (i, j), bucket in self._cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    found |= bucket
+        else:
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    bucket = self._cells.get((i, j))
+                    if bucket:
+                        found |= bucket
+        hits = []
+        for key in found:
+            x, y, w, h = self._rects[key]
+            if x <= x1 and x0 <= x + w and y <= y1 and y0 <= y + h:
+                hits.append(key)
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def overlapping(self, rect: Rect, eps: float = OVERLAP_EPS) -> List[Hashable]:
+        """
+        Dikdörtgenle çakışan (yalnızca kenar teması değil) kayıtların anahtarları.
+
+        Returns:
+            Eklenme sırasına göre anahtar listesi
+        """
+        x, y, w, h = rect
+        return [key for key in self.query_rect(x, y, x + w, y + h)
+                if rects_overlap(rect, self._rects[key], eps)]
+
+    def bulk_insert(self, items: Iterable[Tuple[Hashable, Rect]],
+                    eps: float = OVERLAP_EPS) -> List[Tuple[Hashable, Hashable]]:
+        """
+        Çok sayıda dikdörtgeni birlikte doğrular ve ekler. Her dikdörtgen hem
+        mevcut kayıtlarla hem de aynı toplu ekleme içindeki öncekilerle
+        ızgara üzerinden karşılaştırılır (beklenen toplam O(n)).
+        Çakışma varsa hiçbiri eklenmez.
+
+        Args:
+            items: (anahtar, (x, y, w, h)) dizisi
+            eps: Çakışma toleransı (m)
+
+        Returns:
+            Çakışan (yeni anahtar, diğer anahtar) çiftleri; boşsa ekleme yapılmıştır
+        """
+        items = list(items)
+        staged = SpatialIndex(self.cell_size)
+        conflicts = []
+        for key, rect in items:
+            if key in staged:
+                conflicts.append((key, key))
+                continue
+            for other in self.overlapping(rect, eps):
+                if other != key:
+                    conflicts.append((key, other))
+            for other in staged.overlapping(rect, eps):
+                conflicts.append((key, other))
+            staged.insert(key, rect)
+        if not conflicts:
+            for key, rect in items:
+                self.insert(key, rect)
+        return conflicts
+
+    def item_at(self, x: float, y: float) -> Optional[Hashable]:
+        """Noktayı içeren ilk dikdörtgenin anahtarı."""
+        hits = self.query_rect(x, y, x, y)
+        return hits[0] if hits else None
+
+    def nearest_edge(self, x: float, y: float, radius: float) -> Optional[Tuple[Hashable, str]]:
+        """
+        Noktaya radius'tan yakın en yakın dikdörtgen kenarı.
+
+        Returns:
+            (anahtar, kenar adı) veya None
+        """
+        best_dist = radius
+        best = None
+        for key in self.query_rect(x - radius, y - radius, x + radius, y + radius):
+            for edge_name, (ex0, ey0, ex1, ey1) in rect_edges(self._rects[key]).items():
+                dist = point_segment_distance(x, y, ex0, ey0, ex1, ey1)
+                if dist < best_dist:
+                    best_dist = dist
+                    best = (key, edge_name)
+        return best
@@ -6,7 +6,7 @@ from constants import (
     PHI_LIST, S_LIST
 )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RebarChoice:
     phi_mm: int
     s_mm: int
@@ -18,6 +18,18 @@ class RebarChoice:
     def label_with_area(self) -> str:
         return f"Ø{self.phi_mm}/{self.s_mm} (Aprov={self.area_mm2_per_m:.1f} mm²/m)"
 
+# Aynı (φ, s, A) üçlüsü için tek bir RebarChoice örneği tutulur; büyük
+# projelerde binlerce döşeme aynı seçimleri paylaşır.
+_REBAR_POOL: Dict[Tuple[int, int, float], RebarChoice] = {}
+
+def rebar_choice(phi_mm: int, s_mm: int, area_mm2_per_m: float) -> RebarChoice:
+    """Havuzdan (intern edilmiş) RebarChoice döndürür."""
+    key = (phi_mm, s_mm, area_mm2_per_m)
+    ch = _REBAR_POOL.get(key)
+    if ch is None:
+        ch = _REBAR_POOL.setdefault(key, RebarChoice(phi_mm, s_mm, area_mm2_per_m))
+    return ch
+
 # =========================================================
 # Math Helpers
 # =========================================================
@@ -211,7 +223,7 @@ def select_rebar_min_area(As_req: float, s_max: int, phi_min: int = 8, phi_max:
                 continue
             A = area_per_m(phi, s)
             if A + 1e-9 >= As_req:
-                cand = RebarChoice(phi, s, A)
+                cand = rebar_choice(phi, s, A)
                 if best is None:
                     best = cand
                 else:
@@ -236,9 +248,8 @@ def max_possible_area(s_max: int, phi_min: int = 8, phi_max: int = 32) -> float:
 def split_duz_pilye(choice: RebarChoice) -> Tuple[RebarChoice, RebarChoice]:
     s2 = choice.s_mm * 2
     halfA = choice.area_mm2_per_m / 2.0
-    duz = RebarChoice(choice.phi_mm, s2, halfA)
-    pilye = RebarChoice(choice.phi_mm, s2, halfA)
-    return duz, pilye
+    half = rebar_choice(choice.phi_mm, s2, halfA)
+    return half, half
 
 # =========================================================
 # TS500 / Konstrüktif kural parametreleri
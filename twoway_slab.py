@@ -8,8 +8,10 @@ from typing import Dict, Tuple, List, Optional
 from constants import ALPHA_TABLE, M_POINTS, CASE_DESC
 from struct_design import (
     interp_alpha, twoway_smax_short, twoway_smax_long,
-    select_rebar_min_area, RebarChoice
+    select_rebar_min_area, split_duz_pilye
 )
+from slab_results import TwoWayMoments, SlabDesign, RebarSet, EdgeContinuity
+from slab_kinds import register_slab_kind
 
 
 def slab_edge_has_beam(system, sid: str, edge: str) -> bool:
@@ -98,7 +100,7 @@ def pick_two_way_case_exact(Lx_net: float, Ly_net: float,
     return 3
 
 
-def compute_twoway_per_slab(system, sid: str, bw: float) -> Tuple[dict, List[str]]:
+def compute_twoway_per_slab(system, sid: str, bw: float) -> Tuple[TwoWayMoments, List[str]]:
     """
     Çift doğrultulu döşeme için moment hesabı yapar.
     
@@ -108,7 +110,7 @@ def compute_twoway_per_slab(system, sid: str, bw: float) -> Tuple[dict, List[str
         bw: Kiriş genişliği (m)
     
     Returns:
-        (sonuç_dict, hesap_adımları_listesi)
+        (TwoWayMoments, hesap_adımları_listesi)
     """
     steps = []
     s = system.slabs[sid]
@@ -170,11 +172,11 @@ def compute_twoway_per_slab(system, sid: str, bw: float) -> Tuple[dict, List[str
         My_neg, My_pos = M_sn, M_sp
         Mx_neg, Mx_pos = M_ln, M_lp
 
-    return {
-        "Lx_net": Lx_n, "Ly_net": Ly_n, "ls": ls, "m": m,
-        "case": case, "Mx": (Mx_neg, Mx_pos), "My": (My_neg, My_pos),
-        "short_dir": short_dir
-    }, steps
+    return TwoWayMoments(
+        Lx_net=Lx_n, Ly_net=Ly_n, ls=ls, m=m,
+        case=case, Mx=(Mx_neg, Mx_pos), My=(My_neg, My_pos),
+        short_dir=short_dir
+    ), steps
 
 
 def get_neighbor_on_edge_twoway(system, sid: str, edge: str):
@@ -225,9 +227,9 @@ def get_neighbor_on_edge_twoway(system, sid: str, edge: str):
     return None, None
 
 
-def compute_twoway_report(system, sid: str, res: dict, conc: str, steel: str,
+def compute_twoway_report(system, sid: str, res: TwoWayMoments, conc: str, steel: str,
                           h: float, cover: float, bw: float,
-                          neighbor_pilye_areas: Optional[dict] = None) -> Tuple[dict, List[str]]:
+                          neighbor_pilye_areas: Optional[dict] = None) -> Tuple[SlabDesign, List[str]]:
     """
     Çift doğrultulu döşeme için donatı hesabı ve raporlama yapar.
     
@@ -243,18 +245,18 @@ def compute_twoway_report(system, sid: str, res: dict, conc: str, steel: str,
         neighbor_pilye_areas: Komşu döşemelerin pilye alanları {sid: area_mm2_per_m}
     
     Returns:
-        (tasarım_sonucu_dict, rapor_satırları_listesi)
+        (SlabDesign, rapor_satırları_listesi)
     """
     lines = []
     
     if neighbor_pilye_areas is None:
         neighbor_pilye_areas = {}
     
-    mxn, mxp = res["Mx"]
-    myn, myp = res["My"]
+    mxn, mxp = res.Mx
+    myn, myp = res.My
     
-    smax_x = twoway_smax_short(h) if res["short_dir"] == "X" else twoway_smax_long(h)
-    smax_y = twoway_smax_long(h) if res["short_dir"] == "X" else twoway_smax_short(h)
+    smax_x = twoway_smax_short(h) if res.short_dir == "X" else twoway_smax_long(h)
+    smax_y = twoway_smax_long(h) if res.short_dir == "X" else twoway_smax_short(h)
     
     lines.append(f"smax_x = {smax_x} mm, smax_y = {smax_y} mm")
     lines.append("")
@@ -271,8 +273,7 @@ def compute_twoway_report(system, sid: str, res: dict, conc: str, steel: str,
     lines.append(f"  Seçilen: {ch_x.label()}")
     
     # X açıklık donatısını düz ve pilye olarak eşit şekilde ayır
-    ch_x_duz = RebarChoice(ch_x.phi_mm, ch_x.s_mm * 2, ch_x.area_mm2_per_m / 2)
-    ch_x_pilye = RebarChoice(ch_x.phi_mm, ch_x.s_mm * 2, ch_x.area_mm2_per_m / 2)
+    ch_x_duz, ch_x_pilye = split_duz_pilye(ch_x)
     lines.append(f"  → Düz: {ch_x_duz.label()}, Pilye: {ch_x_pilye.label()}")
     lines.append("")
     
@@ -284,8 +285,7 @@ def compute_twoway_report(system, sid: str, res: dict, conc: str, steel: str,
     lines.append(f"  Seçilen: {ch_y.label()}")
     
     # Y açıklık donatısını düz ve pilye olarak eşit şekilde ayır
-    ch_y_duz = RebarChoice(ch_y.phi_mm, ch_y.s_mm * 2, ch_y.area_mm2_per_m / 2)
-    ch_y_pilye = RebarChoice(ch_y.phi_mm, ch_y.s_mm * 2, ch_y.area_mm2_per_m / 2)
+    ch_y_duz, ch_y_pilye = split_duz_pilye(ch_y)
     lines.append(f"  → Düz: {ch_y_duz.label()}, Pilye: {ch_y_pilye.label()}")
     lines.append("")
     
@@ -393,22 +393,20 @@ def compute_twoway_report(system, sid: str, res: dict, conc: str, steel: str,
 
     (Lf, Rf, Tf, Bf), _, _ = twoway_edge_continuity_full(system, sid)
 
-    design_res = {
-        "kind": "TWOWAY", "short_dir": res["short_dir"], "cover_mm": cover,
-        "choices": {
-            "x_span": ch_x, 
-            "x_span_duz": ch_x_duz, 
-            "x_span_pilye": ch_x_pilye,
-            "y_span": ch_y, 
-            "y_span_duz": ch_y_duz, 
-            "y_span_pilye": ch_y_pilye,
-            "x_support_extra": ch_x_il, 
-            "y_support_extra": ch_y_il
-        },
-        "edge_continuity": {
-            "L": Lf, "R": Rf, "T": Tf, "B": Bf
-        }
-    }
+    design_res = SlabDesign(
+        kind="TWOWAY", short_dir=res.short_dir, cover_mm=cover,
+        choices=RebarSet(
+            x_span=ch_x, 
+            x_span_duz=ch_x_duz, 
+            x_span_pilye=ch_x_pilye,
+            y_span=ch_y, 
+            y_span_duz=ch_y_duz, 
+            y_span_pilye=ch_y_pilye,
+            x_support_extra=ch_x_il, 
+            y_support_extra=ch_y_il
+        ),
+        edge_continuity=EdgeContinuity(L=Lf, R=Rf, T=Tf, B=Bf)
+    )
     lines.append(f"SONUÇ: X: {ch_x_duz.label()} düz + {ch_x_pilye.label()} pilye | Y: {ch_y_duz.label()} düz + {ch_y_pilye.label()} pilye")
     if ch_x_il:
         lines.append(f"       X Mesnet Ek: {ch_x_il.label()}")
@@ -418,3 +416,54 @@ def compute_twoway_report(system, sid: str, res: dict, conc: str, steel: str,
     
     return design_res, lines
 
+
+
+# =========================================================
+# Döşeme tipi kaydı (slab_kinds)
+# =========================================================
+def _twoway_solve(system, sid: str, params) -> Tuple[TwoWayMoments, List[str]]:
+    if params.plate_solver:
+        return system.compute_twoway_per_slab_fd(sid, params.bw)
+    return compute_twoway_per_slab(system, sid, params.bw)
+
+
+def _twoway_span_design(res: TwoWayMoments, h: float) -> Tuple[float, float]:
+    """Kısa doğrultu açıklık momenti."""
+    Mpos_short = res.Mx[1] if res.short_dir == "X" else res.My[1]
+    return Mpos_short or 0.0, twoway_smax_short(h)
+
+
+def _twoway_report(system, sid: str, res: TwoWayMoments, balanced: Optional[TwoWayMoments],
+                   pilye_areas: Dict[str, float], params) -> Tuple[SlabDesign, List[str]]:
+    lines = []
+    if balanced is not None:
+        mxn_bal, _ = balanced.Mx
+        myn_bal, _ = balanced.My
+        if mxn_bal != res.Mx[0] or myn_bal != res.My[0]:
+            mxn_str = f"{mxn_bal:.3f}" if mxn_bal is not None else "-"
+            myn_str = f"{myn_bal:.3f}" if myn_bal is not None else "-"
+            lines.append(f"Dengelenmiş momentler: Mx_neg={mxn_str}, My_neg={myn_str}")
+        res = balanced
+    design_res, report_lines = compute_twoway_report(
+        system, sid, res, params.conc, params.steel, params.h, params.cover, params.bw,
+        neighbor_pilye_areas=pilye_areas
+    )
+    return design_res, lines + report_lines
+
+
+def _twoway_support_moment(system, sid: str, edge: str, bw: float, plate_solver: bool = False) -> float:
+    if plate_solver:
+        r, _ = system.compute_twoway_per_slab_fd(sid, bw)
+    else:
+        r, _ = compute_twoway_per_slab(system, sid, bw)
+    mxn, _ = r.Mx
+    myn, _ = r.My
+    if edge in ("L", "R"):
+        return abs(mxn) if mxn else 0.0
+    return abs(myn) if myn else 0.0
+
+
+register_slab_kind(
+    "TWOWAY", solve=_twoway_solve, span_design=_twoway_span_design, report=_twoway_report,
+    support_moment=_twoway_support_moment, balance_order=0,
+)
@@ -0,0 +1,92 @@
+import sys
+import os
+from types import SimpleNamespace
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from slab_model import Slab, SlabSystem
+from solve_runner import solve_plan, SolveParams
+from drawing_ir import SlabGeometry
+from dxf_out import plan_geometry, slab_boxes, _draw_beam_network
+
+N = 8  # N x N döşemeli plan
+BW = 300.0  # Kiriş genişliği (mm)
+
+
+def _build_plan(layout, nx, ny):
+    """(sid, i, j, x, y, w, h) listesinden hesaplanmış plan."""
+    system = SlabSystem(nx, ny)
+    real_slabs = {}
+    for sid, i, j, x, y, w, h in layout:
+        system.add_slab(Slab(sid, i, j, i, j, "TWOWAY", dx=w, dy=h, pd=10.0, b=1.0))
+        real_slabs[sid] = SimpleNamespace(x=x, y=y, w=w, h=h)
+    result = solve_plan(system, SolveParams("C25/30", "B420C", 120.0, 25.0, 0.30))
+    return system, result.design, real_slabs
+
+
+def _rects(g):
+    """BEAM katmanındaki dikdörtgenler (xmin, ymin, xmax, ymax)."""
+    lay = g.layers.get("BEAM")
+    out = []
+    for flat, _ in (lay.polylines() if lay else ()):
+        xs, ys = flat[0::2], flat[1::2]
+        out.append((min(xs), min(ys), max(xs), max(ys)))
+    return out
+
+
+def _covered(rect, rects, eps=1e-6):
+    x0, y0, x1, y1 = rect
+    return any(a - eps <= x0 and b - eps <= y0 and x1 <= c + eps and y1 <= d + eps
+               for a, b, c, d in rects)
+
+
+def _edge_beams(grid, half):
+    """Tek döşemenin dört kenar kirişi (birleştirmeden önceki hali)."""
+    x0, y0, x1, y1 = grid
+    return ([(gx - half, y0 - half, gx + half, y1 + half) for gx in (x0, x1)]
+            + [(x0 - half, gy - half, x1 + half, gy + half) for gy in (y0, y1)])
+
+
+def verify_beam_network():
+    ok = True
+
+    # Düzenli ızgara: her aks tek kesintisiz kiriş
+    layout = [(f"D{j}_{i}", i, j, i * 4.0, j * 5.0, 4.0, 5.0) for j in range(N) for i in range(N)]
+    system, design, real_slabs = _build_plan(layout, N, N)
+    beams = plan_geometry(system, design, 0.30, real_slabs)[0]
+    rects = _rects(beams)
+    good = len(rects) == 2 * (N + 1)
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: {N}x{N} planda {len(rects)} kiriş (eski yöntem {2 * N * (N + 1)})")
+
+    grids = [slab_boxes(system, sid, BW, real_slabs=real_slabs)[0] for sid in system.slabs]
+    good = all(_covered(r, rects) for grid in grids for r in _edge_beams(grid, BW / 2))
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Her döşeme kenar kirişi birleşik kirişlerin içinde")
+
+    # Kısmen örtüşen kirişler: A'nın sağ kenarı B ve C'nin sol kenarlarıyla örtüşür
+    g = SlabGeometry()
+    _draw_beam_network(g, [(0.0, 0.0, 4000.0, 5000.0), (4000.0, 0.0, 8000.0, 3000.0),
+                           (4000.0, 3000.0, 8000.0, 5000.0)], BW)
+    at_x4 = [r for r in _rects(g) if r[0] == 4000.0 - BW / 2 and r[2] == 4000.0 + BW / 2]
+    good = at_x4 == [(3850.0, -150.0, 4150.0, 5150.0)]
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Kısmen örtüşen kirişler x=4 aksında tek kirişe birleşti")
+
+    # Aralarında boşluk olan kirişler ayrı kalır
+    g = SlabGeometry()
+    _draw_beam_network(g, [(0.0, 0.0, 4000.0, 5000.0), (0.0, 8000.0, 4000.0, 10000.0)], BW)
+    at_x0 = [r for r in _rects(g) if r[0] == -BW / 2 and r[2] == BW / 2]
+    good = len(at_x0) == 2
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Kesintili akstaki kirişler ayrı çiziliyor")
+    return ok
+
+
+def test_beam_network():
+    assert verify_beam_network()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_beam_network() else 1)
@@ -0,0 +1,70 @@
+import sys
+import os
+import time
+import tempfile
+from dataclasses import replace
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from dxf_out import DrawingCache, export_to_dxf, plan_geometry
+from verify_fixtures import checkerboard_plan
+
+N = 8  # N x N döşemeli plan
+
+
+def verify_drawing_cache():
+    ok = True
+    system, design, real_slabs = checkerboard_plan(N)
+    cache = DrawingCache()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"{k}.dxf") for k in range(3)]
+        export_to_dxf(system, paths[0], design, 0.30, real_slabs=real_slabs, backend="stream")
+        export_to_dxf(system, paths[1], design, 0.30, real_slabs=real_slabs, backend="stream", cache=cache)
+        cache.hits = cache.misses = 0
+        export_to_dxf(system, paths[2], design, 0.30, real_slabs=real_slabs, backend="stream", cache=cache)
+
+        with open(paths[0], "rb") as a, open(paths[2], "rb") as b:
+            same = a.read() == b.read()
+        good = same and cache.misses == 0 and cache.hits == N * N
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Değişmeyen planda tüm döşemeler önbellekten, çıktı aynı")
+
+        # Çizim üretimi (dosya yazımı hariç)
+        t0 = time.perf_counter()
+        plan_geometry(system, design, 0.30, real_slabs)
+        t_full = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        plan_geometry(system, design, 0.30, real_slabs, cache)
+        t_cached = time.perf_counter() - t0
+        good = t_cached < t_full / 2
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Önbellekli çizim {t_cached * 1000:.1f} ms, "
+              f"önbelleksiz {t_full * 1000:.1f} ms")
+
+        # Tek döşemenin tasarımı değişti: yalnızca o döşeme yeniden çizilir
+        edited = dict(design)
+        edited["D3_3"] = replace(design["D3_3"], cover_mm=design["D3_3"].cover_mm + 5.0)
+        cache.hits = cache.misses = 0
+        export_to_dxf(system, paths[2], edited, 0.30, real_slabs=real_slabs, backend="stream", cache=cache)
+        good = cache.misses == 1
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Tasarımı değişen tek döşeme yeniden çizildi ({cache.misses})")
+
+        # Komşunun açıklığı değişti: sol ve üst komşuların mesnet ek donatısı
+        # bu açıklığa göre uzadığı için yalnızca onlar yeniden çizilir
+        system.slabs["D3_3"].dx = 4.5
+        cache.hits = cache.misses = 0
+        export_to_dxf(system, paths[2], edited, 0.30, real_slabs=real_slabs, backend="stream", cache=cache)
+        good = cache.misses == 2
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Komşu değişince yalnızca etkilenenler yeniden çizildi ({cache.misses})")
+    return ok
+
+
+def test_drawing_cache():
+    assert verify_drawing_cache()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_drawing_cache() else 1)
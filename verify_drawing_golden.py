@@ -0,0 +1,71 @@
+import sys
+import os
+import json
+import time
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from dxf_out import export_to_dxf
+from dxf_diff import geometry_fingerprint
+import verify_twoway_drawing
+import verify_oneway_drawing
+from verify_fixtures import mixed_plan
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verify_drawing_golden.json")
+
+
+# ad -> (plan kurucu, kiriş genişliği (m), export_to_dxf ek argümanları)
+CASES = {
+    "twoway": (verify_twoway_drawing.build_case, 0.25, {}),
+    "oneway": (verify_oneway_drawing.build_case, 0.25, {}),
+    "mixed": (mixed_plan, 0.30, {}),
+    "mixed_blocks": (mixed_plan, 0.30, {"blocks": True}),
+}
+
+
+def capture_all():
+    """Tüm senaryoları dosyasız çizer; ad -> katman parmak izleri."""
+    out = {}
+    for name, (build, bw, kwargs) in CASES.items():
+        system, design, real_slabs = build()
+        w = export_to_dxf(system, None, design, bw, real_slabs=real_slabs, backend="memory", **kwargs)
+        out[name] = geometry_fingerprint(w)
+    return out
+
+
+def verify_drawing_golden():
+    t0 = time.perf_counter()
+    current = capture_all()
+    elapsed = time.perf_counter() - t0
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        golden = json.load(f)
+
+    ok = True
+    for name, hashes in current.items():
+        expected = golden.get(name, {})
+        changed = sorted(k for k in set(hashes) | set(expected) if hashes.get(k) != expected.get(k))
+        good = not changed
+        ok = ok and good
+        detail = f"{len(hashes)} katman" if good else "değişen katmanlar: " + ", ".join(changed)
+        print(f"{'PASS' if good else 'FAIL'}: {name}: çizim altın kayıtla aynı ({detail})")
+    # Parmak izi INSERT'leri açtığı için bloklu çıktı düz çıktıyla aynıdır
+    good = current["mixed_blocks"] == current["mixed"]
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Bloklu ve düz çıktının parmak izleri aynı")
+    print(f"{len(current)} senaryo diske yazmadan {elapsed * 1000:.0f} ms")
+    return ok
+
+
+def test_drawing_golden():
+    assert verify_drawing_golden()
+
+
+if __name__ == "__main__":
+    if "--update" in sys.argv:
+        with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+            json.dump(capture_all(), f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Güncellendi: {GOLDEN_PATH}")
+        sys.exit(0)
+    sys.exit(0 if verify_drawing_golden() else 1)
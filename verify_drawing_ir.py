@@ -0,0 +1,71 @@
+import sys
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+import ezdxf
+from drawing_ir import SlabGeometry
+from dxf_out import export_to_dxf, export_to_svg, plan_geometry
+from verify_fixtures import mixed_plan
+
+
+def _counts(geoms):
+    polys = sum(len(lay.ends) for g in geoms for lay in g.layers.values())
+    lines = sum(len(lay.lines) // 4 for g in geoms for lay in g.layers.values())
+    texts = sum(len(lay.texts) for g in geoms for lay in g.layers.values())
+    return polys, lines, texts
+
+
+def verify_drawing_ir():
+    ok = True
+    system, design, real_slabs = mixed_plan()
+    geoms = plan_geometry(system, design, 0.30, real_slabs)
+
+    # Her döşeme ayrı kayıt; yeniden oynatma kaydı aynen üretir
+    copies = []
+    for g in geoms:
+        c = SlabGeometry()
+        g.replay(c)
+        copies.append(c)
+    good = len(geoms) == len(system.slabs) + 1 and all(
+        list(a.layers) == list(b.layers) and all(
+            a.layers[k].coords == b.layers[k].coords and a.layers[k].ends == b.layers[k].ends
+            and a.layers[k].closed == b.layers[k].closed and a.layers[k].texts == b.layers[k].texts
+            for k in a.layers)
+        for a, b in zip(geoms, copies))
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Ara temsil yeniden oynatmada korunuyor ({len(geoms)} kayıt)")
+
+    polys, lines, texts = _counts(geoms)
+    with tempfile.TemporaryDirectory() as tmp:
+        dxf_path = os.path.join(tmp, "plan.dxf")
+        svg_path = os.path.join(tmp, "plan.svg")
+        export_to_dxf(system, dxf_path, design, 0.30, real_slabs=real_slabs)
+        export_to_svg(system, svg_path, design, 0.30, real_slabs=real_slabs)
+
+        msp = ezdxf.readfile(dxf_path).modelspace()
+        good = (len(msp.query("LWPOLYLINE")) == polys and len(msp.query("LINE")) == lines
+                and len(msp.query("TEXT")) == texts)
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: DXF ara temsildeki ilkelleri içeriyor "
+              f"({polys} poliçizgi, {lines} çizgi, {texts} yazı)")
+
+        ns = "{http://www.w3.org/2000/svg}"
+        root = ET.parse(svg_path).getroot()
+        svg_polys = len(root.findall(f".//{ns}polyline")) + len(root.findall(f".//{ns}polygon"))
+        good = (svg_polys == polys and len(root.findall(f".//{ns}line")) == lines
+                and len(root.findall(f".//{ns}text")) == texts)
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: SVG aynı ara temsilden üretiliyor")
+    return ok
+
+
+def test_drawing_ir():
+    assert verify_drawing_ir()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_drawing_ir() else 1)
@@ -0,0 +1,89 @@
+import sys
+import os
+import tempfile
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+import ezdxf
+from ezdxf.lldxf.encoding import decode_dxf_unicode
+from dxf_out import export_to_dxf, _StreamDXFWriter
+from verify_fixtures import mixed_plan
+
+
+def _geometry(path):
+    """Dosyadaki varlıklar, yazıcıdan bağımsız biçimde (LWPOLYLINE = POLYLINE)."""
+    doc = ezdxf.readfile(path)
+    out = []
+    for e in doc.modelspace():
+        t = e.dxftype()
+        if t == "LWPOLYLINE":
+            pts = tuple((round(float(x), 3), round(float(y), 3)) for x, y in e.get_points("xy"))
+            out.append((e.dxf.layer, "POLY", pts, bool(e.closed)))
+        elif t == "POLYLINE":
+            pts = tuple((round(v.dxf.location.x, 3), round(v.dxf.location.y, 3)) for v in e.vertices)
+            out.append((e.dxf.layer, "POLY", pts, bool(e.is_closed)))
+        elif t == "LINE":
+            out.append((e.dxf.layer, t, tuple(round(v, 3) for v in (*e.dxf.start.vec2, *e.dxf.end.vec2))))
+        elif t == "TEXT":
+            align, p1, p2 = e.get_placement()
+            pos = p2 if p2 is not None else p1
+            out.append((e.dxf.layer, t, e.dxf.text, align.name, round(pos.x, 3), round(pos.y, 3),
+                        round(e.dxf.height, 3), round(e.dxf.rotation, 3)))
+        else:
+            out.append((e.dxf.layer, t))
+    layers = {l.dxf.name: l.dxf.color for l in doc.layers if l.dxf.name != "Defpoints"}
+    return sorted(out), layers
+
+
+def verify_dxf_backends():
+    ok = True
+    system, design, real_slabs = mixed_plan()
+    with tempfile.TemporaryDirectory() as tmp:
+        files = {}
+        for backend in ("ezdxf", "stream"):
+            files[backend] = os.path.join(tmp, f"{backend}.dxf")
+            export_to_dxf(system, files[backend], design, 0.30, real_slabs=real_slabs, backend=backend)
+        ez_geom, ez_layers = _geometry(files["ezdxf"])
+        st_geom, st_layers = _geometry(files["stream"])
+
+        good = ez_geom == st_geom and len(ez_geom) > 50
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: İki yazıcı aynı geometriyi üretiyor ({len(st_geom)} varlık)")
+
+        good = ez_layers == st_layers
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Katman adları ve renkleri aynı")
+
+        # Dosyasız yakalama yazıcısı dosyadan okunanla aynı poliçizgi ve yazıları tutar
+        w = export_to_dxf(system, None, design, 0.30, real_slabs=real_slabs, backend="memory")
+        captured = []
+        for name, lay in w.layers.items():
+            for flat, closed in lay.polylines():
+                pts = tuple((round(flat[i], 3), round(flat[i + 1], 3)) for i in range(0, len(flat), 2))
+                captured.append((name, "POLY", pts, closed))
+            captured += [(name, "TEXT", t.text) for t in lay.texts]
+        from_file = [g if g[1] == "POLY" else g[:3] for g in st_geom if g[1] in ("POLY", "TEXT")]
+        good = sorted(captured) == sorted(from_file) and w.layer_colors == {
+            k: v for k, v in st_layers.items() if k != "0"}
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Bellek yazıcısı dosyadakiyle aynı çizimi yakalıyor")
+
+        # Kod sayfası dışındaki karakterler \U+XXXX olarak yazılır ve geri okunur
+        path = os.path.join(tmp, "text.dxf")
+        w = _StreamDXFWriter(max_height=1000.0)
+        w.add_text(0, 0, "dağıtma Ø8/200 ≥ ış", layer="TEXT", rotation=90, center=True)
+        w.save(path)
+        text = next(iter(ezdxf.readfile(path).modelspace().query("TEXT")))
+        good = decode_dxf_unicode(text.dxf.text) == "dağıtma Ø8/200 ≥ ış" and text.dxf.align_point.y == 1000.0
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Türkçe/Unicode yazılar ve hizalama korunuyor")
+    return ok
+
+
+def test_dxf_backends():
+    assert verify_dxf_backends()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_dxf_backends() else 1)
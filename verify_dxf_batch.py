@@ -0,0 +1,105 @@
+import sys
+import os
+import time
+import tempfile
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+import numpy as np
+import ezdxf
+from drawing_ir import SlabGeometry
+from dxf_out import DXF_BACKENDS
+
+H = 100000.0  # Y ters çevirme yüksekliği (mm)
+
+
+def _shapes(n=2000, seed=0):
+    """Rastgele konumlu, farklı nokta sayılı poliçizgiler (GUI yönünde)."""
+    rng = np.random.default_rng(seed)
+    shapes = []
+    for k in range(n):
+        x, y = (rng.random(2) * H).tolist()
+        pts = [(x, y), (x + 300.0, y), (x + 300.0, y + 5000.0), (x + 150.5, y + 200.25)][:2 + k % 3]
+        shapes.append((pts, k % 2 == 0))
+    return shapes
+
+
+def _batch(shapes):
+    coords = np.array([c for pts, _ in shapes for p in pts for c in p], dtype=float)
+    ends = np.cumsum([len(pts) for pts, _ in shapes])
+    return coords, ends, [cl for _, cl in shapes]
+
+
+def _write(backend, path, shapes, batch, offset=(0.0, 0.0)):
+    w = DXF_BACKENDS[backend](max_height=H)
+    t0 = time.perf_counter()
+    if batch:
+        w.add_polylines(*_batch(shapes), layer="REB", offset=offset)
+    else:
+        dx, dy = offset
+        for pts, closed in shapes:
+            w.add_polyline([(x + dx, y + dy) for x, y in pts], layer="REB", closed=closed)
+    elapsed = time.perf_counter() - t0
+    w.save(path)
+    return elapsed
+
+
+def _polylines(path):
+    out = []
+    for e in ezdxf.readfile(path).modelspace():
+        if e.dxftype() == "LWPOLYLINE":
+            out.append((e.dxf.layer, tuple(e.get_points("xy")), e.closed))
+        elif e.dxftype() == "POLYLINE":
+            out.append((e.dxf.layer, tuple((v.dxf.location.x, v.dxf.location.y) for v in e.vertices),
+                        e.is_closed))
+    return out
+
+
+def verify_dxf_batch():
+    ok = True
+    shapes = _shapes()
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("ezdxf", "stream"):
+            for offset in ((0.0, 0.0), (1250.0, -40.5)):
+                single = os.path.join(tmp, f"{backend}_single.dxf")
+                batch = os.path.join(tmp, f"{backend}_batch.dxf")
+                t_single = _write(backend, single, shapes, False, offset)
+                t_batch = _write(backend, batch, shapes, True, offset)
+                if backend == "stream":
+                    with open(single, "rb") as a, open(batch, "rb") as b:
+                        good = a.read() == b.read()
+                else:
+                    good = _polylines(single) == _polylines(batch)
+                ok = ok and good
+                print(f"{'PASS' if good else 'FAIL'}: {backend}: toplu yazım tek tek yazımla aynı, öteleme {offset} "
+                      f"(tek tek {t_single * 1000:.0f} ms, toplu {t_batch * 1000:.0f} ms)")
+
+            # Düz NumPy dizisi tek poliçizgi olarak da kabul edilir
+            path = os.path.join(tmp, f"{backend}_flat.dxf")
+            w = DXF_BACKENDS[backend](max_height=H)
+            w.add_polyline(np.array([0.0, 0.0, 100.0, 0.0, 100.0, 50.0]), layer="REB", closed=True)
+            w.save(path)
+            good = _polylines(path) == [("REB", ((0.0, H), (100.0, H), (100.0, H - 50.0)), True)]
+            ok = ok and good
+            print(f"{'PASS' if good else 'FAIL'}: {backend}: düz NumPy dizisi poliçizgi olarak yazıldı")
+
+    # Ara temsil: toplu ekleme mevcut poliçizgilerin ardına doğru indekslerle eklenir
+    g = SlabGeometry()
+    g.add_polyline([(0.0, 0.0), (1.0, 1.0)], layer="REB")
+    g.add_polylines(np.array([5.0, 5.0, 6.0, 5.0, 7.0, 7.0, 8.0, 7.0, 9.0, 9.0]), [2, 5], [False, True],
+                    layer="REB", offset=(10.0, 20.0))
+    got = [(list(flat), closed) for flat, closed in g.layers["REB"].polylines()]
+    good = got == [([0.0, 0.0, 1.0, 1.0], False), ([15.0, 25.0, 16.0, 25.0], False),
+                   ([17.0, 27.0, 18.0, 27.0, 19.0, 29.0], True)]
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Ara temsile toplu ekleme (öteleme ve indeksler)")
+    return ok
+
+
+def test_dxf_batch():
+    assert verify_dxf_batch()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_dxf_batch() else 1)
@@ -0,0 +1,80 @@
+import sys
+import os
+import time
+import tempfile
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+import ezdxf
+from dxf_out import export_to_dxf, plan_geometry, BINARY_DXF_SENTINEL
+from verify_fixtures import varied_plan
+
+N = 20  # N x N döşemeli büyük plan
+
+
+def _entities(doc):
+    """Modelspace varlıkları: tip, katman, yuvarlanmış noktalar/yazı (INSERT'ler açılmış)."""
+    out = []
+    for e in doc.modelspace():
+        for v in (e.virtual_entities() if e.dxftype() == "INSERT" else [e]):
+            t = v.dxftype()
+            if t == "LWPOLYLINE":
+                pts = tuple(v.get_points("xy"))
+                t = "POLYLINE"
+            elif t == "POLYLINE":
+                pts = tuple((p.dxf.location.x, p.dxf.location.y) for p in v.vertices)
+            elif t == "TEXT":
+                pts = (v.dxf.text, v.dxf.insert.x, v.dxf.insert.y, v.dxf.rotation)
+            else:
+                pts = ()
+            out.append((t, e.dxf.layer, tuple(round(c, 6) if isinstance(c, float) else c
+                                              for p in pts for c in (p if isinstance(p, tuple) else (p,)))))
+    return sorted(out)
+
+
+def verify_dxf_binary():
+    ok = True
+    system, design, real_slabs = varied_plan(N)
+    plan_geometry(system, design, 0.30, real_slabs)  # ısınma (içe aktarımlar)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("ezdxf", "stream"):
+            for blocks in (False, True):
+                docs = {}
+                for binary in (False, True):
+                    path = os.path.join(tmp, f"{backend}_{blocks}_{binary}.dxf")
+                    t0 = time.perf_counter()
+                    export_to_dxf(system, path, design, 0.30, real_slabs=real_slabs, backend=backend,
+                                  blocks=blocks, binary=binary)
+                    t_write = time.perf_counter() - t0
+                    t0 = time.perf_counter()
+                    docs[binary] = ezdxf.readfile(path)
+                    t_read = time.perf_counter() - t0
+                    with open(path, "rb") as f:
+                        is_binary = f.read(len(BINARY_DXF_SENTINEL)) == BINARY_DXF_SENTINEL
+                    good = is_binary == binary
+                    ok = ok and good
+                    if not good:
+                        print(f"FAIL: {backend}: dosya biçimi beklenen değil (binary={binary})")
+                    rows.append((backend, blocks, binary, t_write, os.path.getsize(path), t_read))
+
+                ascii_size, binary_size = rows[-2][4], rows[-1][4]
+                good = _entities(docs[False]) == _entities(docs[True]) and binary_size < ascii_size
+                ok = ok and good
+                print(f"{'PASS' if good else 'FAIL'}: {backend}{' (bloklu)' if blocks else ''}: "
+                      f"ikili DXF aynı varlıkları içeriyor, {ascii_size // 1024} KB -> {binary_size // 1024} KB")
+
+    print(f"\n{N}x{N} plan: yazma / boyut / ezdxf ile okuma")
+    for backend, blocks, binary, t_write, size, t_read in rows:
+        name = f"{backend}{'+blok' if blocks else ''} {'ikili' if binary else 'ASCII'}"
+        print(f"  {name:<20} {t_write * 1000:7.0f} ms {size / 1024:9.0f} KB {t_read * 1000:7.0f} ms")
+    return ok
+
+
+def test_dxf_binary():
+    assert verify_dxf_binary()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_dxf_binary() else 1)
@@ -0,0 +1,96 @@
+import sys
+import os
+import tempfile
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+import ezdxf
+from drawing_ir import SlabGeometry, replay_blocks
+from dxf_out import export_to_dxf
+from verify_fixtures import checkerboard_plan
+
+N = 8  # N x N döşemeli tekrarlı plan
+
+
+def _exploded(path):
+    """INSERT'ler açılmış varlıklar: poliçizgiler (katman, noktalar, kapalı mı), diğerleri (katman, tip)."""
+    out = []
+    for e in ezdxf.readfile(path).modelspace():
+        ents = e.virtual_entities() if e.dxftype() == "INSERT" else [e]
+        for v in ents:
+            if v.dxftype() == "LWPOLYLINE":
+                pts = [(x, y) for x, y in v.get_points("xy")]
+                closed = v.closed
+            elif v.dxftype() == "POLYLINE":
+                pts = [(p.dxf.location.x, p.dxf.location.y) for p in v.vertices]
+                closed = v.is_closed
+            else:
+                out.append((e.dxf.layer, v.dxftype()))
+                continue
+            out.append((e.dxf.layer, tuple((round(x, 3) + 0.0, round(y, 3) + 0.0) for x, y in pts), closed))
+    return sorted(map(repr, out))
+
+
+class _BlockRecorder:
+    """Blok tanımlarını ve yerleştirmeleri kaydeden yazıcı."""
+
+    def __init__(self):
+        self.blocks, self.inserts, self.polylines = {}, [], []
+
+    def add_block(self, name, pts, closed=False):
+        self.blocks[name] = pts
+
+    def add_insert(self, name, x, y, rotation=0.0, layer="0"):
+        self.inserts.append((name, rotation))
+
+    def add_polyline(self, pts, layer="0", closed=False):
+        self.polylines.append(pts)
+
+
+def verify_dxf_blocks():
+    ok = True
+
+    # Ötelenmiş ve 90° döndürülmüş kopyalar aynı bloğu paylaşır
+    g = SlabGeometry()
+    hat = [(0, 0), (0, 100), (500, 100), (600, 0)]
+    g.add_polyline(hat, layer="REB_EK_MESNET")
+    g.add_polyline([(x + 1000, y + 50) for x, y in hat], layer="REB_EK_MESNET")
+    g.add_polyline([(-y, x) for x, y in hat], layer="REB_EK_MESNET")
+    g.add_polyline([(0, 0), (10, 0)], layer="DIM")
+    rec = _BlockRecorder()
+    replay_blocks([g], rec)
+    good = (len(rec.blocks) == 1 and len(rec.inserts) == 3 and len(rec.polylines) == 1
+            and len({r for _, r in rec.inserts}) == 2)
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Öteleme ve 90° dönmede aynı blok kullanılıyor")
+
+    system, design, real_slabs = checkerboard_plan(N)
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("ezdxf", "stream"):
+            plain = os.path.join(tmp, f"{backend}.dxf")
+            blocked = os.path.join(tmp, f"{backend}_blocks.dxf")
+            export_to_dxf(system, plain, design, 0.30, real_slabs=real_slabs, backend=backend)
+            export_to_dxf(system, blocked, design, 0.30, real_slabs=real_slabs, backend=backend, blocks=True)
+
+            good = _exploded(plain) == _exploded(blocked)
+            ok = ok and good
+            print(f"{'PASS' if good else 'FAIL'}: {backend}: bloklu çıktı açıldığında geometri aynı")
+
+            doc = ezdxf.readfile(blocked)
+            n_blocks = len([b for b in doc.blocks if b.name.startswith("SHAPE_")])
+            n_inserts = len(doc.modelspace().query("INSERT"))
+            size_plain, size_blocked = os.path.getsize(plain), os.path.getsize(blocked)
+            good = n_blocks < n_inserts / 10 and size_blocked < size_plain
+            ok = ok and good
+            print(f"{'PASS' if good else 'FAIL'}: {backend}: {n_blocks} blok / {n_inserts} INSERT, "
+                  f"{size_plain // 1024} KB -> {size_blocked // 1024} KB")
+    return ok
+
+
+def test_dxf_blocks():
+    assert verify_dxf_blocks()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_dxf_blocks() else 1)
@@ -0,0 +1,104 @@
+import sys
+import os
+import io
+import time
+import tempfile
+from contextlib import redirect_stdout
+from dataclasses import replace
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from drawing_ir import SlabGeometry
+from dxf_out import export_to_dxf
+from dxf_diff import (FLOOR, capture_primitives, diff_drawings, geometry_fingerprint,
+                      layer_fingerprints, main)
+from verify_fixtures import varied_plan
+
+N = 20  # Büyük plan (doğrusal zaman ölçümü)
+
+
+def verify_dxf_diff():
+    ok = True
+
+    # Sıra, poliçizgi yönü ve kapalı poliçizginin başlangıç noktası özeti değiştirmez
+    a, b = SlabGeometry(), SlabGeometry()
+    square = [(0.0, 0.0), (100.0, 0.0), (100.0, 50.0), (0.0, 50.0)]
+    a.add_polyline(square, layer="SLAB_EDGE", closed=True)
+    a.add_polyline([(0.0, 0.0), (10.0, 5.0), (20.0, 0.0)], layer="REB_MAIN_DUZ")
+    a.add_text(5.0, 5.0, "S1", height=125, layer="TEXT")
+    b.add_text(5.0, 5.0, "S1", height=125, layer="TEXT")
+    b.add_polyline([(20.0, 0.0), (10.0, 5.0), (0.0, 0.0)], layer="REB_MAIN_DUZ")
+    b.add_polyline(square[2:] + square[:2], layer="SLAB_EDGE", closed=True)
+    fa, fb = geometry_fingerprint(a), geometry_fingerprint(b)
+    b.add_text(5.0, 5.0, "S1", height=125, layer="TEXT", rotation=90.0)
+    good = fa == fb and geometry_fingerprint(b)["TEXT"] != fa["TEXT"]
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Parmak izi sıradan ve yönden bağımsız, yazı dönmesine duyarlı")
+
+    system, design, real_slabs = varied_plan(N)
+    t0 = time.perf_counter()
+    w = export_to_dxf(system, None, design, 0.30, real_slabs=real_slabs, backend="memory")
+    t_export = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    reference = geometry_fingerprint(w)
+    t_fp = time.perf_counter() - t0
+    n_prims = sum(int(fp.split(":")[0]) for fp in reference.values())
+    print(f"INFO: {N}x{N} plan: {n_prims} ilkel, parmak izi {t_fp * 1000:.0f} ms (çizim {t_export * 1000:.0f} ms)")
+
+    # Bellek yakalaması ve tüm dosya biçimleri aynı parmak izini verir
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("ezdxf", "stream"):
+            for blocks in (False, True):
+                for binary in (False, True):
+                    path = os.path.join(tmp, f"{backend}_{blocks}_{binary}.dxf")
+                    export_to_dxf(system, path, design, 0.30, real_slabs=real_slabs, backend=backend,
+                                  blocks=blocks, binary=binary)
+                    good = geometry_fingerprint(path) == reference
+                    ok = ok and good
+                    print(f"{'PASS' if good else 'FAIL'}: {backend}{' bloklu' if blocks else ''}"
+                          f"{' ikili' if binary else ''} dosya bellek yakalamasıyla aynı parmak izine sahip")
+
+        # Tek döşemenin tasarımı değişti: fark yalnızca o döşemeye atanır
+        edited = dict(design)
+        edited["D7_5"] = replace(design["D7_5"], cover_mm=design["D7_5"].cover_mm + 10.0)
+        old = capture_primitives(w)
+        new = capture_primitives(export_to_dxf(system, None, edited, 0.30, real_slabs=real_slabs,
+                                               backend="memory"))
+        diffs = diff_drawings(old, new)
+        slabs = {sid for d in diffs for sid in (*d.removed, *d.added)}
+        changed = {layer for layer, fp in layer_fingerprints(new).items() if reference.get(layer) != fp}
+        good = slabs == {"D7_5"} and {d.layer for d in diffs} == changed and "BEAM" not in changed
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Fark döşeme bazında bulundu ({sorted(slabs)}, "
+              f"{len(diffs)} katman)")
+
+        # Kiriş genişliği değişince kirişler KAT grubunda raporlanır
+        new = capture_primitives(export_to_dxf(system, None, design, 0.25, real_slabs=real_slabs,
+                                               backend="memory"))
+        beam = [d for d in diff_drawings(old, new) if d.layer == "BEAM"]
+        good = len(beam) == 1 and set(beam[0].removed) == {FLOOR}
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Kiriş farkları kat düzeyinde raporlanıyor")
+
+        # Komut satırı: aynı dosyalarda 0, farklılarda 1
+        a_path = os.path.join(tmp, "a.dxf")
+        b_path = os.path.join(tmp, "b.dxf")
+        export_to_dxf(system, a_path, design, 0.30, real_slabs=real_slabs, backend="stream")
+        export_to_dxf(system, b_path, edited, 0.30, real_slabs=real_slabs, backend="stream", binary=True)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            same = main([a_path, os.path.join(tmp, "stream_False_False.dxf")])
+            different = main([a_path, b_path])
+        good = same == 0 and different == 1 and "D7_5" in out.getvalue()
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: dxf_diff komut satırı farkı döşeme adıyla bildiriyor")
+    return ok
+
+
+def test_dxf_diff():
+    assert verify_dxf_diff()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_dxf_diff() else 1)
@@ -1,46 +1,119 @@
 
 import sys
 import os
+import tempfile
 
 # Add project root to sys.path
 sys.path.append(os.getcwd())
 
-from dxf_out import _DXFWriter
+import numpy as np
+from dxf_out import DXF_BACKENDS, DXF_BINARY_BACKENDS
+
+MAX_H = 1000.0
+
+
+def _draw(w):
+    """GUI koordinatlarında (Y aşağı) her ilkel türünden bir tane çizer."""
+    w.add_line(0.0, 0.0, 100.0, MAX_H, layer="L")               # Üst (0) ve alt (1000)
+    w.add_polyline([(0.0, 250.0), (100.0, 250.0)], layer="P")    # Çeyrek (250)
+    w.add_polylines(np.array([0.0, 0.0, 100.0, 0.0]), (2,), (False,), layer="A",
+                    offset=(0.0, 250.0))                          # Ötelemeyle çeyrek
+    w.add_text(0.0, 250.0, "T", layer="T")
+    w.add_block("B", [(0.0, 0.0), (0.0, 100.0)])                  # Blok içinde aşağı doğru
+    w.add_insert("B", 0.0, 250.0, layer="I")
+
+
+def _captured_points(w):
+    """Bellek yazıcısının kaydettiği DXF noktaları, katman -> [(x, y)] (blok "B" ayrıca)."""
+    pts = {}
+    for name, lay in w.layers.items():
+        out = pts.setdefault(name, [])
+        out += list(zip(lay.lines[0::2], lay.lines[1::2]))
+        out += [p for flat, _ in lay.polylines() for p in zip(flat[0::2], flat[1::2])]
+        out += [(t.x, t.y) for t in lay.texts]
+    for layer, _, x, y, _ in w.inserts:
+        pts.setdefault(layer, []).append((x, y))
+    for name, (block_pts, _) in w.blocks.items():
+        pts[name] = list(block_pts)
+    return pts
+
+
+def _file_points(path):
+    """Dosyadan (ASCII veya ikili) okunan DXF noktaları, katman -> [(x, y)] (blok "B" ayrıca)."""
+    import ezdxf
+    doc = ezdxf.readfile(path)
+
+    def points(e):
+        kind = e.dxftype()
+        if kind == "LINE":
+            return [e.dxf.start, e.dxf.end]
+        if kind == "LWPOLYLINE":
+            return list(e.get_points("xy"))
+        if kind == "POLYLINE":
+            return [v.dxf.location for v in e.vertices]
+        return [e.dxf.insert]  # TEXT, INSERT
+
+    pts = {}
+    for e in doc.modelspace():
+        pts.setdefault(e.dxf.layer, []).extend((p[0], p[1]) for p in points(e))
+    blk = doc.blocks.get("B")
+    if blk is not None:
+        pts["B"] = [(p[0], p[1]) for e in blk for p in points(e)]
+    return pts
+
+
+def writer_points(draw, max_height=MAX_H):
+    """
+    draw(w) çizimini her yazıcıyla (ezdxf, stream, bellek ve ikili halleri)
+    yapar; dosya yazanları kaydedip geri okur.
+
+    Returns:
+        [(yazıcı adı, katman -> [(x, y)] DXF noktaları)]
+    """
+    writers = [(name, cls) for name, cls in DXF_BACKENDS.items()]
+    writers += [(f"{name}+binary", cls) for name, cls in DXF_BINARY_BACKENDS.items()]
+    out = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, cls in writers:
+            w = cls(max_height=max_height)
+            draw(w)
+            if name == "memory":
+                out.append((name, _captured_points(w)))
+            else:
+                path = os.path.join(tmp, f"{name.replace('+', '_')}.dxf")
+                w.save(path)
+                out.append((name, _file_points(path)))
+    return out
+
+
+EXPECTED = {"L": [1000.0, 0.0], "P": [750.0, 750.0], "A": [750.0, 750.0],
+            "T": [750.0], "I": [750.0], "B": [0.0, -100.0]}
+
 
 def verify_inversion():
-    max_h = 1000.0
-    w = _DXFWriter(max_height=max_h)
-    
-    # Test point at y=0 (Top in GUI) -> Should be y=1000 (Top in DXF)
-    y_in = 0.0
-    y_out = w._fy(y_in)
-    print(f"Input: {y_in} -> Output: {y_out}")
-    if abs(y_out - 1000.0) < 1e-6:
-        print("PASS: Top (0) -> Top (1000)")
-    else:
-        print("FAIL: Top (0) -> ?")
-
-    # Test point at y=1000 (Bottom in GUI) -> Should be y=0 (Bottom in DXF)
-    y_in = 1000.0
-    y_out = w._fy(y_in)
-    print(f"Input: {y_in} -> Output: {y_out}")
-    if abs(y_out - 0.0) < 1e-6:
-        print("PASS: Bottom (1000) -> Bottom (0)")
-    else:
-        print("FAIL: Bottom (1000) -> ?")
-
-    # Test point at y=250 (Quarter way down in GUI) -> Should be y=750 (Quarter way up in DXF)
-    y_in = 250.0
-    y_out = w._fy(y_in)
-    print(f"Input: {y_in} -> Output: {y_out}")
-    if abs(y_out - 750.0) < 1e-6:
-        print("PASS: Quarter (250) -> Quarter (750)")
-    else:
-        print("FAIL: Quarter (250) -> ?")
+    ok = True
+    for name, pts in writer_points(_draw):
+        ys = {k: [y for _, y in v] for k, v in pts.items()}
+        good = all(len(ys.get(k, [])) == len(v) and np.allclose(ys.get(k, []), v)
+                   for k, v in EXPECTED.items())
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: {name}: Üst (0) -> 1000, alt (1000) -> 0, "
+              f"çeyrek (250) -> 750, blok içeriği aşağı")
+        if not good:
+            print(f"  {ys}")
+
+    # max_height verilmezse koordinatlar olduğu gibi kalır
+    w = DXF_BACKENDS["memory"]()
+    w.add_line(0.0, 250.0, 0.0, 750.0, layer="L")
+    good = list(w.layers["L"].lines[1::2]) == [250.0, 750.0]
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: max_height yoksa Y değişmiyor")
+    return ok
+
+
+def test_inversion():
+    assert verify_inversion()
+
 
 if __name__ == "__main__":
-    try:
-        verify_inversion()
-        print("Verification completed successfully.")
-    except Exception as e:
-        print(f"Verification failed with error: {e}")
+    sys.exit(0 if verify_inversion() else 1)
@@ -0,0 +1,78 @@
+"""
+Doğrulama Planları
+==================
+
+verify_*.py betiklerinin ortak kullandığı hesaplanmış örnek planlar.
+Her kurucu (system, design, real_slabs) döndürür; real_slabs GUI'deki
+gerçek döşeme dikdörtgenlerinin (x, y, w, h; m) yerini tutar.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from slab_model import Slab, SlabSystem
+from solve_runner import solve_plan, SolveParams
+from slab_kinds import balancing_kinds, get_slab_kind
+
+
+def mixed_plan():
+    """İki yönlü, tek yönlü ve balkon döşemeli küçük plan (hesaplanmış)."""
+    system = SlabSystem(3, 3)
+    plan = [("S1", 0, 0, "TWOWAY"), ("S2", 1, 0, "TWOWAY"), ("S3", 2, 0, "ONEWAY"),
+            ("S4", 0, 1, "ONEWAY"), ("S5", 1, 1, "ONEWAY"), ("S6", 2, 1, "TWOWAY"),
+            ("B1", 0, 2, "BALCONY")]
+    real_slabs = {}
+    for sid, i, j, kind in plan:
+        h = 5.0 if j < 2 else 1.5
+        system.add_slab(Slab(sid, i, j, i, j, kind, dx=4.0, dy=h, pd=10.0, b=1.0))
+        real_slabs[sid] = SimpleNamespace(x=i * 4.0, y=j * 5.0, w=4.0, h=h)
+    result = solve_plan(system, SolveParams("C25/30", "B420C", 120.0, 25.0, 0.30))
+    return system, result.design, real_slabs
+
+
+def checkerboard_plan(n):
+    """Satranç tahtası düzeninde iki yönlü / tek yönlü, aynı açıklıklı (4 x 5 m) n x n plan (hesaplanmış)."""
+    system = SlabSystem(n, n)
+    real_slabs = {}
+    for j in range(n):
+        for i in range(n):
+            sid = f"D{j}_{i}"
+            kind = "TWOWAY" if (i + j) % 2 == 0 else "ONEWAY"
+            system.add_slab(Slab(sid, i, j, i, j, kind, dx=4.0, dy=5.0, pd=10.0, b=1.0))
+            real_slabs[sid] = SimpleNamespace(x=i * 4.0, y=j * 5.0, w=4.0, h=5.0)
+    result = solve_plan(system, SolveParams("C25/30", "B420C", 120.0, 25.0, 0.30))
+    return system, result.design, real_slabs
+
+
+def varied_plan(n):
+    """Farklı açıklıklı (3.5 / 4.0 / 5.0 m), karışık tipli n x n plan (hesaplanmış)."""
+    system = SlabSystem(n, n)
+    real_slabs = {}
+    xs = [0.0]
+    for i in range(n):
+        xs.append(xs[-1] + (3.5, 4.0, 5.0)[i % 3])
+    for j in range(n):
+        for i in range(n):
+            sid = f"D{j}_{i}"
+            kind = "TWOWAY" if (i + j) % 3 else "ONEWAY"
+            w = xs[i + 1] - xs[i]
+            system.add_slab(Slab(sid, i, j, i, j, kind, dx=w, dy=5.0, pd=10.0, b=1.0))
+            real_slabs[sid] = SimpleNamespace(x=xs[i], y=j * 5.0, w=w, h=5.0)
+    result = solve_plan(system, SolveParams("C25/30", "B420C", 120.0, 25.0, 0.30))
+    return system, result.design, real_slabs
+
+
+def balance_inputs(system, bw=0.30):
+    """Mesnet dengelemesine giren ham momentler (solve_plan'ın 1. geçişindeki gibi)."""
+    params = SolveParams("C25/30", "B420C", 120.0, 25.0, bw)
+    raw = {}
+    for kind in balancing_kinds():
+        spec = get_slab_kind(kind)
+        for sid in sorted(system.slabs):
+            if system.slabs[sid].kind == kind:
+                raw[sid], _ = spec.solve(system, sid, params)
+    return raw
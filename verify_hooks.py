@@ -1,6 +1,7 @@
 
 import sys
 import os
+from types import SimpleNamespace
 
 # Add current directory to path
 sys.path.append(os.getcwd())
@@ -9,13 +10,13 @@ from slab_model import SlabSystem, Slab
 from oneway_slab import compute_oneway_report
 from dxf_out import export_to_dxf
 
-def test_hooks():
+def verify_hooks():
     print("Initializing SlabSystem...")
     system = SlabSystem(5, 5)
     
     # Create a simple one-way slab
     # 4x4m slab
-    s = Slab("S101", 0, 0, 1, 1, "ONEWAY", dx=4.0, dy=4.0, pd=10.0, b_width=1.0)
+    s = Slab("S101", 0, 0, 1, 1, "ONEWAY", dx=4.0, dy=4.0, pd=10.0, b=1.0)
     system.add_slab(s)
     
     bw = 0.30
@@ -55,7 +56,8 @@ def test_hooks():
     expected_str_2 = f"bw={bw*100:.0f}cm giriş"
     expected_str_3 = f"bw={bw*100:.0f}cm aşağı kanca"
     
-    if expected_str_1 in full_report and expected_str_2 in full_report and expected_str_3 in full_report:
+    ok = expected_str_1 in full_report and expected_str_2 in full_report and expected_str_3 in full_report
+    if ok:
         print("✅ Report verification PASSED: Hook details found.")
     else:
         print("❌ Report verification FAILED: Hook details NOT found.")
@@ -67,13 +69,27 @@ def test_hooks():
     print("\nTesting DXF Export...")
     # We need 'last_design' cache for DXF
     design_cache = {"S101": design_res}
+    real_slabs = {"S101": SimpleNamespace(x=0.0, y=0.0, w=4.0, h=4.0)}
     try:
-        export_to_dxf(system, "test_hooks.dxf", design_cache, bw)
-        print("✅ DXF Export PASSED (Runtime). Check test_hooks.dxf visually.")
+        # Diske yazmadan yakala; kancalı donatılar çizilmiş olmalı
+        w = export_to_dxf(system, None, design_cache, bw, real_slabs=real_slabs, backend="memory")
+        drawn = sum(len(lay.ends) for name, lay in w.layers.items() if name.startswith("REB_"))
+        if drawn:
+            print(f"✅ DXF Export PASSED (Runtime): {drawn} rebar polylines captured.")
+        else:
+            ok = False
+            print("❌ DXF Export FAILED: no rebar polylines captured.")
     except Exception as e:
+        ok = False
         print(f"❌ DXF Export CRASHED: {e}")
         import traceback
         traceback.print_exc()
+    return ok
+
+
+def test_hooks():
+    assert verify_hooks()
+
 
 if __name__ == "__main__":
-    test_hooks()
+    sys.exit(0 if verify_hooks() else 1)
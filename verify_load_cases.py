@@ -0,0 +1,240 @@
+import sys
+import os
+from types import SimpleNamespace
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+import numpy as np
+from slab_model import Slab, SlabSystem
+from solve_runner import solve_plan, SolveParams
+from load_cases import (GAMMA_G, GAMMA_Q, SlabLoads, oneway_chain_envelope,
+                        support_influence_matrix, span_max_moments)
+from gui import App, RealSlab
+
+CHAIN_LS = (3.0, 4.0, 3.5)   # Üç açıklıklı, uçları basit mesnetli tek doğrultulu zincir
+CHAIN_LOADS = SlabLoads(g=4.0, q=3.0, partition=1.0)
+
+
+def _chain_system():
+    system = SlabSystem(len(CHAIN_LS) + 2, 3)
+    for i, L in enumerate(CHAIN_LS):
+        system.add_slab(Slab(f"S{i + 1}", i, 0, i, 0, "ONEWAY", dx=L, dy=8.0,
+                             pd=CHAIN_LOADS.design_load(), b=1.0, loads=CHAIN_LOADS))
+    return system
+
+
+def _three_moment(Ls, ws):
+    """Basit mesnetli sürekli kiriş: iç mesnet momentleri doğrudan üç moment denklemiyle."""
+    n = len(Ls)
+    A = np.zeros((n - 1, n - 1))
+    rhs = np.zeros(n - 1)
+    for k in range(n - 1):
+        La, Lb = Ls[k], Ls[k + 1]
+        A[k, k] = 2.0 * (La + Lb)
+        if k > 0:
+            A[k, k - 1] = La
+        if k < n - 2:
+            A[k, k + 1] = Lb
+        rhs[k] = -(ws[k] * La ** 3 + ws[k + 1] * Lb ** 3) / 4.0
+    return np.concatenate(([0.0], np.linalg.solve(A, rhs), [0.0]))
+
+
+def _sampled_span_max(L, w, Ml, Mr):
+    x = np.linspace(0.0, L, 4001)
+    return float(np.max(w * x * (L - x) / 2.0 + Ml * (1.0 - x / L) + Mr * x / L))
+
+
+def verify_chain_envelope():
+    """Üç açıklıklı zincirde tüm yük durumları, dama (ODD/EVEN) yüklemesi ve zarf."""
+    ok = True
+    system = _chain_system()
+    env = system.compute_oneway_envelope("S2", 0.30)
+    Ls = env.geometry.Ls
+
+    good = env.geometry.chain == ("S1", "S2", "S3") and np.allclose(Ls, CHAIN_LS)
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Zincir derlendi: {env.geometry.chain}, açıklıklar {Ls}")
+
+    # Kombinasyonlar: tam yük, tek açıklıklar (1., 3.) ve çift açıklık (2.) hareketli yüklü
+    g = GAMMA_G * (CHAIN_LOADS.g + CHAIN_LOADS.partition)
+    full = g + GAMMA_Q * CHAIN_LOADS.q
+    patterns = {"G+G_bolme+Q": (full, full, full),
+                "G+G_bolme+Q_tek": (full, g, full),
+                "G+G_bolme+Q_cift": (g, full, g)}
+    for c, name in enumerate(env.combination_names):
+        ws = patterns[name]
+        M_ref = _three_moment(Ls, ws)
+        span_ref = [_sampled_span_max(L, w, M_ref[i], M_ref[i + 1]) for i, (L, w) in enumerate(zip(Ls, ws))]
+        good = (np.allclose(env.support_M[:, c], M_ref, atol=1e-9)
+                and np.allclose(env.span_M[:, c], span_ref, atol=1e-4))
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: {name}: mesnet {np.round(env.support_M[:, c], 3)}, "
+              f"açıklık {np.round(env.span_M[:, c], 3)}")
+
+    good = abs(full - CHAIN_LOADS.design_load()) < 1e-12
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Tam yük kombinasyonu pd'ye eşit ({full:.2f} kN/m²)")
+
+    # Zarf: dama yüklemesi açıklık momentlerini büyütür (kenar açıklıklarda ODD, ortada EVEN)
+    odd, even = env.combination_names.index("G+G_bolme+Q_tek"), env.combination_names.index("G+G_bolme+Q_cift")
+    good = (np.allclose(env.span_env, env.span_M.max(axis=1))
+            and np.allclose(env.support_env, env.support_M.min(axis=1))
+            and np.all(env.span_env > env.span_M[:, 0])
+            and env.span_env[0] == env.span_M[0, odd] and env.span_env[2] == env.span_M[2, odd]
+            and env.span_env[1] == env.span_M[1, even])
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Zarf: açıklık {np.round(env.span_env, 3)}, "
+          f"mesnet {np.round(env.support_env, 3)}")
+
+    Mpos, Mneg = env.slab_envelope("S2")
+    good = Mpos == env.span_env[1] and Mneg == min(env.support_env[1], env.support_env[2])
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: S2 zarfı: M+ = {Mpos:.3f}, M- = {Mneg:.3f}")
+
+    # Zarf zincir başına bir kez hesaplanır; her döşemeden ayrı ayrı hesapla aynıdır
+    envs = [system.compute_oneway_envelope(sid, 0.30) for sid in ("S1", "S2", "S3")]
+    fresh = [oneway_chain_envelope(system, sid, 0.30) for sid in ("S1", "S3")]
+    good = (all(e is env for e in envs)
+            and all(np.array_equal(f.support_M, env.support_M) and np.array_equal(f.span_M, env.span_M)
+                    for f in fresh))
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Zarf zincirin döşemeleri arasında paylaşılıyor")
+
+    # Yük yerinde değişince önbellek yeniden hesaplar
+    system.slabs["S1"].loads = SlabLoads(g=4.0, q=6.0)
+    changed = system.compute_oneway_envelope("S2", 0.30)
+    fresh = oneway_chain_envelope(system, "S2", 0.30)
+    good = (changed is not env and np.array_equal(changed.support_M, fresh.support_M)
+            and not np.array_equal(changed.support_M, env.support_M)
+            and system.compute_oneway_envelope("S3", 0.30) is changed)
+    system.slabs["S1"].loads = CHAIN_LOADS
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Yük değişince zarf yenileniyor (S2 mesnet "
+          f"{np.round(changed.support_env[1:3], 3)})")
+
+    # Kiriş sonradan çizilince (iki hücreli döşeme ikiye bölünür) zarf yenilenir
+    beams = SlabSystem(4, 3)
+    beams.add_slab(Slab("W", 0, 0, 1, 0, "ONEWAY", dx=6.0, dy=8.0, pd=CHAIN_LOADS.design_load(),
+                        b=1.0, loads=CHAIN_LOADS))
+    beams.add_slab(Slab("S", 2, 0, 2, 0, "ONEWAY", dx=3.0, dy=8.0, pd=CHAIN_LOADS.design_load(),
+                        b=1.0, loads=CHAIN_LOADS))
+    before = beams.compute_oneway_envelope("S", 0.30)
+    beams.V_beam.add((0, 0))
+    after = beams.compute_oneway_envelope("S", 0.30)
+    good = (len(before.geometry.Ls) == 2 and after.geometry == oneway_chain_envelope(beams, "S", 0.30).geometry
+            and len(after.geometry.Ls) == 3)
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Kiriş eklenince zarf yenileniyor "
+          f"({len(before.geometry.Ls)} -> {len(after.geometry.Ls)} açıklık)")
+
+    # Raporda her döşeme için zarf satırı
+    result = solve_plan(system, SolveParams("C25/30", "B420C", 120.0, 25.0, 0.30))
+    good = all(f"M+ = {env.slab_envelope(sid)[0]:.3f}" in result.sections[sid] for sid in ("S1", "S2", "S3"))
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Rapor her döşemede zarf satırını gösteriyor")
+    return ok
+
+
+def verify_pattern_design():
+    """Dama yüklemesi katsayı momentlerini aşınca donatı zarfa göre seçilir."""
+    ok = True
+    loads = SlabLoads(g=1.0, q=10.0)   # Hareketli yük ağırlıklı, iki eşit açıklık
+    params = SolveParams("C25/30", "B420C", 120.0, 25.0, 0.30)
+    results = []
+    for with_loads in (False, True):
+        system = SlabSystem(4, 3)
+        for i in range(2):
+            system.add_slab(Slab(f"S{i + 1}", i, 0, i, 0, "ONEWAY", dx=4.0, dy=8.0, pd=loads.design_load(),
+                                 b=1.0, loads=loads if with_loads else None))
+        results.append((system, solve_plan(system, params)))
+    (_, coef), (system, pattern) = results
+    Mpos_env, Mneg_env = system.compute_oneway_envelope("S1", 0.30).slab_envelope("S1")
+    m_coef, m_pat = coef.moments["S1"][0], pattern.moments["S1"][0]
+    main_coef, main_pat = coef.design["S1"].choices.main, pattern.design["S1"].choices.main
+    good = (Mpos_env > m_coef.Mpos_max and m_pat.Mpos_max == Mpos_env
+            and m_pat.Mneg_min == min(m_coef.Mneg_min, Mneg_env)
+            and main_pat.area_mm2_per_m > main_coef.area_mm2_per_m and main_pat.label() != main_coef.label())
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Dama yüklemesi M+ {m_coef.Mpos_max:.3f} -> {m_pat.Mpos_max:.3f}, "
+          f"ana donatı {main_coef.label()} -> {main_pat.label()}")
+    return ok
+
+
+def verify_gui_loads():
+    """GUI yük düzenleme yolu: yeni RealSlab (anlık görüntüler bozulmaz), pd güncellenir."""
+    ok = True
+    old = RealSlab("S1", 0.0, 0.0, 3.0, 8.0, "ONEWAY", 10.0, 1.0)
+    calls = []
+    app = SimpleNamespace(real_slabs={"S1": old},
+                          _begin_edit=lambda: calls.append("begin"),
+                          _sync_to_cell_system=lambda: calls.append("sync"),
+                          refresh_slab_list=lambda: None, redraw=lambda: None)
+    App.set_slab_loads(app, "S1", CHAIN_LOADS)
+    new = app.real_slabs["S1"]
+    good = (new is not old and old.loads is None and new.loads == CHAIN_LOADS
+            and abs(new.pd - CHAIN_LOADS.design_load()) < 1e-12 and calls == ["begin", "sync"])
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Yükler yeni döşeme kaydıyla atanıyor (pd = {new.pd:.2f})")
+
+    App.set_slab_loads(app, "S1", None)
+    good = app.real_slabs["S1"].loads is None and app.real_slabs["S1"].pd == new.pd
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Yükler kaldırılınca yalnızca pd kalıyor")
+    return ok
+
+
+def verify_load_cases():
+    ok = True
+    L, w = 4.0, 10.0
+    Ls = np.array([L, L])
+    S = support_influence_matrix((L, L), False, False)
+
+    # Sütunlar: iki açıklık yüklü, yalnızca 1. açıklık yüklü
+    W = np.array([[w, w], [w, 0.0]])
+    M = S @ W
+    Mspan = span_max_moments(Ls, W, M)
+
+    checks = [
+        ("Orta mesnet (tam yük) = -wL²/8", M[1, 0], -w * L**2 / 8),
+        ("Açıklık (tam yük) = 9wL²/128", Mspan[0, 0], 9 * w * L**2 / 128),
+        ("Orta mesnet (dama) = -wL²/16", M[1, 1], -w * L**2 / 16),
+        ("Açıklık (dama) = 49wL²/512", Mspan[0, 1], 49 * w * L**2 / 512),
+    ]
+    for name, got, expected in checks:
+        good = abs(got - expected) < 1e-9
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: {name}: {got:.4f} (beklenen {expected:.4f})")
+
+    # İki ucu ankastre tek açıklık: -wL²/12 ve wL²/24
+    S1 = support_influence_matrix((L,), True, True)
+    M1 = S1 @ np.array([[w]])
+    Mp1 = span_max_moments(np.array([L]), np.array([[w]]), M1)
+    good = abs(M1[0, 0] + w * L**2 / 12) < 1e-9 and abs(Mp1[0, 0] - w * L**2 / 24) < 1e-9
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Ankastre tek açıklık: M- = {M1[0, 0]:.4f}, M+ = {Mp1[0, 0]:.4f}")
+    return ok
+
+
+def test_load_cases():
+    assert verify_load_cases()
+
+
+def test_chain_envelope():
+    assert verify_chain_envelope()
+
+
+def test_pattern_design():
+    assert verify_pattern_design()
+
+
+def test_gui_loads():
+    assert verify_gui_loads()
+
+
+if __name__ == "__main__":
+    ok = verify_load_cases()
+    ok = verify_chain_envelope() and ok
+    ok = verify_pattern_design() and ok
+    ok = verify_gui_loads() and ok
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,111 @@
+import sys
+import os
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+import numpy as np
+from slab_model import Slab, SlabSystem
+from moment_balance_slab import build_support_edges, distribute_support_moments
+from verify_fixtures import checkerboard_plan, balance_inputs
+
+BW = 0.30
+
+
+def _row_plan(spans):
+    """Yan yana TWOWAY döşemelerden tek sıra (açıklıklar farklı, dy = 5 m)."""
+    system = SlabSystem(len(spans) + 2, 3)
+    for i, L in enumerate(spans):
+        system.add_slab(Slab(f"S{i + 1}", i, 0, i, 0, "TWOWAY", dx=L, dy=5.0, pd=10.0, b=1.0))
+    return system
+
+
+def verify_convergence():
+    """Büyük planda yakınsama, tol / max_iter ve önceki çözümden başlatma."""
+    ok = True
+    system, _, _ = checkerboard_plan(4)
+    raw = balance_inputs(system, BW)
+    res = distribute_support_moments(system, raw, BW)
+    scale = max(max(e.M1, e.M2) for e in build_support_edges(system, raw, BW))
+
+    # Yakınsayınca her ortak mesnetin iki yanındaki moment eşit
+    pairs = [((e.sid1, e.edge1), (e.sid2, e.edge2)) for e in build_support_edges(system, raw, BW)]
+    joint_sizes = {}
+    for a, b in pairs:
+        joint_sizes[a] = joint_sizes.get(a, 0) + 1
+        joint_sizes[b] = joint_sizes.get(b, 0) + 1
+    simple = [(a, b) for a, b in pairs if joint_sizes[a] == joint_sizes[b] == 1]
+    gap = max(abs(res.edge_moments[a] - res.edge_moments[b]) for a, b in simple)
+    good = res.converged and res.residual <= 1e-4 * scale and 0 < res.iterations < 500 and gap <= 1e-3 * scale
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: {res.iterations} yinelemede yakınsadı "
+          f"(artık {res.residual:.2e}, mesnet iki yanı farkı {gap:.2e}, {len(simple)} mesnet)")
+
+    # Gevşek tolerans daha az yineleme; max_iter sınırı yakınsamadı olarak raporlanır
+    loose = distribute_support_moments(system, raw, BW, tol=1e-2)
+    capped = distribute_support_moments(system, raw, BW, max_iter=1)
+    good = (loose.converged and loose.iterations < res.iterations
+            and capped.iterations == 1 and not capped.converged and "YAKINSAMADI" in capped.log[-1])
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: tol=1e-2: {loose.iterations} yineleme; "
+          f"max_iter=1: yakınsamadı ({capped.residual:.2e})")
+
+    # Önceki çözümden başlatınca yineleme gerekmez, sonuç aynı
+    warm = distribute_support_moments(system, raw, BW, warm_start=res)
+    good = (warm.iterations == 0 and warm.converged and warm.edge_moments == res.edge_moments
+            and "önceki çözümden" in warm.log[-1])
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Önceki çözümden başlatma: {warm.iterations} yineleme")
+
+    # Kısmi çözümden başlatma da aynı sonuca yakınsar
+    resumed = distribute_support_moments(system, raw, BW, warm_start=capped)
+    diff = max(abs(resumed.edge_moments[k] - v) for k, v in res.edge_moments.items())
+    good = resumed.converged and resumed.iterations < res.iterations and diff <= 1e-3 * scale
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Yarım çözümden devam: {resumed.iterations} yineleme, fark {diff:.2e}")
+    return ok
+
+
+def verify_direct_agreement():
+    """Üç açıklıklı sırada iteratif sonuç, düğüm denge denklemlerinin doğrudan çözümüyle aynı."""
+    ok = True
+    system = _row_plan((4.0, 6.0, 4.5))
+    raw = balance_inputs(system, BW)
+    edges = {(e.sid1, e.edge1): e for e in build_support_edges(system, raw, BW)}
+    e1, e2 = edges[("S1", "R")], edges[("S2", "R")]
+    k1, k2, k3 = 1.0 / e1.L1, 1.0 / e1.L2, 1.0 / e2.L2
+    M1, M2l, M2r, M3 = e1.M1, e1.M2, e2.M1, e2.M2
+
+    # Dış uçlar ankastre; iç çubuk (S2) uçları arasında ½ taşıma
+    K = np.array([[k1 + k2, 0.5 * k2], [0.5 * k2, k2 + k3]])
+    t1, t2 = np.linalg.solve(K, [M1 - M2l, M2r - M3])
+    direct = {("S1", "R"): M1 - k1 * t1, ("S2", "L"): M2l + k2 * t1 + 0.5 * k2 * t2,
+              ("S2", "R"): M2r - k2 * t2 - 0.5 * k2 * t1, ("S3", "L"): M3 + k3 * t2}
+
+    res = distribute_support_moments(system, raw, BW, tol=1e-10)
+    diff = max(abs(res.edge_moments[k] - v) for k, v in direct.items())
+    good = res.converged and diff < 1e-8
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Doğrudan çözümle fark {diff:.2e} "
+          f"({', '.join(f'{s}-{e}={v:.3f}' for (s, e), v in direct.items())})")
+
+    # Dengelenmiş kayıtlar: her doğrultuda kenarların en büyüğü
+    bal = res.moments["S2"]
+    good = abs(bal.Mx[0] + max(direct[("S2", "L")], direct[("S2", "R")])) < 1e-8 and bal.My == raw["S2"].My
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: S2 Mx_neg = {bal.Mx[0]:.3f} (My değişmedi)")
+    return ok
+
+
+def test_convergence():
+    assert verify_convergence()
+
+
+def test_direct_agreement():
+    assert verify_direct_agreement()
+
+
+if __name__ == "__main__":
+    ok = verify_convergence()
+    ok = verify_direct_agreement() and ok
+    sys.exit(0 if ok else 1)
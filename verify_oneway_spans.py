@@ -0,0 +1,51 @@
+import sys
+import os
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from slab_model import Slab, SlabSystem
+from oneway_slab import build_oneway_chain, oneway_chain_spans
+
+BW = 0.30
+
+
+def _chain_plan():
+    """Üst üste iki tek yönlü döşeme (6 x 3 m): açıklıklar Y gridline'ları arasında."""
+    system = SlabSystem(3, 3)
+    for j in range(2):
+        system.add_slab(Slab(f"S{j + 1}", 0, j, 0, j, "ONEWAY", dx=6.0, dy=3.0, pd=10.0, b=1.0))
+    return system
+
+
+def verify_oneway_spans():
+    """Net açıklık, açıklık gridline'larındaki (uzun kenar yönü) kirişlere göre düşülür."""
+    ok = True
+    cases = (
+        ("Kirişsiz", set(), set(), (3.0, 3.0)),
+        # Ortadaki yatay kiriş (gridline 1) her iki açıklığın bir ucunu kirişli yapar
+        ("Ara kiriş", {(0, 0)}, set(), (3.0 - 0.5 * BW, 3.0 - 0.5 * BW)),
+        # Aynı numaralı düşey kiriş diğer eksende: açıklık uçlarıyla ilgisiz
+        ("Diğer eksende kiriş", set(), {(0, 0), (0, 1)}, (3.0, 3.0)),
+    )
+    for name, h_beam, v_beam, expected in cases:
+        system = _chain_plan()
+        system.H_beam, system.V_beam = h_beam, v_beam
+        chain = build_oneway_chain(system, "S1", "X")
+        steps = []
+        spans = oneway_chain_spans(system, chain, "X", BW, steps)
+        got = tuple(Lnet for _, _, Lnet in spans)
+        good = (chain == ["S1", "S2"] and [owner for _, owner, _ in spans] == chain
+                and all(abs(g - e) < 1e-12 for g, e in zip(got, expected)) and len(got) == 2
+                and all(f"Lnet={e:.3f}" in line for e, line in zip(expected, steps[1:])))
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: {name}: Lnet = {', '.join(f'{v:.3f}' for v in got)}")
+    return ok
+
+
+def test_oneway_spans():
+    assert verify_oneway_spans()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_oneway_spans() else 1)
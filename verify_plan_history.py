@@ -0,0 +1,148 @@
+import sys
+import os
+from types import SimpleNamespace
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from plan_history import PlanHistory, PlanSnapshot
+from slab_model import SlabSystem
+from spatial_index import SpatialIndex
+from report_view import ReportModel
+from load_cases import SlabLoads
+from gui import App, RealSlab
+
+
+def verify_plan_history():
+    ok = True
+
+    # Ardışık düzenlemeler: yalnızca değişen döşeme yeni nesne, gerisi paylaşılır
+    slab_a, slab_b, slab_b2 = object(), object(), object()
+    s0 = PlanSnapshot({}, frozenset(), "sys0")
+    s1 = PlanSnapshot({"D1": slab_a}, frozenset(), "sys1")
+    s2 = PlanSnapshot({"D1": slab_a, "D2": slab_b}, frozenset({(0, 0, 0, 5)}), "sys2")
+    s3 = PlanSnapshot({"D1": slab_a, "D2": slab_b2}, s2.beams, "sys3")
+    hist = PlanHistory()
+    hist.reset(s0)
+    for snap in (s1, s2, s3):
+        hist.push(snap)
+
+    hist.attach_result("sys3", "res3")
+    hist.attach_result("eski", "yok")  # Güncel olmayan sistemin sonucu eklenmez
+    good = hist.current.result == "res3" and hist.current.slabs is s3.slabs
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Hesap sonucu güncel duruma ekleniyor")
+
+    u1 = hist.undo()
+    u2 = hist.undo()
+    good = (u1 is s2 and u2 is s1 and hist.can_redo()
+            and u1.slabs["D1"] is s3.slabs["D1"])
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Geri al kopyasız önceki durumu döndürüyor")
+
+    r1 = hist.redo()
+    r2 = hist.redo()
+    good = r1 is s2 and r2.result == "res3" and hist.redo() is None
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Yinele hesap sonucunu geri getiriyor")
+
+    hist.undo()
+    hist.push(PlanSnapshot({}, frozenset(), "sys4"))
+    good = not hist.can_redo() and hist.undo() is s2
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Yeni düzenleme yinele yığınını boşaltıyor")
+
+    small = PlanHistory(limit=3)
+    small.reset(s0)
+    for i in range(10):
+        small.push(PlanSnapshot({}, frozenset(), f"sys{i}"))
+    steps = 0
+    while small.undo() is not None:
+        steps += 1
+    good = steps == 3
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Geçmiş sınırı uygulanıyor ({steps} adım)")
+    return ok
+
+
+class _Var:
+    """Tk değişkeni yerine (ekransız ortam)."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def _headless_app():
+    """Tk penceresi açmadan App'in plan/hesap/geçmiş yollarını kullanan örnek."""
+    app = App.__new__(App)
+    shown = SimpleNamespace(model=ReportModel())
+    app.__dict__.update(
+        conc=_Var("C25/30"), steel=_Var("B420C"), h_mm=_Var(120.0), cover_mm=_Var(25.0), bw=_Var(0.30),
+        iterative_balance=_Var(False), plate_solver=_Var(False), live_mode=_Var(False),
+        last_design={}, last_result=None, last_distribution=None, plan_version=0, solve_worker=None,
+        _dirty=set(), _slab_sigs={}, _beam_sig=frozenset(), real_slabs={}, slab_index=SpatialIndex(),
+        beam_edges=set(), selected_edge=None, highlighted_edge=None, system=SlabSystem(6, 6),
+        history=PlanHistory(), _plan_shared=False,
+        report_view=SimpleNamespace(set_model=lambda m: setattr(shown, "model", m)),
+        refresh_slab_list=lambda: None, redraw=lambda: None,
+    )
+    app.history.reset(app._snapshot())
+    return app, shown
+
+
+def verify_gui_restore():
+    """Gerçek planla hesap, düzenleme, geri al / yinele: gösterilen tasarım ve rapor görüntüye ait."""
+    ok = True
+    app, shown = _headless_app()
+    app._begin_edit()
+    for sid, x, kind in (("S1", 0.0, "ONEWAY"), ("S2", 3.0, "ONEWAY"), ("S3", 6.0, "TWOWAY")):
+        app.real_slabs[sid] = RealSlab(sid, x, 0.0, 3.0, 6.0, kind, 10.0, 1.0)
+    app._sync_to_cell_system()
+    app.compute_now()
+    first, solved = app.last_result, app.system
+
+    def shows(result):
+        return (app.last_design is result.design and app.last_result is result
+                and shown.model.text() == ReportModel.from_result(result).text())
+
+    # Düzenleme (hesapsız, canlı hesap kapalı): yük ataması S1 ve zincirini değiştirir
+    App.set_slab_loads(app, "S1", SlabLoads(g=4.0, q=5.0))
+    edited = app.system
+    app.undo()
+    good = shows(first) and app.system is solved and app.real_slabs["S1"].loads is None
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Geri al ilk hesabın tasarım ve raporunu gösteriyor")
+
+    app.redo()
+    good = (app.system is edited and app.real_slabs["S1"].loads is not None
+            and app.last_design == {} and shown.model.text() == "" and "S1" in app._dirty)
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Sonucu olmayan duruma yinele eski tasarımı temizliyor")
+
+    app.compute_now()
+    second = app.last_result
+    good = second.design["S1"] != first.design["S1"]
+    app.undo()
+    good = good and shows(first)
+    app.redo()
+    good = good and shows(second) and second.sections["S1"] != first.sections["S1"]
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Hesaplanmış duruma yinele o hesabı geri getiriyor")
+    return ok
+
+
+def test_plan_history():
+    assert verify_plan_history()
+
+
+def test_gui_restore():
+    assert verify_gui_restore()
+
+
+if __name__ == "__main__":
+    ok = verify_plan_history()
+    ok = verify_gui_restore() and ok
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,107 @@
+import sys
+import os
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+import numpy as np
+from plate_fd_solver import solve_plate, PlateFactor, _BandedCholesky, _assemble_biharmonic
+from slab_model import Slab, SlabSystem
+from solve_runner import solve_plan, SolveParams
+from twoway_slab import _twoway_support_moment
+
+# Timoshenko & Woinowsky-Krieger, kare plak, düzgün yayılı yük, ν = 0.3
+# (katsayı × q·a², sehim katsayı × q·a⁴/D)
+REFERENCE = {
+    "basit mesnet": ((False, False, False, False), {"Mx_pos": 0.0479, "w_max": 0.00406}),
+    "ankastre": ((True, True, True, True), {"Mx_pos": 0.0231, "M_L": 0.0513, "w_max": 0.00126}),
+}
+
+TOLERANCE = 0.03  # %3
+
+
+def verify_plate_fd():
+    ok = True
+    for name, (clamped, ref) in REFERENCE.items():
+        pm = solve_plate(1.0, 1.0, clamped, [1.0], nu=0.3)[0]
+        print(f"--- Kare plak ({name}) ---")
+        for key, expected in ref.items():
+            got = getattr(pm, key)
+            err = abs(got - expected) / expected
+            status = "PASS" if err <= TOLERANCE else "FAIL"
+            ok = ok and err <= TOLERANCE
+            print(f"  {status}: {key} = {got:.5f} (Timoshenko {expected:.5f}, hata %{100 * err:.1f})")
+
+    # Aynı ayrıştırma ile çok yük durumu: momentler yükle doğrusal olmalı
+    pm1, pm2 = solve_plate(4.0, 5.0, (True, False, True, False), [10.0, 20.0])
+    if abs(pm2.Mx_pos - 2 * pm1.Mx_pos) < 1e-9 and abs(pm2.M_L - 2 * pm1.M_L) < 1e-9:
+        print("PASS: Yük durumları doğrusal ölçekleniyor")
+    else:
+        print("FAIL: Yük durumları doğrusal değil")
+        ok = False
+    return ok
+
+
+def verify_banded_solver():
+    """SciPy'siz çözüm: bant Cholesky yoğun çözümle aynı (ny > nx yeniden sıralama dahil)."""
+    ok = True
+    for nx, ny, clamped in ((8, 5, (False, False, False, False)), (20, 25, (True, False, True, True))):
+        hx, hy = 4.0 / nx, 5.0 / ny
+        rows, cols, vals = _assemble_biharmonic(nx, ny, hx, hy, clamped)
+        n = (nx - 1) * (ny - 1)
+        A = np.zeros((n, n))
+        np.add.at(A, (rows, cols), vals)
+        Q = np.random.default_rng(0).random((n, 3))
+        ref = np.linalg.solve(A, Q)
+        band = _BandedCholesky(rows, cols, vals, n)
+        fac = PlateFactor(nx, ny, hx, hy, clamped)
+        scale = np.abs(ref).max()
+        good = (np.abs(band.solve(Q) - ref).max() < 1e-9 * scale
+                and np.abs(band.solve(Q[:, 0]) - ref[:, 0]).max() < 1e-9 * scale
+                and np.abs(fac.solve(Q) - ref).max() < 1e-9 * scale)
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: {nx}×{ny} ağ: bant Cholesky (p = {band.p}) yoğun çözümle aynı")
+    return ok
+
+
+def verify_fd_support_moment():
+    """Plak çözücü açıkken komşu mesnet momenti de FD çözümünden gelir."""
+    ok = True
+    system = SlabSystem(4, 4)
+    system.add_slab(Slab("S1", 0, 0, 0, 0, "TWOWAY", dx=4.0, dy=5.0, pd=10.0, b=1.0))
+    system.add_slab(Slab("S2", 1, 0, 1, 0, "TWOWAY", dx=4.0, dy=5.0, pd=10.0, b=1.0))
+    system.add_slab(Slab("B1", 0, 1, 0, 1, "BALCONY", dx=4.0, dy=1.5, pd=10.0, b=1.0))
+
+    fd, _ = system.compute_twoway_per_slab_fd("S1", 0.30)
+    coef = _twoway_support_moment(system, "S1", "B", 0.30)
+    got = _twoway_support_moment(system, "S1", "B", 0.30, plate_solver=True)
+    good = got == abs(fd.My[0]) and abs(got - coef) > 1e-3
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: S1 alt kenar mesnet momenti: FD {got:.3f} (katsayı {coef:.3f})")
+
+    for plate_solver, expected in ((False, coef), (True, got)):
+        result = solve_plan(system, SolveParams("C25/30", "B420C", 120.0, 25.0, 0.30, plate_solver=plate_solver))
+        good = f"Neighbor S1 M={expected:.3f}" in result.sections["B1"]
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: Balkon komşu momenti ({'FD' if plate_solver else 'katsayı'}) "
+              f"= {expected:.3f}")
+    return ok
+
+
+def test_plate_fd():
+    assert verify_plate_fd()
+
+
+def test_banded_solver():
+    assert verify_banded_solver()
+
+
+def test_fd_support_moment():
+    assert verify_fd_support_moment()
+
+
+if __name__ == "__main__":
+    ok = verify_plate_fd()
+    ok = verify_banded_solver() and ok
+    ok = verify_fd_support_moment() and ok
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,50 @@
+import sys
+import os
+import random
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from report_view import ReportModel
+
+
+def verify_report_view():
+    ok = True
+    rnd = random.Random(3)
+    header = "Hesap Raporu\nBeton: C25/30\n\n"
+    sections = {}
+    for i in range(200):
+        kind = rnd.choice(("ONEWAY", "TWOWAY", "BALCONY"))
+        body = "".join(f"satır {k}\n" for k in range(rnd.randint(1, 40)))
+        sections[f"D{i}"] = f"--- D{i} ({kind}) ---\n{body}\n"
+    model = ReportModel(header, sections)
+
+    # Pencere satırları tam metnin dilimleriyle aynı olmalı
+    full = model.text().split("\n")[:-1]
+    layout = model.layout()
+    good = layout.total_lines == len(full) and all(
+        layout.lines(s, c) == full[s:s + c]
+        for s, c in ((rnd.randint(0, len(full)), rnd.randint(0, 60)) for _ in range(500)))
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Görünür pencere satırları ({len(full)} satır)")
+
+    # Atlama: bölümün ilk satırı başlık satırıdır
+    line = layout.line_of("D57")
+    good = line is not None and full[line] == sections["D57"].split("\n")[0]
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Döşemeye atlama")
+
+    # Filtre: tipe ve ID'ye göre
+    balconies = [sid for sid in model.order if "(BALCONY)" in sections[sid]]
+    good = model.matching("balcony") == balconies and model.matching("D19") == [sid for sid in model.order if sid.startswith("D19")]
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Filtre ({len(balconies)} balkon)")
+    return ok
+
+
+def test_report_view():
+    assert verify_report_view()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_report_view() else 1)
@@ -0,0 +1,34 @@
+import sys
+import os
+import queue
+from types import SimpleNamespace
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from gui import App
+
+
+def verify_solve_error():
+    ok = True
+
+    # Hata veren hesabın düzenlenmiş döşemeleri kaybolmaz
+    worker = SimpleNamespace(queue=queue.Queue(), dirty={"S1", "S2"}, version=3)
+    worker.queue.put(("error", "boom"))
+    progress = []
+    app = SimpleNamespace(solve_worker=worker, plan_version=3, _dirty={"S3"},
+                          _set_progress=lambda *a: progress.append(a),
+                          after=lambda *a: None)
+    App._poll_solve(app, worker)
+    good = app.solve_worker is None and app._dirty == {"S1", "S2", "S3"} and progress
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Hata sonrası kirli döşemeler korunuyor ({sorted(app._dirty)})")
+    return ok
+
+
+def test_solve_error():
+    assert verify_solve_error()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_solve_error() else 1)
@@ -0,0 +1,116 @@
+import sys
+import os
+import random
+import time
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from spatial_index import SpatialIndex, rect_edges, point_segment_distance
+
+
+def _linear_nearest_edge(rects, x, y, radius):
+    """GUI'deki eski doğrusal tarama (karşılaştırma için)."""
+    best_dist, best = radius, None
+    for key, rect in rects.items():
+        for edge_name, seg in rect_edges(rect).items():
+            dist = point_segment_distance(x, y, *seg)
+            if dist < best_dist:
+                best_dist, best = dist, (key, edge_name)
+    return best
+
+
+def _grid_plan(n):
+    """n × n döşemeli, farklı açıklıklı ızgara plan."""
+    rnd = random.Random(1)
+    xs = [0.0]
+    ys = [0.0]
+    for _ in range(n):
+        xs.append(xs[-1] + rnd.choice((3.0, 4.0, 4.5, 5.0, 6.0)))
+        ys.append(ys[-1] + rnd.choice((3.0, 4.0, 4.5, 5.0, 6.0)))
+    return {f"D{i}_{j}": (xs[i], ys[j], xs[i + 1] - xs[i], ys[j + 1] - ys[j])
+            for j in range(n) for i in range(n)}
+
+
+def verify_spatial_index():
+    ok = True
+    rnd = random.Random(7)
+
+    # Doğrusal tarama ile aynı sonuç (eşitlikte ilk eklenen)
+    rects = _grid_plan(12)
+    idx = SpatialIndex()
+    for key, rect in rects.items():
+        idx.insert(key, rect)
+    X, Y = rects["D11_11"][0] + 6.0, rects["D11_11"][1] + 6.0
+    mismatches = 0
+    for _ in range(3000):
+        x, y = rnd.uniform(-1.0, X), rnd.uniform(-1.0, Y)
+        r = rnd.choice((0.05, 0.2, 1.0, 3.0))
+        if idx.nearest_edge(x, y, r) != _linear_nearest_edge(rects, x, y, r):
+            mismatches += 1
+    good = mismatches == 0
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: nearest_edge doğrusal tarama ile aynı ({mismatches} fark)")
+
+    # Artımlı güncelleme: taşı, sil, geri ekle
+    idx.insert("D0_0", (100.0, 100.0, 4.0, 4.0))
+    idx.remove("D1_0")
+    good = (idx.item_at(1.0, 1.0) is None and idx.item_at(101.0, 101.0) == "D0_0"
+            and "D1_0" not in idx and len(idx) == len(rects) - 1)
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Taşıma/silme sonrası sorgular")
+
+    # Çakışma: kenar teması çakışma değildir; toplu eklemede hata varsa hiçbiri eklenmez
+    idx = SpatialIndex()
+    conflicts = idx.bulk_insert(rects.items())
+    before = len(idx)
+    bad = idx.bulk_insert([("N1", (200.0, 0.0, 4.0, 4.0)), ("N2", (203.0, 1.0, 4.0, 4.0))])
+    good = (not conflicts and bad == [("N2", "N1")] and len(idx) == before
+            and idx.overlapping((rects["D0_0"][0] + rects["D0_0"][2], 0.0, 1.0, 1.0)) == ["D1_0"]
+            and idx.overlapping((-1.0, 0.0, 1.0, 1.0)) == [])
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Çakışma kontrolü ve toplu ekleme")
+
+    # Uzaklaştırılmış görünüm (MIN_SCALE = 0.5 px/m, 1200 × 800 px): pencere
+    # ~1M boş hücre kaplar; sonuç doğrusal taramayla aynı ve süre dolu hücrelerle sınırlı
+    rects = _grid_plan(20)
+    idx = SpatialIndex()
+    for key, rect in rects.items():
+        idx.insert(key, rect)
+    windows = [(-1200.0, -800.0, 1200.0, 800.0), (50.0, -800.0, 2450.0, 800.0),
+               (10.0, 10.0, 30.0, 20.0), (-5.0, -5.0, -1.0, -1.0)]
+    good = all(idx.query_rect(*w) == [k for k, (x, y, rw, rh) in rects.items()
+                                      if x <= w[2] and w[0] <= x + rw and y <= w[3] and w[1] <= y + rh]
+               for w in windows)
+    t0 = time.perf_counter()
+    for _ in range(20):
+        idx.query_rect(-1200.0, -800.0, 1200.0, 800.0)
+    per_ms = (time.perf_counter() - t0) * 1000.0 / 20
+    good = good and per_ms < 5.0
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: Uzak görünüm penceresi (400 döşeme) {per_ms:.2f} ms/sorgu (< 5 ms)")
+
+    # 10.000 döşemeli planda sorgu süresi
+    big = _grid_plan(100)
+    idx = SpatialIndex()
+    for key, rect in big.items():
+        idx.insert(key, rect)
+    X, Y = big["D99_99"][0], big["D99_99"][1]
+    pts = [(rnd.uniform(0.0, X), rnd.uniform(0.0, Y)) for _ in range(2000)]
+    t0 = time.perf_counter()
+    for x, y in pts:
+        idx.nearest_edge(x, y, 0.5)
+        idx.item_at(x, y)
+    per_ms = (time.perf_counter() - t0) * 1000.0 / len(pts)
+    good = per_ms < 1.0
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: 10.000 döşemede isabet testi {per_ms:.3f} ms/sorgu (< 1 ms)")
+    return ok
+
+
+def test_spatial_index():
+    assert verify_spatial_index()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_spatial_index() else 1)
@@ -0,0 +1,67 @@
+import sys
+import os
+import subprocess
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+# Açılış bütçeleri (ms, -X importtime kümülatif süre, 3 ölçümün ortancası)
+GUI_IMPORT_BUDGET_MS = 200.0       # import gui (pencere açılmadan önceki yükleme)
+HEADLESS_IMPORT_BUDGET_MS = 300.0  # import slab_model, solve_runner (Tk'sız hesap)
+RUNS = 3
+
+
+def import_profile(stmt: str):
+    """
+    python -X importtime ile stmt'yi ayrı süreçte çalıştırır.
+
+    Returns:
+        {modül adı: kümülatif süre (ms)}
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", stmt],
+                          capture_output=True, text=True, cwd=os.getcwd(), check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cum_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cum_us) / 1000.0
+    return times
+
+
+def measure(stmt: str, top_modules):
+    """Ortanca toplam süre ve son ölçümde yüklenen modüller."""
+    totals = []
+    profile = {}
+    for _ in range(RUNS):
+        profile = import_profile(stmt)
+        totals.append(sum(profile.get(m, 0.0) for m in top_modules))
+    return sorted(totals)[len(totals) // 2], profile
+
+
+def verify_startup_time():
+    ok = True
+    cases = [
+        ("GUI", "import gui", ["gui"], GUI_IMPORT_BUDGET_MS, ("ezdxf", "numpy", "dxf_out", "solve_runner")),
+        ("Headless", "import slab_model, solve_runner", ["slab_model", "solve_runner"],
+         HEADLESS_IMPORT_BUDGET_MS, ("ezdxf", "dxf_out", "tkinter")),
+    ]
+    for name, stmt, tops, budget, forbidden in cases:
+        total, profile = measure(stmt, tops)
+        loaded = [m for m in forbidden if m in profile]
+        good = not loaded
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: {name}: ertelenen modüller yüklenmedi"
+              + (f" (yüklenen: {', '.join(loaded)})" if loaded else ""))
+        good = total <= budget
+        ok = ok and good
+        print(f"{'PASS' if good else 'FAIL'}: {name}: {total:.1f} ms (bütçe {budget:.0f} ms)")
+    return ok
+
+
+def test_startup_time():
+    assert verify_startup_time()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_startup_time() else 1)
@@ -0,0 +1,115 @@
+import sys
+import os
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from slab_model import Slab, SlabSystem
+from moment_balance_slab import (balance_support_edges, balance_support_moments, build_support_edges,
+                                 calculate_stiffness_ratio, get_moment_for_edge, get_neighbor_on_edge,
+                                 get_opposite_edge, get_oneway_support_moment)
+from verify_fixtures import mixed_plan, balance_inputs
+
+BW = 0.30
+
+
+def _baseline_edges(system, raw):
+    """Kenar kenar skaler TS500 dengelemesi (vektörel sürümden önceki yol): {(sid, kenar): M_tasarım}."""
+    out = {}
+    for sid, res in raw.items():
+        if system.slabs[sid].kind != "TWOWAY":
+            continue
+        for edge in ("L", "R", "T", "B"):
+            nb, nb_kind = get_neighbor_on_edge(system, sid, edge)
+            opp = get_opposite_edge(edge)
+            if nb is None or (nb, opp) in out:
+                continue
+            M1 = abs(get_moment_for_edge(res, edge))
+            if nb_kind == "TWOWAY":
+                M2 = abs(get_moment_for_edge(raw[nb], opp))
+                L2 = raw[nb].Lx_net if edge in ("L", "R") else raw[nb].Ly_net
+            elif nb_kind == "ONEWAY":
+                M2 = abs(get_oneway_support_moment(system, nb, BW))
+                L2 = min(system.slabs[nb].size_m_gross())
+            else:
+                continue
+            L1 = res.Lx_net if edge in ("L", "R") else res.Ly_net
+            M_max, M_min = max(M1, M2), min(M1, M2)
+            if M_min < 0.8 * M_max:
+                DF1, DF2 = calculate_stiffness_ratio(L1, L2)
+                d = (2.0 / 3.0) * (M_max - M_min)
+                M1, M2 = (M1 - d * DF1, M2 + d * DF2) if M1 > M2 else (M1 + d * DF1, M2 - d * DF2)
+                M_max = max(M1, M2)
+            out[(sid, edge)] = out[(nb, opp)] = M_max
+    return out
+
+
+def verify_mixed_plan():
+    """Karışık planda vektörel dengeleme kenar kenar skaler hesapla aynı."""
+    ok = True
+    system, _, _ = mixed_plan()
+    raw = balance_inputs(system, BW)
+    ref = _baseline_edges(system, raw)
+
+    edges = build_support_edges(system, raw, BW)
+    M1_new, M2_new, M_design, redistribute = balance_support_edges(edges)
+    got = {}
+    for k, e in enumerate(edges):
+        got[(e.sid1, e.edge1)] = got[(e.sid2, e.edge2)] = float(M_design[k])
+    diff = max(abs(got[k] - v) for k, v in ref.items()) if got.keys() == ref.keys() else float("inf")
+    good = diff < 1e-12 and redistribute.any() and not redistribute.all()
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: {len(edges)} kenar skaler TS500 hesabıyla aynı "
+          f"(fark {diff:.1e}, {int(redistribute.sum())} kenarda dağıtım)")
+
+    # Doğrultu momenti o doğrultudaki dengelenmiş kenarların en büyüğü
+    balanced, _ = balance_support_moments(system, raw, BW)
+    good = True
+    for sid, res in raw.items():
+        if system.slabs[sid].kind != "TWOWAY":
+            good = good and balanced[sid] is res
+            continue
+        for axis, pair, (neg, pos) in (("x", ("L", "R"), res.Mx), ("y", ("T", "B"), res.My)):
+            vals = [ref[(sid, e)] for e in pair if (sid, e) in ref]
+            expected = -max(vals) if vals else neg
+            got_neg, got_pos = balanced[sid].Mx if axis == "x" else balanced[sid].My
+            good = good and got_neg == expected and got_pos == pos
+    ok = ok and good
+    s2 = balanced["S2"].Mx[0]
+    print(f"{'PASS' if good else 'FAIL'}: Doğrultu momentleri en büyük dengelenmiş kenardan "
+          f"(S2 Mx_neg = {s2:.3f}; L {-ref[('S2', 'L')]:.3f}, R {-ref[('S2', 'R')]:.3f})")
+    return ok
+
+
+def verify_multi_neighbor():
+    """Bir kenarda iki komşu: her çift ayrı dengelenir, kenarda büyük olan kalır."""
+    ok = True
+    system = SlabSystem(3, 3)
+    system.add_slab(Slab("W", 0, 0, 1, 0, "TWOWAY", dx=8.0, dy=5.0, pd=10.0, b=1.0))
+    system.add_slab(Slab("A", 0, 1, 0, 1, "TWOWAY", dx=3.0, dy=5.0, pd=10.0, b=1.0))
+    system.add_slab(Slab("C", 1, 1, 1, 1, "TWOWAY", dx=5.0, dy=5.0, pd=10.0, b=1.0))
+    raw = balance_inputs(system, BW)
+    edges = build_support_edges(system, raw, BW)
+    _, _, M_design, _ = balance_support_edges(edges)
+    on_w = {(e.sid2 if e.sid1 == "W" else e.sid1): float(M_design[k])
+            for k, e in enumerate(edges) if "W" in (e.sid1, e.sid2)}
+    balanced, _ = balance_support_moments(system, raw, BW)
+    good = on_w.keys() == {"A", "C"} and -balanced["W"].My[0] == max(on_w.values())
+    ok = ok and good
+    print(f"{'PASS' if good else 'FAIL'}: W iki komşuyla ayrı dengelendi "
+          f"(A {on_w.get('A', 0):.3f}, C {on_w.get('C', 0):.3f}; My_neg = {balanced['W'].My[0]:.3f})")
+    return ok
+
+
+def test_mixed_plan():
+    assert verify_mixed_plan()
+
+
+def test_multi_neighbor():
+    assert verify_multi_neighbor()
+
+
+if __name__ == "__main__":
+    ok = verify_mixed_plan()
+    ok = verify_multi_neighbor() and ok
+    sys.exit(0 if ok else 1)